@@ -0,0 +1,226 @@
+"""
+Admission Control Module.
+
+Every article submission scrapes a page and calls the LLM, holding a worker
+thread for seconds. Under a flood of submissions they would take every
+thread of the pool that also serves the cheap read endpoints, and latency
+would climb for everyone.
+
+An AdmissionLane caps the submissions processed at once per worker. Others
+wait in a bounded FIFO queue without holding a thread: when the queue is
+full they are rejected at once (429), and when they wait longer than the
+queue timeout they are rejected with 503. Both carry a Retry-After estimated
+from the recent service time. reserve_read_threads() sizes the thread pool
+so reads always have READ_THREADS threads besides the capped lane.
+
+Admitted submissions run on their own threads, whose OS scheduling priority
+is lowered by INGEST_NICENESS, so read threads get the CPU first while both
+are runnable.
+"""
+
+import asyncio
+import contextvars
+import functools
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Optional, TypeVar
+
+import anyio.to_thread
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_SHED,
+    ADMISSION_WAIT,
+)
+from backend.app.exceptions.summarizer_exceptions import OverloadedException
+
+# Weight of the latest request in the service time average
+SERVICE_TIME_WEIGHT = 0.2
+MAX_RETRY_AFTER = 60
+
+T = TypeVar("T")
+
+
+class AdmissionLane:
+    """A capped number of slots with a bounded queue of waiting requests."""
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        """
+        Initialize the lane.
+
+        Args:
+            name (str): Lane name, used in metrics and messages
+            max_in_flight (int): Requests holding a slot at once; 0 admits all
+            max_queue (int): Requests waiting for a slot at once
+            queue_timeout (float): Seconds a request waits before it is shed
+        """
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.service_time = 1.0
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+        self._queue_depth = ADMISSION_QUEUE_DEPTH.labels(lane=name)
+        self._in_flight_gauge = ADMISSION_IN_FLIGHT.labels(lane=name)
+        self._wait = ADMISSION_WAIT.labels(lane=name)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until the queue has likely drained by one more request."""
+        waiting = len(self._waiters) + 1
+        estimate = self.service_time * waiting / max(self.max_in_flight, 1)
+        return min(MAX_RETRY_AFTER, max(1, math.ceil(estimate)))
+
+    async def acquire(self):
+        """
+        Wait for a slot.
+
+        Raises:
+            OverloadedException: If the queue is full or the wait timed out
+        """
+        if self.max_in_flight <= 0:
+            return
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._waiters:
+                self._in_flight += 1
+                self._update_gauges()
+                self._wait.observe(0.0)
+                return
+            if len(self._waiters) >= self.max_queue:
+                raise self._shed("queue_full")
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self._update_gauges()
+
+        began = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    self._update_gauges()
+                    raise self._shed("timeout")
+            # Granted a slot just as the deadline passed; keep it
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+                    self._update_gauges()
+            if not queued:
+                self.release()
+            raise
+        self._wait.observe(time.monotonic() - began)
+
+    def release(self, service_time: Optional[float] = None):
+        """
+        Free a slot, handing it to the longest waiting request if any.
+
+        Args:
+            service_time (float): Seconds the request held its slot, used
+                to estimate Retry-After
+        """
+        if self.max_in_flight <= 0:
+            return
+        with self._lock:
+            if service_time is not None:
+                self.service_time += SERVICE_TIME_WEIGHT * (
+                    service_time - self.service_time
+                )
+            if self._waiters:
+                # The slot passes to the waiter; a waiter that was cancelled
+                # meanwhile releases it again when it finds it was granted
+                waiter = self._waiters.popleft()
+                waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+            else:
+                self._in_flight -= 1
+            self._update_gauges()
+
+    @staticmethod
+    def _wake(waiter: asyncio.Future):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def _shed(self, reason: str) -> OverloadedException:
+        ADMISSION_SHED.labels(lane=self.name, reason=reason).inc()
+        return OverloadedException(self.name, reason, self.retry_after())
+
+    def _update_gauges(self):
+        self._queue_depth.set(len(self._waiters))
+        self._in_flight_gauge.set(self._in_flight)
+
+
+def reserve_read_threads(lane: AdmissionLane, read_threads: int):
+    """
+    Grow the thread pool running sync endpoints so that read_threads threads
+    stay free while the lane's slots are all busy. Call from the event loop.
+    """
+    if lane.max_in_flight <= 0:
+        return
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, lane.max_in_flight + read_threads)
+
+
+def lower_thread_priority(niceness: int = settings.INGEST_NICENESS):
+    """
+    Lower the scheduling priority of the calling thread alone. Only Linux
+    applies priorities per thread; elsewhere this does nothing.
+    """
+    if niceness <= 0 or not sys.platform.startswith("linux"):
+        return
+    thread = threading.get_native_id()
+    current = os.getpriority(os.PRIO_PROCESS, thread)
+    os.setpriority(os.PRIO_PROCESS, thread, min(19, current + niceness))
+
+
+async def run_ingestion(fn: Callable[..., T], *args) -> T:
+    """
+    Run blocking ingestion work on the low priority ingestion threads, or on
+    the shared thread pool when admission control is disabled.
+    """
+    if _ingest_executor is None:
+        return await anyio.to_thread.run_sync(fn, *args)
+    call = functools.partial(contextvars.copy_context().run, fn, *args)
+    return await asyncio.get_running_loop().run_in_executor(_ingest_executor, call)
+
+
+ingest_lane = AdmissionLane(
+    "ingest",
+    max_in_flight=settings.INGEST_MAX_IN_FLIGHT,
+    max_queue=settings.INGEST_MAX_QUEUE,
+    queue_timeout=settings.INGEST_QUEUE_TIMEOUT,
+)
+
+# One thread per ingestion slot; threads start on first use
+_ingest_executor = (
+    ThreadPoolExecutor(
+        ingest_lane.max_in_flight,
+        thread_name_prefix="ingest",
+        initializer=lower_thread_priority,
+    )
+    if ingest_lane.max_in_flight > 0
+    else None
+)
@@ -20,6 +20,21 @@ class Settings(BaseSettings):
         "",
         description="Test database connection string",
     )
+    RUN_MIGRATIONS: bool = Field(
+        True, description="Apply pending schema migrations on application startup"
+    )
+    DATABASE_REPLICA_URLS: str = Field(
+        "",
+        description="Comma-separated read replica connection strings; empty reads from the main database",
+    )
+    REPLICA_RETRY_INTERVAL: float = Field(
+        5.0,
+        description="Seconds an unreachable replica is skipped before it is probed again",
+    )
+    READ_YOUR_WRITES_SECONDS: int = Field(
+        5,
+        description="Seconds a client reads from the main database after creating an article; 0 disables",
+    )
 
     # Azure OpenAI settings
     AZURE_OPENAI_API_KEY: str = Field("", description="Azure OpenAI API key")
@@ -28,6 +43,9 @@ class Settings(BaseSettings):
     AZURE_OPENAI_API_VERSION: str = Field(
         "2024-08-01-preview", description="API version for Azure OpenAI"
     )
+    AZURE_OPENAI_EMBEDDING_MODEL: str = Field(
+        "text-embedding-3-small", description="Embeddings model deployment name"
+    )
 
     # Application settings
     SUMMARY_LENGTH: int = Field(150, description="Desired summary length in words")
@@ -37,23 +55,220 @@ class Settings(BaseSettings):
     )
     APP_VERSION: str = Field("0.1.0", description="Application version")
     APP_PREFIX: str = Field("/api/v1", description="API route prefix")
+    ADMIN_TOKEN: str = Field(
+        "", description="Token for admin endpoints (X-Admin-Token); empty disables them"
+    )
+
+    # Article partitioning settings
+    ARTICLE_PARTITION_MONTHS_AHEAD: int = Field(
+        3, description="Monthly article partitions created ahead of time"
+    )
+    ARTICLE_RETENTION_MONTHS: int = Field(
+        0,
+        description="Full months of articles kept before the current one; older partitions are dropped (0 keeps everything)",
+    )
+    PARTITION_MAINTENANCE_INTERVAL: float = Field(
+        86400.0, description="Seconds between partition maintenance runs; 0 disables"
+    )
+
+    # Article read cache settings
+    ARTICLE_CACHE_SIZE: int = Field(
+        1024, description="Articles kept in each worker's read cache; 0 disables it"
+    )
+    ARTICLE_CACHE_TTL: float = Field(
+        60.0, description="Seconds a cached article is served before it is reloaded"
+    )
+    ARTICLE_CACHE_MAX_AGE: int = Field(
+        60, description="Cache-Control max-age of article responses, in seconds"
+    )
+    FAST_JSON: bool = Field(
+        False,
+        description="Serve article lists from cached orjson-encoded fragments",
+    )
+    ARTICLE_FRAGMENT_CACHE_SIZE: int = Field(
+        100000, description="Encoded articles kept in each worker for list responses"
+    )
+
+    # Admission control settings
+    INGEST_MAX_IN_FLIGHT: int = Field(
+        8,
+        description="Article submissions processed at once per worker; 0 disables admission control",
+    )
+    INGEST_MAX_QUEUE: int = Field(
+        32, description="Submissions waiting for a slot before new ones get 429"
+    )
+    INGEST_QUEUE_TIMEOUT: float = Field(
+        10.0, description="Seconds a submission waits for a slot before it gets 503"
+    )
+    READ_THREADS: int = Field(
+        32,
+        description="Worker threads kept for other requests on top of INGEST_MAX_IN_FLIGHT",
+    )
+    DB_READ_CONNECTIONS: int = Field(
+        10,
+        description="Database pool connections kept for other requests on top of INGEST_MAX_IN_FLIGHT",
+    )
+    INGEST_PARSE_PROCESSES: int = Field(
+        0,
+        description="Processes parsing scraped pages per worker; 0 uses one less than the CPU count, at least 1",
+    )
+    INGEST_NICENESS: int = Field(
+        10,
+        description="Niceness added to ingestion threads and parse processes so reads get the CPU first",
+    )
+
+    # Logging settings
+    LOG_LEVEL: str = Field("INFO", description="Level of the 'summarizer' logger")
+    LOG_LEVELS: str = Field(
+        "",
+        description="Per-module levels, e.g. 'summarizer.db=WARNING,summarizer.scrape=DEBUG'",
+    )
+    LOG_QUEUE_SIZE: int = Field(
+        10000, description="Log records buffered before new records are dropped"
+    )
+    LOG_REQUESTS: bool = Field(
+        True, description="Emit one structured JSON record per HTTP request"
+    )
+
+    # Scraper politeness settings
+    SCRAPE_USER_AGENT: str = Field(
+        "PersonalizedNewsSummarizer/0.1", description="User-Agent sent when scraping"
+    )
+    SCRAPE_TIMEOUT: float = Field(10.0, description="Scrape request timeout in seconds")
+    SCRAPE_MAX_CONNECTIONS: int = Field(
+        16, description="Global cap on concurrent scrape connections"
+    )
+    SCRAPE_PER_HOST_CONCURRENCY: int = Field(
+        2, description="Maximum concurrent scrape connections per host"
+    )
+    SCRAPE_MIN_HOST_DELAY: float = Field(
+        1.0, description="Minimum seconds between request starts to the same host"
+    )
+    SCRAPE_MAX_HOST_DELAY: float = Field(
+        60.0, description="Upper bound for crawl-delay and back-off delays"
+    )
+    SCRAPE_QUEUE_TIMEOUT: float = Field(
+        30.0, description="Seconds a scrape may wait for a free slot"
+    )
+    SCRAPE_BLOCK_COOLDOWN: float = Field(
+        60.0, description="Seconds to stop scraping a host after it throttles us"
+    )
+    SCRAPE_ROBOTS_TTL: float = Field(
+        3600.0, description="Seconds to cache robots.txt crawl-delay (0 disables)"
+    )
+
+    # Feed polling settings
+    FEED_POLL_INTERVAL: float = Field(
+        900.0, description="Seconds between feed polling rounds (0 disables)"
+    )
+    FEED_MAX_ITEMS_PER_POLL: int = Field(
+        100, description="Maximum new items taken from one feed per poll"
+    )
+    FEED_INGEST_WORKERS: int = Field(
+        2, description="Worker threads summarizing newly discovered feed items"
+    )
+    FEED_INGEST_QUEUE_SIZE: int = Field(
+        1000, description="Maximum feed items waiting to be summarized"
+    )
+
+    # Personalized feed settings
+    USER_FEED_MAX_ITEMS: int = Field(
+        500, description="Articles kept in each user's precomputed feed"
+    )
+    USER_FEED_HALF_LIFE: float = Field(
+        21600.0,
+        description="Seconds of recency worth doubling an article's relevance",
+    )
+    USER_FEED_BACKFILL_ARTICLES: int = Field(
+        2000, description="Recent articles ranked when a profile is created or changed"
+    )
+    USER_FEED_RANK_BATCH: int = Field(
+        100, description="New articles fanned out to user feeds per transaction"
+    )
+
+    # Embedding and similar-article settings
+    EMBEDDING_BACKEND: str = Field(
+        "hashing",
+        description="'hashing' for local feature-hashed vectors, 'azure' for the embeddings model",
+    )
+    EMBEDDING_DIM: int = Field(256, description="Dimensions of article vectors")
+    EMBEDDING_MAX_WORDS: int = Field(
+        512, description="Words of title and content embedded per article"
+    )
+    EMBEDDING_INDEX_DIR: str = Field(
+        "",
+        description="Directory for nearest-neighbor index snapshots (empty disables)",
+    )
+    EMBEDDING_SNAPSHOT_EVERY: int = Field(
+        1000, description="New vectors added between index snapshots"
+    )
+    EMBEDDING_IVF_MIN_VECTORS: int = Field(
+        4096, description="Vectors below which similar-article search is exact"
+    )
+    EMBEDDING_IVF_PROBES: int = Field(
+        8, description="Clusters scanned per approximate search"
+    )
+
+    # Story clustering settings
+    STORY_WINDOW: float = Field(
+        172800.0,
+        description="Seconds after its latest article that a story still takes new articles",
+    )
+    STORY_SIMILARITY: float = Field(
+        0.35,
+        description="Minimum cosine similarity between an article and a story's centroid to join it; tune per EMBEDDING_BACKEND",
+    )
+    STORY_RESUMMARIZE_GROWTH: float = Field(
+        0.5,
+        description="Growth in articles since the last story summary that triggers a new one",
+    )
+    STORY_SUMMARY_MAX_ARTICLES: int = Field(
+        8, description="Most recent article summaries combined into a story summary"
+    )
+    STORY_CLUSTER_BATCH: int = Field(
+        50, description="New articles clustered per transaction"
+    )
+    STORY_RESCAN_INTERVAL: float = Field(
+        300.0,
+        description="Seconds between checks for articles of the last STORY_WINDOW left without a story",
+    )
+
+    # LLM micro-batching settings
+    LLM_BATCH_SIZE: int = Field(
+        4, description="Maximum short articles summarized in one LLM call (1 disables)"
+    )
+    LLM_BATCH_MAX_WAIT: float = Field(
+        0.05, description="Seconds a short article waits for others to join its batch"
+    )
+    LLM_BATCH_MAX_WORDS: int = Field(
+        400, description="Articles up to this many words are batched"
+    )
+
+    # Re-summarization settings
+    RESUMMARIZE_BATCH_SIZE: int = Field(
+        50, description="Articles re-summarized per batch and checkpoint"
+    )
+    RESUMMARIZE_CONCURRENCY: int = Field(
+        4, description="Concurrent LLM calls made by the re-summarization job"
+    )
 
     model_config = ConfigDict(
         env_file=ENV_FILE, env_file_encoding="utf-8", extra="ignore"
     )
 
-    def __init__(self, **kwargs):
-        if not ENV_FILE.exists():
-            print(f"Warning: .env file not found at {ENV_FILE}")
-            print("Please create .env file from .env.example")
-        super().__init__(**kwargs)
-
     @field_validator("DATABASE_URL", "TEST_DATABASE_URL")
     def validate_db_url(cls, v: str) -> str:
         if not v.startswith("postgresql://"):
             raise ValueError("Database URL must be a PostgreSQL connection string")
         return v
 
+    @field_validator("DATABASE_REPLICA_URLS")
+    def validate_replica_urls(cls, v: str) -> str:
+        for url in filter(None, (part.strip() for part in v.split(","))):
+            if not url.startswith("postgresql://"):
+                raise ValueError("Replica URLs must be PostgreSQL connection strings")
+        return v
+
     @field_validator("AZURE_OPENAI_ENDPOINT")
     def validate_endpoint(cls, v: str) -> str:
         if v and not v.startswith(("http://", "https://")):
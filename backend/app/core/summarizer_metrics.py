@@ -0,0 +1,252 @@
+"""
+Prometheus Metrics Module.
+
+This module defines the service's Prometheus metrics and the low-overhead hooks
+that feed them: pipeline stage durations arrive through the stage observer,
+request latency and in-flight counts through the request middleware, and DB
+query latency through SQLAlchemy cursor events.
+
+Multiprocess mode: when PROMETHEUS_MULTIPROC_DIR is set before the workers
+start, each worker writes its samples to that directory and /metrics
+aggregates them. With gunicorn, clear the directory before starting and call
+mark_worker_dead(worker.pid) from the child_exit server hook.
+"""
+
+import inspect
+import os
+import time
+import weakref
+from typing import Dict, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+
+from backend.app.core.summarizer_timing import add_stage_observer
+from backend.app.exceptions import summarizer_exceptions
+
+# Latency buckets spanning fast DB reads to slow scrapes and LLM calls
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+REQUEST_LATENCY = Histogram(
+    "summarizer_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "summarizer_requests_in_flight",
+    "HTTP requests currently being handled",
+    multiprocess_mode="livesum",
+)
+STAGE_LATENCY = Histogram(
+    "summarizer_stage_duration_seconds",
+    "Pipeline stage latency (scrape_wait, scrape_download, scrape_parse, "
+    "llm_call, dedup_query, db_commit, ...)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_TOKENS = Histogram(
+    "summarizer_llm_tokens",
+    "Tokens used per LLM call",
+    ["kind"],
+    buckets=TOKEN_BUCKETS,
+)
+LLM_BATCH_SIZE = Histogram(
+    "summarizer_llm_batch_size",
+    "Articles summarized per batched LLM call",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+LLM_BATCH_FALLBACKS = Counter(
+    "summarizer_llm_batch_fallbacks_total",
+    "Batched LLM calls that failed and were retried as single calls",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "summarizer_admission_queue_depth",
+    "Requests waiting for an admission slot, by lane",
+    ["lane"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "summarizer_admission_in_flight",
+    "Requests holding an admission slot, by lane",
+    ["lane"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_WAIT = Histogram(
+    "summarizer_admission_wait_seconds",
+    "Time admitted requests waited for a slot, by lane",
+    ["lane"],
+    buckets=LATENCY_BUCKETS,
+)
+ADMISSION_SHED = Counter(
+    "summarizer_admission_shed_total",
+    "Requests rejected by admission control, by lane and reason "
+    "(queue_full: 429, timeout: 503)",
+    ["lane", "reason"],
+)
+DB_QUERY_LATENCY = Histogram(
+    "summarizer_db_query_duration_seconds",
+    "Database statement latency by statement type",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_READS = Counter(
+    "summarizer_db_reads_total",
+    "Read-only service calls by the database that served them",
+    ["target"],
+)
+CACHE_REQUESTS = Counter(
+    "summarizer_cache_requests_total",
+    "Cache lookups by cache and result; hit ratio = hit / (hit + miss)",
+    ["cache", "result"],
+)
+ERRORS = Counter(
+    "summarizer_errors_total",
+    "Errors surfaced by the service, by exception class",
+    ["exception"],
+)
+
+# Pre-create one series per application exception so counters start at zero
+for _name, _cls in inspect.getmembers(summarizer_exceptions, inspect.isclass):
+    if issubclass(_cls, Exception):
+        ERRORS.labels(exception=_name)
+
+# Bound label children, cached to skip the label lookup on hot paths
+_stage_children: Dict[str, Histogram] = {}
+_request_children: Dict[Tuple[str, str, int], Histogram] = {}
+_query_children: Dict[str, Histogram] = {}
+_cache_children: Dict[Tuple[str, bool], Counter] = {}
+
+_DB_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+_instrumented_engines = weakref.WeakSet()
+
+
+def observe_stage(name: str, seconds: float):
+    child = _stage_children.get(name)
+    if child is None:
+        child = _stage_children[name] = STAGE_LATENCY.labels(stage=name)
+    child.observe(seconds)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float):
+    key = (method, route, status)
+    child = _request_children.get(key)
+    if child is None:
+        child = _request_children[key] = REQUEST_LATENCY.labels(
+            method=method, route=route, status=str(status)
+        )
+    child.observe(seconds)
+
+
+def record_cache(cache: str, hit: bool):
+    key = (cache, hit)
+    child = _cache_children.get(key)
+    if child is None:
+        child = _cache_children[key] = CACHE_REQUESTS.labels(
+            cache=cache, result="hit" if hit else "miss"
+        )
+    child.inc()
+
+
+def record_db_read(target: str):
+    DB_READS.labels(target=target).inc()
+
+
+def record_llm_tokens(prompt_tokens: int, completion_tokens: int):
+    LLM_TOKENS.labels(kind="prompt").observe(prompt_tokens)
+    LLM_TOKENS.labels(kind="completion").observe(completion_tokens)
+
+
+def record_llm_batch(size: int, fallback: bool):
+    LLM_BATCH_SIZE.observe(size)
+    if fallback:
+        LLM_BATCH_FALLBACKS.inc()
+
+
+def count_error(exc: BaseException):
+    ERRORS.labels(exception=exc.__class__.__name__).inc()
+
+
+def instrument_engine(engine):
+    """Record the latency of every statement executed through the engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, params, context, many):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, params, context, many):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = statement.lstrip()[:6].upper()
+        if operation not in _DB_OPERATIONS:
+            operation = "OTHER"
+        child = _query_children.get(operation)
+        if child is None:
+            child = _query_children[operation] = DB_QUERY_LATENCY.labels(
+                operation=operation
+            )
+        child.observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        # after_cursor_execute does not fire for failed statements
+        if context.connection is not None:
+            starts = context.connection.info.get("query_start")
+            if starts:
+                starts.pop()
+
+
+def install_metrics(*engines):
+    """Start feeding stage durations and DB query latency into the metrics."""
+    add_stage_observer(observe_stage)
+    for engine in engines:
+        if engine not in _instrumented_engines:
+            instrument_engine(engine)
+            _instrumented_engines.add(engine)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+
+    Returns:
+        Tuple[bytes, str]: Metrics payload and its content type
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int):
+    """Clean up a dead worker's live gauges in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
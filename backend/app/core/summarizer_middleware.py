@@ -0,0 +1,105 @@
+"""
+HTTP Middleware Module.
+
+This module provides the ASGI middleware that assigns every request an ID,
+exposes it to the rest of the app through the request context, and emits one
+structured access log record and the request metrics with the request's
+stage timings.
+"""
+
+import time
+import uuid
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import REQUESTS_IN_FLIGHT, observe_request
+from backend.app.core.summarizer_profiling import profiler
+from backend.app.core.summarizer_timing import (
+    RequestContext,
+    bind_request,
+    unbind_request,
+)
+from backend.app.logs.summarizer_logging import get_logger
+
+access_logger = get_logger("access")
+
+REQUEST_ID_HEADER = b"x-request-id"
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestContextMiddleware:
+    """
+    Assign request IDs and log per-request stage timings.
+
+    An incoming X-Request-ID header is reused so IDs correlate across
+    services; otherwise a new one is generated. The ID is echoed back in the
+    response headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:MAX_REQUEST_ID_LENGTH]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        context = RequestContext(request_id)
+        status_code = 500
+
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER, request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        token = bind_request(context)
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            unbind_request(token)
+            if context.profile is not None:
+                profiler.request_finished(context)
+            route = scope.get("route")
+            observe_request(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status_code,
+                duration,
+            )
+            if settings.LOG_REQUESTS:
+                self._log_request(scope, context, status_code, duration)
+
+    @staticmethod
+    def _log_request(scope, context: RequestContext, status_code: int, duration):
+        route = scope.get("route")
+        access_logger.info(
+            "request",
+            extra={
+                "fields": {
+                    "request_id": context.request_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 3),
+                    "stages_ms": {
+                        name: round(seconds * 1000, 3)
+                        for name, seconds in context.stages.items()
+                    },
+                }
+            },
+        )
@@ -0,0 +1,216 @@
+"""
+On-demand Stage Profiler.
+
+A sampling profiler switched on at runtime for the next N requests or T
+seconds. The pipeline's `stage` blocks are its hook points: while a session is
+running, the first stage a request enters claims it for profiling, and a
+background thread samples the stacks of the threads that are inside a stage of
+a profiled request. Samples are aggregated as collapsed stacks
+("stage;frame;frame count"), the input format of flamegraph.pl and
+speedscope, rooted at the stage path so the flamegraph groups time by stage.
+
+When no session is running, the stage hook is unset and profiling costs a
+single global lookup per stage.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from backend.app.core.summarizer_timing import RequestContext, set_stage_hook
+from backend.app.exceptions.summarizer_exceptions import ProfilingActiveException
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("profiling")
+
+DEFAULT_INTERVAL = 0.005
+MAX_STACK_DEPTH = 128
+
+
+class ProfilingSession:
+    """Settings, progress and samples of one profiling session."""
+
+    def __init__(
+        self, requests: Optional[int], seconds: Optional[float], interval: float
+    ):
+        self.requests = requests
+        self.seconds = seconds
+        self.interval = interval
+        self.requests_remaining = requests
+        self.requests_profiled = 0
+        self.in_flight = 0
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.done = threading.Event()
+
+    def status(self) -> dict:
+        return {
+            "active": not self.done.is_set(),
+            "requests": self.requests,
+            "seconds": self.seconds,
+            "interval_ms": self.interval * 1000,
+            "requests_profiled": self.requests_profiled,
+            "samples": self.samples,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, one 'frame;frame;frame count' line per stack."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    label = f"{os.path.basename(code.co_filename)}:{name}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+class StageProfiler:
+    """Stack sampler for requests claimed through the stage hook."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: Optional[ProfilingSession] = None
+        # Thread id -> (session, stage path) for threads inside profiled stages
+        self._threads: Dict[int, Tuple[ProfilingSession, List[str]]] = {}
+
+    @property
+    def session(self) -> Optional[ProfilingSession]:
+        """The running session, or the last finished one."""
+        return self._session
+
+    def start(
+        self,
+        requests: Optional[int] = None,
+        seconds: Optional[float] = None,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> ProfilingSession:
+        """
+        Start sampling the next `requests` requests or for `seconds` seconds.
+
+        With both limits, the session ends at whichever comes first.
+
+        Raises:
+            ValueError: If neither limit is given
+            ProfilingActiveException: If a session is already running
+        """
+        if not requests and not seconds:
+            raise ValueError("Give a number of requests or a duration")
+        with self._lock:
+            if self._session is not None and not self._session.done.is_set():
+                raise ProfilingActiveException()
+            session = ProfilingSession(requests, seconds, max(interval, 0.001))
+            self._session = session
+            self._threads.clear()
+        set_stage_hook(self)
+        threading.Thread(
+            target=self._sample_loop,
+            args=(session,),
+            name="stage-profiler",
+            daemon=True,
+        ).start()
+        logger.info("Profiling started for %s requests / %s seconds", requests, seconds)
+        return session
+
+    def stop(self):
+        """Stop the running session, if any."""
+        session = self._session
+        if session is not None:
+            self._finish(session)
+
+    # Stage hook, called from request threads
+
+    def enter(self, context: RequestContext, name: str) -> bool:
+        session = context.profile
+        if session is None:
+            session = self._claim(context)
+            if session is None:
+                return False
+        elif session.done.is_set():
+            return False
+        entry = self._threads.get(threading.get_ident())
+        if entry is None or entry[0] is not session:
+            self._threads[threading.get_ident()] = (session, [name])
+        else:
+            entry[1].append(name)
+        return True
+
+    def exit(self):
+        entry = self._threads.get(threading.get_ident())
+        if entry is None:
+            return
+        entry[1].pop()
+        if not entry[1]:
+            self._threads.pop(threading.get_ident(), None)
+
+    def request_finished(self, context: RequestContext):
+        """Release a profiled request; ends a request-limited session when done."""
+        session = context.profile
+        with self._lock:
+            session.in_flight -= 1
+            finished = session.requests_remaining == 0 and session.in_flight == 0
+        if finished:
+            self._finish(session)
+
+    def _claim(self, context: RequestContext) -> Optional[ProfilingSession]:
+        with self._lock:
+            session = self._session
+            if session is None or session.done.is_set():
+                return None
+            if session.requests_remaining is not None:
+                if session.requests_remaining <= 0:
+                    return None
+                session.requests_remaining -= 1
+            session.in_flight += 1
+            session.requests_profiled += 1
+            context.profile = session
+            return session
+
+    def _finish(self, session: ProfilingSession):
+        with self._lock:
+            if session.done.is_set():
+                return
+            session.finished_at = time.time()
+            session.done.set()
+            if session is self._session:
+                set_stage_hook(None)
+                self._threads.clear()
+        logger.info(
+            "Profiling finished: %s requests, %s samples",
+            session.requests_profiled,
+            session.samples,
+        )
+
+    def _sample_loop(self, session: ProfilingSession):
+        while not session.done.wait(session.interval):
+            if session.deadline is not None and time.monotonic() >= session.deadline:
+                self._finish(session)
+                return
+            self._sample(session)
+
+    def _sample(self, session: ProfilingSession):
+        frames = sys._current_frames()
+        for thread_id, (owner, stages) in list(self._threads.items()):
+            frame = frames.get(thread_id)
+            if owner is not session or frame is None or not stages:
+                continue
+            labels = []
+            while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.reverse()
+            session.stacks[";".join([*stages, *labels])] += 1
+            session.samples += 1
+
+
+profiler = StageProfiler()
@@ -0,0 +1,38 @@
+"""
+Admin Endpoint Protection.
+
+Admin endpoints require the X-Admin-Token header to match the ADMIN_TOKEN
+setting. They are disabled entirely while ADMIN_TOKEN is empty.
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from backend.app.core.summarizer_config import settings
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """
+    FastAPI dependency rejecting requests without a valid admin token.
+
+    Raises:
+        HTTPException: 403 if admin endpoints are disabled
+                      401 if the token is missing or wrong
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "AdminDisabled",
+                "message": "Admin endpoints are disabled; set ADMIN_TOKEN",
+            },
+        )
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail={"error": "Unauthorized", "message": "Invalid admin token"},
+        )
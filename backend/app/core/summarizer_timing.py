@@ -0,0 +1,110 @@
+"""
+Request Context and Pipeline Stage Timing.
+
+Each HTTP request carries a RequestContext holding its request ID and the time
+spent in each pipeline stage. Services and helpers wrap their work in `stage`
+blocks; the request middleware reports the collected durations once the
+request finishes. Stage observers (such as metrics) also receive every stage
+duration, including stages run by background workers. With no request and no
+observers, `stage` only costs a context lookup.
+
+While a profiling session is running, the stage hook is told when a request's
+thread enters and leaves each stage so the sampler knows what to sample.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+
+class RequestContext:
+    """Request ID and accumulated stage durations for one request."""
+
+    __slots__ = ("request_id", "stages", "profile")
+
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self.stages: Dict[str, float] = {}
+        # Profiling session sampling this request, if any
+        self.profile = None
+
+    def add_stage(self, name: str, seconds: float):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar(
+    "summarizer_request", default=None
+)
+
+
+_stage_observers: List[Callable[[str, float], None]] = []
+
+
+def add_stage_observer(observer: Callable[[str, float], None]):
+    """Register a callable receiving (stage name, seconds) for every stage."""
+    if observer not in _stage_observers:
+        _stage_observers.append(observer)
+
+
+def remove_stage_observer(observer: Callable[[str, float], None]):
+    if observer in _stage_observers:
+        _stage_observers.remove(observer)
+
+
+# Set only while a profiling session is running
+_stage_hook = None
+
+
+def set_stage_hook(hook):
+    """
+    Install the hook told about stage entry and exit, or None to remove it.
+
+    The hook provides enter(context, name) -> bool, returning whether the
+    stage is tracked, and exit() for tracked stages.
+    """
+    global _stage_hook
+    _stage_hook = hook
+
+
+def current_request() -> Optional[RequestContext]:
+    """Return the context of the request being handled, if any."""
+    return _current_request.get()
+
+
+def bind_request(context: RequestContext):
+    """Make context the current request; returns a token for unbind_request."""
+    return _current_request.set(context)
+
+
+def unbind_request(token):
+    _current_request.reset(token)
+
+
+@contextmanager
+def stage(name: str):
+    """
+    Time a pipeline stage and add its duration to the current request.
+
+    Repeated stages within one request are summed.
+
+    Args:
+        name (str): Stage name, e.g. 'scrape_download' or 'llm_call'
+    """
+    context = _current_request.get()
+    if context is None and not _stage_observers:
+        yield
+        return
+    hook = _stage_hook
+    tracked = hook is not None and context is not None and hook.enter(context, name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if tracked:
+            hook.exit()
+        if context is not None:
+            context.add_stage(name, elapsed)
+        for observer in _stage_observers:
+            observer(name, elapsed)
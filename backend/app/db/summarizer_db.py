@@ -1,17 +1,49 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.summarizer_config import settings
-from app.logs.summarizer_logging import logger
+from backend.app.core.summarizer_config import settings
+from backend.app.db.summarizer_replicas import (
+    PRIMARY_ONLY,
+    ReplicaSet,
+    RoutingSession,
+)
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("db")
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL  # Updated access pattern
 
+# Set after a client writes; its reads go to the primary until it expires
+READ_PRIMARY_COOKIE = "read_primary"
+
 Base = declarative_base()
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Submissions hold at most INGEST_MAX_IN_FLIGHT connections, so the rest of
+# the pool stays available to reads during an ingestion flood
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.INGEST_MAX_IN_FLIGHT + settings.DB_READ_CONNECTIONS,
+)
+replicas = ReplicaSet(
+    [
+        create_engine(url.strip())
+        for url in settings.DATABASE_REPLICA_URLS.split(",")
+        if url.strip()
+    ],
+    retry_interval=settings.REPLICA_RETRY_INTERVAL,
+)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=replicas,
+)
 
 
-def get_db():
+def get_db(request: Request):
     db = SessionLocal()
+    if request.cookies.get(READ_PRIMARY_COOKIE):
+        db.info[PRIMARY_ONLY] = True
     try:
         logger.info("Database session created")
         yield db
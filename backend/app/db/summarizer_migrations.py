@@ -0,0 +1,315 @@
+"""
+Database Migrations Module.
+
+Explicit, ordered schema migrations for the summary schema. Each migration is
+applied once, in a single transaction, and recorded in the schema's
+schema_migrations table. Migrations run from the application lifespan hook or
+from the command line, never at import time:
+
+    python -m backend.app.db.summarizer_migrations
+
+A Postgres advisory lock serializes workers that start at the same time.
+"""
+
+from typing import List, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("migrations")
+
+# Application-specific key for pg_advisory_xact_lock
+MIGRATION_LOCK_KEY = 72620513
+
+
+class Migration(NamedTuple):
+    """A schema change; statements are formatted with the target schema."""
+
+    version: int
+    description: str
+    statements: List[str]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "create articles and feeds tables",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.articles (
+                id SERIAL PRIMARY KEY,
+                title VARCHAR(255),
+                url VARCHAR(255) NOT NULL,
+                content TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                category VARCHAR(255) NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_title"
+            " ON {schema}.articles (title)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_url"
+            " ON {schema}.articles (url)",
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.feeds (
+                id SERIAL PRIMARY KEY,
+                url VARCHAR(2048) NOT NULL UNIQUE,
+                title VARCHAR(255),
+                etag VARCHAR(255),
+                last_modified VARCHAR(255),
+                last_guid VARCHAR(2048),
+                last_polled_at TIMESTAMPTZ
+            )
+            """,
+        ],
+    ),
+    Migration(
+        2,
+        "add summary versions and re-summarization jobs",
+        [
+            "ALTER TABLE {schema}.articles"
+            " ADD COLUMN IF NOT EXISTS summary_version VARCHAR(255)",
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.resummarize_jobs (
+                id SERIAL PRIMARY KEY,
+                target_version VARCHAR(255) NOT NULL,
+                status VARCHAR(32) NOT NULL,
+                last_article_id INTEGER NOT NULL DEFAULT 0,
+                total INTEGER NOT NULL DEFAULT 0,
+                processed INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                started_at TIMESTAMPTZ,
+                updated_at TIMESTAMPTZ,
+                finished_at TIMESTAMPTZ
+            )
+            """,
+        ],
+    ),
+    Migration(
+        3,
+        "create user profiles and precomputed user feeds",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.user_profiles (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(255) NOT NULL UNIQUE,
+                categories VARCHAR(255)[] NOT NULL DEFAULT '{{}}',
+                keywords VARCHAR(255)[] NOT NULL DEFAULT '{{}}',
+                created_at TIMESTAMPTZ
+            )
+            """,
+            # Find the profiles interested in a new article by array overlap
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_user_profiles_categories"
+            " ON {schema}.user_profiles USING gin (categories)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_user_profiles_keywords"
+            " ON {schema}.user_profiles USING gin (keywords)",
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.user_feeds (
+                user_id INTEGER PRIMARY KEY
+                    REFERENCES {schema}.user_profiles (id) ON DELETE CASCADE,
+                article_ids INTEGER[] NOT NULL DEFAULT '{{}}',
+                scores DOUBLE PRECISION[] NOT NULL DEFAULT '{{}}',
+                updated_at TIMESTAMPTZ
+            )
+            """,
+        ],
+    ),
+    Migration(
+        4,
+        "add article embeddings",
+        [
+            "ALTER TABLE {schema}.articles ADD COLUMN IF NOT EXISTS embedding BYTEA",
+            "ALTER TABLE {schema}.articles"
+            " ADD COLUMN IF NOT EXISTS embedding_version VARCHAR(255)",
+        ],
+    ),
+    Migration(
+        5,
+        "create stories clustering articles about the same event",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.stories (
+                id SERIAL PRIMARY KEY,
+                title VARCHAR(255),
+                summary TEXT NOT NULL,
+                category VARCHAR(255) NOT NULL,
+                article_count INTEGER NOT NULL DEFAULT 1,
+                summarized_count INTEGER NOT NULL DEFAULT 1,
+                summary_version VARCHAR(255),
+                centroid BYTEA NOT NULL,
+                created_at TIMESTAMPTZ,
+                updated_at TIMESTAMPTZ
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_stories_updated_at"
+            " ON {schema}.stories (updated_at)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_stories_category"
+            " ON {schema}.stories (category)",
+            "ALTER TABLE {schema}.articles ADD COLUMN IF NOT EXISTS story_id INTEGER",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_story_id"
+            " ON {schema}.articles (story_id)",
+        ],
+    ),
+    Migration(
+        6,
+        "add article timestamps, change sequence and delete tombstones",
+        [
+            "CREATE SEQUENCE IF NOT EXISTS {schema}.article_change_seq",
+            "ALTER TABLE {schema}.articles"
+            " ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ DEFAULT now()",
+            "ALTER TABLE {schema}.articles"
+            " ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT now()",
+            "ALTER TABLE {schema}.articles ADD COLUMN IF NOT EXISTS change_seq BIGINT"
+            " NOT NULL DEFAULT nextval('{schema}.article_change_seq')",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_change_seq"
+            " ON {schema}.articles (change_seq)",
+            """
+            CREATE TABLE IF NOT EXISTS {schema}.article_tombstones (
+                article_id INTEGER PRIMARY KEY,
+                change_seq BIGINT NOT NULL
+                    DEFAULT nextval('{schema}.article_change_seq'),
+                deleted_at TIMESTAMPTZ DEFAULT now()
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_article_tombstones_change_seq"
+            " ON {schema}.article_tombstones (change_seq)",
+        ],
+    ),
+    Migration(
+        7,
+        "partition articles by ingestion month",
+        [
+            # The existing table becomes the partition of everything up to the
+            # end of the current month, without copying rows. Monthly
+            # partitions after it are created by summarizer_partitions.
+            """
+            DO $$
+            DECLARE
+                bound TIMESTAMPTZ;
+            BEGIN
+                -- Databases created from init_schema.sql are partitioned already
+                IF (SELECT relkind FROM pg_class
+                    WHERE oid = '{schema}.articles'::regclass) = 'p' THEN
+                    RETURN;
+                END IF;
+                UPDATE {schema}.articles SET created_at = now()
+                    WHERE created_at IS NULL;
+                ALTER TABLE {schema}.articles ALTER COLUMN created_at SET NOT NULL;
+                ALTER TABLE {schema}.articles RENAME TO articles_legacy;
+                -- Replaced by the (id, created_at) key of the partitioned table
+                ALTER TABLE {schema}.articles_legacy DROP CONSTRAINT articles_pkey;
+                ALTER INDEX IF EXISTS {schema}.ix_{schema}_articles_title
+                    RENAME TO ix_{schema}_articles_legacy_title;
+                ALTER INDEX IF EXISTS {schema}.ix_{schema}_articles_url
+                    RENAME TO ix_{schema}_articles_legacy_url;
+                ALTER INDEX IF EXISTS {schema}.ix_{schema}_articles_story_id
+                    RENAME TO ix_{schema}_articles_legacy_story_id;
+                ALTER INDEX IF EXISTS {schema}.ix_{schema}_articles_change_seq
+                    RENAME TO ix_{schema}_articles_legacy_change_seq;
+                CREATE TABLE {schema}.articles (
+                    id INTEGER NOT NULL
+                        DEFAULT nextval('{schema}.articles_id_seq'),
+                    title VARCHAR(255),
+                    url VARCHAR(255) NOT NULL,
+                    content TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    category VARCHAR(255) NOT NULL,
+                    summary_version VARCHAR(255),
+                    embedding BYTEA,
+                    embedding_version VARCHAR(255),
+                    story_id INTEGER,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    updated_at TIMESTAMPTZ DEFAULT now(),
+                    change_seq BIGINT NOT NULL
+                        DEFAULT nextval('{schema}.article_change_seq'),
+                    PRIMARY KEY (id, created_at)
+                ) PARTITION BY RANGE (created_at);
+                ALTER SEQUENCE {schema}.articles_id_seq
+                    OWNED BY {schema}.articles.id;
+                SELECT greatest(
+                    date_trunc('month', max(created_at), 'UTC'),
+                    date_trunc('month', now(), 'UTC')
+                ) + interval '1 month'
+                INTO bound FROM {schema}.articles_legacy;
+                EXECUTE format(
+                    'ALTER TABLE {schema}.articles ATTACH PARTITION'
+                    ' {schema}.articles_legacy FOR VALUES FROM (MINVALUE) TO (%L)',
+                    bound
+                );
+                -- Catches rows of months whose partition is not created yet
+                CREATE TABLE {schema}.articles_default
+                    PARTITION OF {schema}.articles DEFAULT;
+            END $$
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_title"
+            " ON {schema}.articles (title)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_url"
+            " ON {schema}.articles (url)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_story_id"
+            " ON {schema}.articles (story_id)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_change_seq"
+            " ON {schema}.articles (change_seq)",
+            "CREATE INDEX IF NOT EXISTS ix_{schema}_articles_category_created_at"
+            " ON {schema}.articles (category, created_at)",
+        ],
+    ),
+]
+
+
+def applied_versions(conn: Connection, schema: str) -> set:
+    """Return the migration versions already applied to a schema."""
+    rows = conn.execute(text(f"SELECT version FROM {schema}.schema_migrations"))
+    return {version for (version,) in rows}
+
+
+def run_migrations(engine: Engine, schema: str = "summary") -> List[int]:
+    """
+    Apply all pending migrations to a schema.
+
+    Args:
+        engine (Engine): Engine connected to the target database
+        schema (str): Schema holding the application tables
+
+    Returns:
+        List[int]: Versions applied by this call, in order
+    """
+    applied = []
+    with engine.begin() as conn:
+        conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+        )
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+        conn.execute(text(f"""
+                CREATE TABLE IF NOT EXISTS {schema}.schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    description VARCHAR(255) NOT NULL,
+                    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+                """))
+        done = applied_versions(conn, schema)
+        for migration in MIGRATIONS:
+            if migration.version in done:
+                continue
+            for statement in migration.statements:
+                conn.execute(text(statement.format(schema=schema)))
+            conn.execute(
+                text(
+                    f"INSERT INTO {schema}.schema_migrations (version, description)"
+                    " VALUES (:version, :description)"
+                ),
+                {"version": migration.version, "description": migration.description},
+            )
+            logger.info(
+                "Applied migration %s: %s", migration.version, migration.description
+            )
+            applied.append(migration.version)
+    return applied
+
+
+if __name__ == "__main__":
+    from backend.app.db.summarizer_db import engine
+
+    versions = run_migrations(engine)
+    print(f"Applied migrations: {versions or 'none, schema is up to date'}")
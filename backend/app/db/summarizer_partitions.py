@@ -0,0 +1,285 @@
+"""
+Article Partition Maintenance Module.
+
+The articles table is partitioned by ingestion month (created_at, in UTC).
+This module keeps the partitions for the next ARTICLE_PARTITION_MONTHS_AHEAD
+months created ahead of time, and drops whole partitions once they are older
+than ARTICLE_RETENTION_MONTHS, instead of deleting expired rows one by one.
+
+Rows that arrive for a month without a partition land in the default
+partition; they are moved into the month's partition when it is created.
+Dropped articles get tombstones in one statement per partition, so delta sync
+clients learn about the deletions.
+
+The job runs in a background thread of every worker; a Postgres advisory lock
+lets one worker at a time do the work. It can also be run once by hand:
+
+    python -m backend.app.db.summarizer_partitions
+"""
+
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import engine as default_engine
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("partitions")
+
+# Application-specific key for pg_try_advisory_xact_lock
+PARTITION_LOCK_KEY = 72620518
+
+BOUND = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+class Partition(NamedTuple):
+    name: str
+    # None for MINVALUE/MAXVALUE; both None for the default partition
+    lower: Optional[datetime]
+    upper: Optional[datetime]
+    default: bool
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of moment's month, in UTC."""
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def _bound(value: str) -> Optional[datetime]:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    # '2026-11-01 00:00:00+00', printed in the session time zone (UTC)
+    return datetime.fromisoformat(value.strip("'") + ":00")
+
+
+def list_partitions(conn: Connection, schema: str, table: str) -> List[Partition]:
+    """Partitions of schema.table with their bounds; call within a transaction."""
+    conn.execute(text("SET LOCAL TIME ZONE 'UTC'"))
+    rows = conn.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)"
+            " FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+            " WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": f"{schema}.{table}"},
+    )
+    partitions = []
+    for name, bound in rows:
+        if bound == "DEFAULT":
+            partitions.append(Partition(name, None, None, True))
+            continue
+        lower, upper = BOUND.search(bound).groups()
+        partitions.append(Partition(name, _bound(lower), _bound(upper), False))
+    return partitions
+
+
+def _covers(partition: Partition, month: datetime) -> bool:
+    if partition.default:
+        return False
+    after_lower = partition.lower is None or partition.lower <= month
+    before_upper = partition.upper is None or month < partition.upper
+    return after_lower and before_upper
+
+
+def ensure_partitions(
+    conn: Connection, schema: str, table: str, months_ahead: int, now: datetime
+) -> List[str]:
+    """
+    Create the partitions of the current month and the months_ahead after it.
+
+    Returns:
+        List[str]: Names of the partitions created
+    """
+    partitions = list_partitions(conn, schema, table)
+    default = next((p.name for p in partitions if p.default), None)
+    created = []
+    first = month_start(now)
+    for offset in range(months_ahead + 1):
+        month = add_months(first, offset)
+        if any(_covers(p, month) for p in partitions):
+            continue
+        name = partition_name(table, month)
+        bounds = {"lower": month, "upper": add_months(month, 1)}
+        conn.execute(
+            text(
+                f"CREATE TABLE {schema}.{name}"
+                f" (LIKE {schema}.{table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        if default is not None:
+            # The month's rows that arrived before its partition existed
+            conn.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {schema}.{default}"
+                    " WHERE created_at >= :lower AND created_at < :upper"
+                    f" RETURNING *) INSERT INTO {schema}.{name} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+        conn.execute(
+            text(
+                f"ALTER TABLE {schema}.{table} ATTACH PARTITION {schema}.{name}"
+                f" FOR VALUES FROM ('{month.isoformat()}')"
+                f" TO ('{bounds['upper'].isoformat()}')"
+            )
+        )
+        created.append(name)
+        logger.info("Created partition %s.%s", schema, name)
+    return created
+
+
+def drop_expired_partitions(
+    conn: Connection,
+    schema: str,
+    table: str,
+    tombstone_table: str,
+    retention_months: int,
+    now: datetime,
+) -> List[str]:
+    """
+    Drop partitions whose months all ended retention_months or more ago,
+    recording a tombstone for each of their articles.
+
+    Returns:
+        List[str]: Names of the partitions dropped
+    """
+    # Imported here: the services import the models defined next to this module
+    from backend.app.services.summarizer_services import lock_article_changes
+
+    cutoff = add_months(month_start(now), -retention_months)
+    dropped = []
+    for partition in list_partitions(conn, schema, table):
+        if partition.default or partition.upper is None or partition.upper > cutoff:
+            continue
+        lock_article_changes(conn)
+        conn.execute(
+            text(
+                f"INSERT INTO {schema}.{tombstone_table} (article_id)"
+                f" SELECT id FROM {schema}.{partition.name}"
+                " ON CONFLICT (article_id) DO NOTHING"
+            )
+        )
+        conn.execute(text(f"DROP TABLE {schema}.{partition.name}"))
+        dropped.append(partition.name)
+        logger.info("Dropped expired partition %s.%s", schema, partition.name)
+    return dropped
+
+
+class PartitionMaintainer:
+    """Background thread creating and dropping article partitions."""
+
+    def __init__(
+        self,
+        engine: Engine = default_engine,
+        schema: str = "summary",
+        table: str = "articles",
+        tombstone_table: str = "article_tombstones",
+        months_ahead: int = settings.ARTICLE_PARTITION_MONTHS_AHEAD,
+        retention_months: int = settings.ARTICLE_RETENTION_MONTHS,
+        interval: float = settings.PARTITION_MAINTENANCE_INTERVAL,
+    ):
+        """
+        Initialize the maintainer.
+
+        Args:
+            engine (Engine): Database the partitioned table lives in
+            schema (str): Schema of the tables
+            table (str): Partitioned articles table
+            tombstone_table (str): Receives tombstones of dropped articles
+            months_ahead (int): Months after the current one to create ahead
+            retention_months (int): Full months kept before the current one;
+                0 keeps everything
+            interval (float): Seconds between runs; 0 disables the thread
+        """
+        self.engine = engine
+        self.schema = schema
+        self.table = table
+        self.tombstone_table = tombstone_table
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """
+        Create upcoming partitions and drop expired ones, in one transaction.
+
+        Returns:
+            dict: 'created' and 'dropped' partition names; both empty if
+                another worker holds the maintenance lock
+        """
+        now = now or datetime.now(timezone.utc)
+        result = {"created": [], "dropped": []}
+        with self.engine.begin() as conn:
+            locked = conn.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": PARTITION_LOCK_KEY},
+            ).scalar()
+            if not locked:
+                return result
+            result["created"] = ensure_partitions(
+                conn, self.schema, self.table, self.months_ahead, now
+            )
+            if self.retention_months > 0:
+                result["dropped"] = drop_expired_partitions(
+                    conn,
+                    self.schema,
+                    self.table,
+                    self.tombstone_table,
+                    self.retention_months,
+                    now,
+                )
+        return result
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="partition-maintainer", daemon=True
+        )
+        self._thread.start()
+        logger.info("Partition maintainer started with interval %ss", self.interval)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Partition maintainer stopped")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error("Partition maintenance failed: %s", e)
+                count_error(e)
+            self._stop.wait(self.interval)
+
+
+partition_maintainer = PartitionMaintainer()
+
+
+if __name__ == "__main__":
+    result = partition_maintainer.run_once()
+    print(f"Created partitions: {result['created'] or 'none'}")
+    print(f"Dropped partitions: {result['dropped'] or 'none'}")
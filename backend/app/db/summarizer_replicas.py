@@ -0,0 +1,164 @@
+"""
+Read Replica Routing Module.
+
+Sessions from SessionLocal are RoutingSessions: statements run on the primary
+database unless they are made by a service method decorated with @read_only,
+which sends its SELECTs to a read replica. Replicas are picked round-robin
+once per session, so one request sees one consistent snapshot.
+
+A replica whose connection fails is marked down, and the read is retried on
+the primary. It stays out of rotation for REPLICA_RETRY_INTERVAL seconds,
+after which it is probed with SELECT 1 before serving again.
+
+Replicas lag behind the primary, so a client that just created an article may
+not see it yet. Sessions flagged with PRIMARY_ONLY (read-your-writes, see
+get_db) read from the primary.
+"""
+
+import functools
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from backend.app.core.summarizer_metrics import record_db_read
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("db")
+
+# Session.info keys
+READ_ONLY = "read_only"
+PRIMARY_ONLY = "primary_only"
+REPLICA = "replica"
+
+
+class ReplicaSet:
+    """Round-robin over read replicas, skipping those that are down."""
+
+    def __init__(self, engines: List[Engine], retry_interval: float = 5.0):
+        """
+        Initialize the replica set.
+
+        Args:
+            engines (List[Engine]): One engine per replica
+            retry_interval (float): Seconds a failed replica is skipped before
+                it is probed again
+        """
+        self.engines = engines
+        self.retry_interval = retry_interval
+        self._turn = itertools.count()
+        self._down: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def healthy(self) -> int:
+        """Number of replicas in rotation."""
+        return len(self.engines) - len(self._down)
+
+    def pick(self) -> Optional[Engine]:
+        """The next healthy replica, or None if all of them are down."""
+        for _ in range(len(self.engines)):
+            index = next(self._turn) % len(self.engines)
+            if self._available(index):
+                return self.engines[index]
+        return None
+
+    def mark_down(self, engine: Engine):
+        index = self.engines.index(engine)
+        with self._lock:
+            self._down[index] = time.monotonic()
+        logger.warning("Read replica %s marked down", engine.url.host or index)
+
+    def _available(self, index: int) -> bool:
+        with self._lock:
+            since = self._down.get(index)
+            if since is None:
+                return True
+            if time.monotonic() - since < self.retry_interval:
+                return False
+            # Probe once per interval; other callers skip it meanwhile
+            self._down[index] = time.monotonic()
+        try:
+            with self.engines[index].connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except OperationalError:
+            return False
+        with self._lock:
+            self._down.pop(index, None)
+        logger.info("Read replica %s back in rotation", index)
+        return True
+
+
+class RoutingSession(Session):
+    """Session sending reads in read_only methods to a replica."""
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.replicas
+            and self.info.get(READ_ONLY)
+            and not self.info.get(PRIMARY_ONLY)
+            and not self._flushing
+            and not isinstance(clause, UpdateBase)
+        ):
+            replica = self.info.get(REPLICA)
+            if replica is None:
+                replica = self.info[REPLICA] = self.replicas.pick()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@contextmanager
+def replica_reads(db: Session):
+    """Route the reads of db to a replica within the block."""
+    previous = db.info.get(READ_ONLY, False)
+    db.info[READ_ONLY] = True
+    try:
+        yield
+    finally:
+        db.info[READ_ONLY] = previous
+
+
+def read_only(method):
+    """
+    Run a service method's reads on a replica, falling back to the primary
+    if the replica fails. The service keeps its session in self.db.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        db = self.db
+        if not getattr(db, "replicas", None) or db.info.get(PRIMARY_ONLY):
+            record_db_read("primary")
+            return method(self, *args, **kwargs)
+        try:
+            with replica_reads(db):
+                result = method(self, *args, **kwargs)
+        except OperationalError as e:
+            replica = db.info.pop(REPLICA, None)
+            if replica is None:
+                raise
+            logger.warning("Read replica failed, reading from primary: %s", e)
+            db.replicas.mark_down(replica)
+            db.rollback()
+            # Stay on the primary for the rest of the session
+            db.info[PRIMARY_ONLY] = True
+            record_db_read("primary")
+            return method(self, *args, **kwargs)
+        record_db_read("replica" if db.info.get(REPLICA) else "primary")
+        return result
+
+    return wrapper
@@ -33,3 +33,66 @@ class ArticlesNotFoundForCategoryException(Exception):
         self.category = category
         self.message = f"No articles found for category: {self.category}"
         super().__init__(self.message)
+
+
+class ScrapeThrottledException(Exception):
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        self.message = (
+            f"Scraping of host '{self.host}' is throttled; "
+            f"retry after {self.retry_after:.0f} seconds."
+        )
+        super().__init__(self.message)
+
+
+class FeedNotFoundException(Exception):
+    def __init__(self, feed_id: int):
+        self.feed_id = feed_id
+        self.message = f"Feed with ID {self.feed_id} not found."
+        super().__init__(self.message)
+
+
+class UserNotFoundException(Exception):
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.message = f"User with ID {self.user_id} not found."
+        super().__init__(self.message)
+
+
+class UserAlreadyExistsException(Exception):
+    def __init__(self, name: str):
+        self.name = name
+        self.message = f"A user named '{self.name}' already exists."
+        super().__init__(self.message)
+
+
+class StoryNotFoundException(Exception):
+    def __init__(self, story_id: int):
+        self.story_id = story_id
+        self.message = f"Story with ID {self.story_id} not found."
+        super().__init__(self.message)
+
+
+class ProfilingActiveException(Exception):
+    def __init__(self):
+        self.message = "A profiling session is already running."
+        super().__init__(self.message)
+
+
+class ResummarizeJobActiveException(Exception):
+    def __init__(self):
+        self.message = "A re-summarization job is already running."
+        super().__init__(self.message)
+
+
+class OverloadedException(Exception):
+    def __init__(self, lane: str, reason: str, retry_after: float):
+        self.lane = lane
+        self.reason = reason
+        self.retry_after = retry_after
+        self.message = (
+            f"Too many {self.lane} requests ({self.reason}); "
+            f"retry after {self.retry_after:.0f} seconds."
+        )
+        super().__init__(self.message)
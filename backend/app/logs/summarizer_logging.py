@@ -1,49 +1,184 @@
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_timing import current_request
+
+LOGGER_NAME = "summarizer"
+LOG_FORMAT = (
+    "%(asctime)s - %(levelname)s - %(request_id)s - %(filename)s - %(funcName)s"
+    " - %(message)s"
+)
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request ID on the logging thread."""
+
+    def filter(self, record):
+        context = current_request()
+        record.request_id = context.request_id if context else "-"
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formatter emitting JSON for records that carry structured fields.
+
+    Records logged with extra={"fields": {...}} become one JSON object per
+    line; all other records use the plain text format.
+    """
+
+    def format(self, record):
+        fields = getattr(record, "fields", None)
+        if fields is None:
+            if not hasattr(record, "request_id"):
+                record.request_id = "-"
+            return super().format(record)
+        return json.dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            },
+            default=str,
+        )
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the logging thread.
+
+    Records are queued unformatted, so message interpolation and all file and
+    console I/O happen on the listener thread. When the queue is full, INFO
+    and lower records are dropped while WARNING and higher records evict the
+    oldest buffered record.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.listener = None
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if record.levelno >= logging.WARNING:
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates the file and its directory on first write."""
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class _DrainingQueueListener(QueueListener):
+    """Queue listener whose stop() is idempotent and waits for queue space."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+def build_queue_handler(handlers, maxsize: int) -> DroppingQueueHandler:
+    """
+    Wrap handlers behind a bounded queue served by a background listener.
+
+    Args:
+        handlers: Handlers that perform the actual I/O
+        maxsize (int): Maximum number of records buffered
+
+    Returns:
+        DroppingQueueHandler: Handler to attach to a logger; its listener is running
+    """
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=maxsize))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.listener = _DrainingQueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    queue_handler.listener.start()
+    atexit.register(queue_handler.listener.stop)
+    return queue_handler
+
+
+def apply_module_levels(spec: str):
+    """
+    Set per-module logger levels from a 'name=LEVEL,name=LEVEL' string.
+
+    Names without the 'summarizer.' prefix are treated as children of the
+    'summarizer' logger, so 'db=WARNING' silences per-request session logs.
+    """
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = entry.partition("=")
+        name = name.strip()
+        if name != LOGGER_NAME and not name.startswith(LOGGER_NAME + "."):
+            name = f"{LOGGER_NAME}.{name}"
+        logging.getLogger(name).setLevel(level.strip().upper())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the child logger 'summarizer.<name>' for a module."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
 
 
 def setup_logging():
-    # Define log directory and ensure it exists
+    # Log directory; created with the log file when the first record is written
     log_directory = os.path.abspath(os.path.join(os.getcwd(), "backend/app/logs"))
-    if not os.path.exists(log_directory):
-        os.makedirs(log_directory)
-        print(f"Created log directory at {log_directory}")
-    else:
-        print(f"Log directory already exists at {log_directory}")
 
     # Create and configure the 'summarizer' logger
-    logger = logging.getLogger("summarizer")
-    logger.setLevel(logging.INFO)
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(settings.LOG_LEVEL.upper())
     logger.propagate = False  # Prevent logs from being propagated to the root logger
 
     # Check if handlers are already added to prevent duplication
     if not logger.handlers:
         # Rotating File Handler
-        rotating_file_handler = RotatingFileHandler(
+        rotating_file_handler = _LazyRotatingFileHandler(
             os.path.join(log_directory, "summarizer.log"),
             maxBytes=5 * 1024 * 1024,  # 5 MB
             backupCount=5,  # Keep up to 5 backup files
         )
         rotating_file_handler.setLevel(logging.INFO)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(filename)s - %(funcName)s - %(message)s"
-        )
-        rotating_file_handler.setFormatter(file_formatter)
+        rotating_file_handler.setFormatter(StructuredFormatter(LOG_FORMAT))
 
         # Stream Handler (Console)
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(logging.INFO)
-        stream_formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(filename)s - %(funcName)s - %(message)s"
-        )
-        stream_handler.setFormatter(stream_formatter)
+        stream_handler.setFormatter(StructuredFormatter(LOG_FORMAT))
 
-        # Add handlers to the logger
-        logger.addHandler(rotating_file_handler)
-        logger.addHandler(stream_handler)
-        print("Logging handlers added to 'summarizer' logger.")
+        # Both handlers run on the listener thread, off the request path
+        logger.addHandler(
+            build_queue_handler(
+                [rotating_file_handler, stream_handler], settings.LOG_QUEUE_SIZE
+            )
+        )
 
+    apply_module_levels(settings.LOG_LEVELS)
     return logger
 
 
@@ -61,7 +196,3 @@ def log_info(message):
 
 def log_warning(message):
     logger.warning(message)
-
-
-# Add a test log to verify the logging setup
-logger.info("Test log to verify logging setup")
@@ -1,12 +1,64 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from backend.app.routers import summarizer_routers
-from backend.app.core.summarizer_config import settings
+from backend.app.routers import (
+    summarizer_admin_routers,
+    summarizer_routers,
+    summarizer_story_routers,
+    summarizer_feed_routers,
+    summarizer_metrics_routers,
+    summarizer_user_routers,
+)
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from backend.app.core.summarizer_admission import ingest_lane, reserve_read_threads
+from backend.app.core.summarizer_config import ENV_FILE, settings
+from backend.app.core.summarizer_metrics import install_metrics
+from backend.app.core.summarizer_middleware import RequestContextMiddleware
 from backend.app.logs.summarizer_logging import logger
-from backend.app.db.summarizer_db import Base, engine
+from backend.app.db.summarizer_db import engine, replicas
+from backend.app.db.summarizer_migrations import run_migrations
+from backend.app.db.summarizer_partitions import partition_maintainer
+from backend.app.services.summarizer_feed_services import feed_poller, ingest_queue
+from backend.app.services.summarizer_resummarize_services import resummarizer
+from backend.app.services.summarizer_service_helpers import shutdown_parse_pool
+from backend.app.services.summarizer_similar_services import similar_articles
+from backend.app.services.summarizer_story_services import story_clusterer
+from backend.app.services.summarizer_user_services import feed_ranker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not ENV_FILE.exists():
+        logger.warning(
+            ".env file not found at %s; create it from .env.example", ENV_FILE
+        )
+    if settings.RUN_MIGRATIONS:
+        try:
+            run_migrations(engine)
+        except OperationalError as e:
+            # Serve anyway; requests needing the database fail with 503 until it is up
+            logger.error("Database unavailable, migrations not applied: %s", e)
+    try:
+        resummarizer.resume_interrupted()
+    except SQLAlchemyError as e:
+        logger.error("Re-summarization not resumed: %s", e)
+    reserve_read_threads(ingest_lane, settings.READ_THREADS)
+    feed_poller.start()
+    partition_maintainer.start()
+    story_clusterer.start()
+    yield
+    feed_poller.stop()
+    partition_maintainer.stop()
+    ingest_queue.stop()
+    feed_ranker.stop()
+    story_clusterer.stop()
+    similar_articles.stop()
+    shutdown_parse_pool()
+    # Stays marked running so the next startup resumes from its checkpoint
+    resummarizer.stop(pause=False)
 
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -15,15 +67,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Request-ID"],
 )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-logger.info("Database tables created successfully")
+# Assign request IDs and log per-request stage timings
+app.add_middleware(RequestContextMiddleware)
+
+# Feed stage timings and DB query latency into the Prometheus metrics
+install_metrics(engine, *replicas.engines)
 
 app.include_router(
     summarizer_routers.router, prefix=settings.APP_PREFIX, tags=["Summarizer API"]
 )
+app.include_router(
+    summarizer_story_routers.router, prefix=settings.APP_PREFIX, tags=["Stories API"]
+)
+app.include_router(
+    summarizer_feed_routers.router, prefix=settings.APP_PREFIX, tags=["Feeds API"]
+)
+app.include_router(
+    summarizer_user_routers.router, prefix=settings.APP_PREFIX, tags=["Users API"]
+)
+app.include_router(
+    summarizer_admin_routers.router, prefix=settings.APP_PREFIX, tags=["Admin API"]
+)
+app.include_router(summarizer_metrics_routers.router)
 
 
 @app.get("/")
@@ -1,37 +1,311 @@
-from sqlalchemy import Column, Integer, String, Text
-from sqlalchemy.orm import declarative_base  # Updated import
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    Sequence,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import declarative_base, deferred  # Updated import
 
 # Define separate Base classes for each database
 SummaryBase = declarative_base()
 TestSummaryBase = declarative_base()
 
+# Orders article inserts, updates and deletes for delta sync; values are taken
+# while holding the article change lock, so they increase in commit order
+article_change_seq = Sequence(
+    "article_change_seq", schema="summary", metadata=SummaryBase.metadata
+)
+test_article_change_seq = Sequence(
+    "test_article_change_seq", schema="test_summary", metadata=TestSummaryBase.metadata
+)
+
 
 class Article(SummaryBase):
     __tablename__ = "articles"
-    __table_args__ = {"schema": "summary", "extend_existing": True}
+    # Partitioned by ingestion month (summarizer_partitions); the table's key
+    # must include created_at, while rows are still identified by id alone
+    __table_args__ = {
+        "schema": "summary",
+        "extend_existing": True,
+        "postgresql_partition_by": "RANGE (created_at)",
+    }
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     title = Column(String, index=True, nullable=True)
     url = Column(String, index=True)
     content = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
     category = Column(String, nullable=False)
+    summary_version = Column(String, nullable=True)
+    # float32 vector bytes, loaded only when asked for
+    embedding = deferred(Column(LargeBinary, nullable=True))
+    embedding_version = Column(String, nullable=True)
+    story_id = Column(Integer, index=True, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_seq = Column(
+        BigInteger,
+        article_change_seq,
+        server_default=article_change_seq.next_value(),
+        index=True,
+        nullable=False,
+    )
+
+    __mapper_args__ = {"primary_key": [id]}
+
+
+class ArticleTombstone(SummaryBase):
+    """A deleted article, reported to delta sync clients"""
+
+    __tablename__ = "article_tombstones"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    article_id = Column(Integer, primary_key=True, autoincrement=False)
+    change_seq = Column(
+        BigInteger,
+        article_change_seq,
+        server_default=article_change_seq.next_value(),
+        index=True,
+        nullable=False,
+    )
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class Story(SummaryBase):
+    """Articles covering the same event, with one combined summary"""
+
+    __tablename__ = "stories"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=True)
+    summary = Column(Text, nullable=False)
+    category = Column(String, index=True, nullable=False)
+    article_count = Column(Integer, nullable=False, default=1)
+    # article_count when the summary was last generated
+    summarized_count = Column(Integer, nullable=False, default=1)
+    summary_version = Column(String, nullable=True)
+    # Normalized mean of the member vectors, as float32 bytes
+    centroid = deferred(Column(LargeBinary, nullable=False))
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), index=True, nullable=True)
+
+
+class Feed(SummaryBase):
+    """RSS/Atom feed subscription polled for new articles"""
+
+    __tablename__ = "feeds"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, nullable=False)
+    title = Column(String, nullable=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    last_guid = Column(String, nullable=True)
+    last_polled_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ResummarizeJob(SummaryBase):
+    """Re-summarization run towards one summary version, with its checkpoint"""
+
+    __tablename__ = "resummarize_jobs"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    target_version = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    last_article_id = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class UserProfile(SummaryBase):
+    """Reader preferences: followed categories and keywords (lowercase)"""
+
+    __tablename__ = "user_profiles"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    categories = Column(ARRAY(String), nullable=False, default=list)
+    keywords = Column(ARRAY(String), nullable=False, default=list)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class UserFeed(SummaryBase):
+    """Precomputed ranked feed of a user: article ids with their scores"""
+
+    __tablename__ = "user_feeds"
+    __table_args__ = {"schema": "summary", "extend_existing": True}
+
+    user_id = Column(
+        Integer,
+        ForeignKey("summary.user_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    article_ids = Column(ARRAY(Integer), nullable=False, default=list)
+    scores = Column(ARRAY(Float(precision=53)), nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
 
 
 class TestArticle(TestSummaryBase):
     """Test article model for testing purposes"""
 
     __tablename__ = "test_articles"
-    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+    # Partitioned by ingestion month (summarizer_partitions); the table's key
+    # must include created_at, while rows are still identified by id alone
+    __table_args__ = {
+        "schema": "test_summary",
+        "extend_existing": True,
+        "postgresql_partition_by": "RANGE (created_at)",
+    }
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     title = Column(String, index=True, nullable=True)
     url = Column(String, index=True)
     content = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
     category = Column(String, nullable=False)
+    summary_version = Column(String, nullable=True)
+    # float32 vector bytes, loaded only when asked for
+    embedding = deferred(Column(LargeBinary, nullable=True))
+    embedding_version = Column(String, nullable=True)
+    story_id = Column(Integer, index=True, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    change_seq = Column(
+        BigInteger,
+        test_article_change_seq,
+        server_default=test_article_change_seq.next_value(),
+        index=True,
+        nullable=False,
+    )
+
+    __mapper_args__ = {"primary_key": [id]}
 
     # @classmethod
     # def _sa_class_manager(cls):
     #     # This method is required for pytest to properly collect the class
     #     return cls
+
+
+class TestArticleTombstone(TestSummaryBase):
+    """Test article tombstone model for testing purposes"""
+
+    __tablename__ = "test_article_tombstones"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    article_id = Column(Integer, primary_key=True, autoincrement=False)
+    change_seq = Column(
+        BigInteger,
+        test_article_change_seq,
+        server_default=test_article_change_seq.next_value(),
+        index=True,
+        nullable=False,
+    )
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class TestStory(TestSummaryBase):
+    """Test story model for testing purposes"""
+
+    __tablename__ = "test_stories"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=True)
+    summary = Column(Text, nullable=False)
+    category = Column(String, index=True, nullable=False)
+    article_count = Column(Integer, nullable=False, default=1)
+    summarized_count = Column(Integer, nullable=False, default=1)
+    summary_version = Column(String, nullable=True)
+    centroid = deferred(Column(LargeBinary, nullable=False))
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), index=True, nullable=True)
+
+
+class TestFeed(TestSummaryBase):
+    """Test feed model for testing purposes"""
+
+    __tablename__ = "test_feeds"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, nullable=False)
+    title = Column(String, nullable=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    last_guid = Column(String, nullable=True)
+    last_polled_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class TestResummarizeJob(TestSummaryBase):
+    """Test re-summarization job model for testing purposes"""
+
+    __tablename__ = "test_resummarize_jobs"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    target_version = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    last_article_id = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class TestUserProfile(TestSummaryBase):
+    """Test user profile model for testing purposes"""
+
+    __tablename__ = "test_user_profiles"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    categories = Column(ARRAY(String), nullable=False, default=list)
+    keywords = Column(ARRAY(String), nullable=False, default=list)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class TestUserFeed(TestSummaryBase):
+    """Test user feed model for testing purposes"""
+
+    __tablename__ = "test_user_feeds"
+    __table_args__ = {"schema": "test_summary", "extend_existing": True}
+
+    user_id = Column(
+        Integer,
+        ForeignKey("test_summary.test_user_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    article_ids = Column(ARRAY(Integer), nullable=False, default=list)
+    scores = Column(ARRAY(Float(precision=53)), nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,150 @@
+"""
+Admin API Router Module.
+
+This module provides admin-only endpoints for operating the service:
+on-demand profiling of the summarization pipeline and re-summarization of
+stored articles after a model or prompt change.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.core.summarizer_profiling import profiler
+from backend.app.core.summarizer_security import require_admin
+from backend.app.db.summarizer_db import get_db
+from backend.app.exceptions.summarizer_exceptions import (
+    ProfilingActiveException,
+    ResummarizeJobActiveException,
+)
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.schemas.summarizer_schemas import ResummarizeJobResponse
+from backend.app.services.summarizer_resummarize_services import resummarizer
+
+logger = get_logger("admin")
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.post("/profiling/start")
+def start_profiling(
+    requests: Optional[int] = Query(None, ge=1, le=10000),
+    seconds: Optional[float] = Query(None, gt=0, le=3600),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+):
+    """
+    Start sampling the next `requests` requests or for `seconds` seconds.
+
+    Returns:
+        dict: Status of the new profiling session
+
+    Raises:
+        HTTPException: 400 if neither limit is given
+                      409 if a session is already running
+    """
+    if requests is None and seconds is None:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "InvalidProfilingRequest",
+                "message": "Give a number of requests or a duration",
+            },
+        )
+    try:
+        session = profiler.start(requests, seconds, interval_ms / 1000)
+    except ProfilingActiveException as e:
+        logger.warning("Profiling start rejected: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=409, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    return session.status()
+
+
+@router.post("/profiling/stop")
+def stop_profiling():
+    """Stop the running profiling session, keeping its samples."""
+    profiler.stop()
+    return _status()
+
+
+@router.get("/profiling/status")
+def profiling_status():
+    """Return the status of the running or last profiling session."""
+    return _status()
+
+
+@router.get("/profiling/stacks", response_class=PlainTextResponse)
+def profiling_stacks():
+    """
+    Return the samples of the running or last session as collapsed stacks.
+
+    The output feeds straight into flamegraph.pl or speedscope.
+    """
+    session = profiler.session
+    return session.collapsed() if session is not None else ""
+
+
+@router.post("/resummarize", response_model=ResummarizeJobResponse)
+def start_resummarize(db: Session = Depends(get_db)):
+    """
+    Start re-summarizing articles whose summary version is outdated.
+
+    A paused or interrupted job for the current version resumes from its
+    checkpoint.
+
+    Returns:
+        ResummarizeJobResponse: The running job
+
+    Raises:
+        HTTPException: 409 if a job is already running
+                      503 if database unavailable
+    """
+    try:
+        job_id = resummarizer.start()
+        return db.get(resummarizer.job_model, job_id)
+    except ResummarizeJobActiveException as e:
+        logger.warning("Re-summarization start rejected: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=409, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        logger.error("Database error in start_resummarize: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503, detail="Unable to start the re-summarization job"
+        )
+
+
+@router.get("/resummarize", response_model=ResummarizeJobResponse)
+def resummarize_status(db: Session = Depends(get_db)):
+    """
+    Return the progress of the latest re-summarization job.
+
+    Raises:
+        HTTPException: 404 if no job has been started
+    """
+    job = resummarizer.latest_job(db)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "NotFound", "message": "No re-summarization job yet"},
+        )
+    return job
+
+
+@router.post("/resummarize/stop", response_model=ResummarizeJobResponse)
+def stop_resummarize(db: Session = Depends(get_db)):
+    """Pause the job running in this worker after its current batch."""
+    resummarizer.stop()
+    return resummarize_status(db)
+
+
+def _status() -> dict:
+    session = profiler.session
+    return session.status() if session is not None else {"active": False}
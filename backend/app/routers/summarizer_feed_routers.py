@@ -0,0 +1,148 @@
+"""
+Feed Subscription API Router Module.
+
+This module provides the routing logic for managing RSS/Atom feed
+subscriptions and triggering on-demand polls of a feed.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.logs.summarizer_logging import get_logger
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from backend.app.schemas.summarizer_schemas import (
+    FeedCreate,
+    FeedPollResponse,
+    FeedResponse,
+)
+from backend.app.services.summarizer_feed_services import FeedService
+from backend.app.db.summarizer_db import get_db
+from backend.app.exceptions.summarizer_exceptions import (
+    FeedNotFoundException,
+    ScrapeThrottledException,
+)
+
+logger = get_logger("routers")
+
+router = APIRouter()
+
+
+def get_feed_service(db: Session = Depends(get_db)) -> FeedService:
+    """
+    Dependency injection for the FeedService.
+
+    Args:
+        db (Session): Database session provided by FastAPI dependency system.
+
+    Returns:
+        FeedService: An instance of the feed service.
+    """
+    return FeedService(db)
+
+
+@router.post("/feeds/", response_model=FeedResponse)
+def create_feed(feed: FeedCreate, service=Depends(get_feed_service)):
+    """
+    Subscribe to an RSS or Atom feed.
+
+    Raises:
+        HTTPException: 503 if database unavailable
+                      500 for unexpected errors
+    """
+    try:
+        return service.create_feed(feed)
+    except SQLAlchemyError as e:
+        logger.error("Database error in create_feed: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "DatabaseError",
+                "message": "Database service unavailable",
+            },
+        )
+    except Exception as e:
+        logger.error("Unexpected error in create_feed: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+
+@router.get("/feeds/", response_model=list[FeedResponse])
+def read_feeds(service=Depends(get_feed_service)):
+    """
+    Retrieve all feed subscriptions.
+
+    Raises:
+        HTTPException: 503 if database unavailable
+    """
+    try:
+        return service.get_feeds()
+    except SQLAlchemyError as e:
+        logger.error("Database error in read_feeds: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503, detail="Unable to fetch feeds from database"
+        )
+
+
+@router.post("/feeds/{feed_id}/poll", response_model=FeedPollResponse)
+def poll_feed(feed_id: int, service=Depends(get_feed_service)):
+    """
+    Poll a feed immediately and enqueue its new items for summarization.
+
+    Raises:
+        HTTPException: 404 if feed not found
+                      503 if database unavailable or the feed host is throttling
+                      502 if the feed could not be fetched or parsed
+    """
+    try:
+        items = service.poll_feed(feed_id)
+        return FeedPollResponse(feed_id=feed_id, new_items=len(items))
+    except FeedNotFoundException as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except ScrapeThrottledException as e:
+        logger.warning("Feed poll throttled: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={"error": e.__class__.__name__, "message": str(e)},
+            headers={"Retry-After": str(max(1, round(e.retry_after)))},
+        )
+    except SQLAlchemyError as e:
+        logger.error("Database error in poll_feed: %s", e)
+        count_error(e)
+        raise HTTPException(status_code=503, detail=f"Unable to poll feed {feed_id}")
+    except Exception as e:
+        logger.error("Failed to poll feed %s: %s", feed_id, e)
+        count_error(e)
+        raise HTTPException(
+            status_code=502, detail={"error": "FeedFetchError", "message": str(e)}
+        )
+
+
+@router.delete("/feeds/{feed_id}")
+def delete_feed(feed_id: int, service=Depends(get_feed_service)):
+    """
+    Unsubscribe from a feed.
+
+    Raises:
+        HTTPException: 404 if feed not found
+                      503 if database unavailable
+    """
+    try:
+        service.delete_feed(feed_id)
+        return {"message": "Feed deleted successfully"}
+    except FeedNotFoundException as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        logger.error("Database error in delete_feed: %s", e)
+        count_error(e)
+        raise HTTPException(status_code=503, detail=f"Unable to delete feed {feed_id}")
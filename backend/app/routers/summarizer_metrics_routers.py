@@ -0,0 +1,22 @@
+"""
+Metrics API Router Module.
+
+This module exposes the service's Prometheus metrics for scraping.
+"""
+
+from fastapi import APIRouter, Response
+from backend.app.core.summarizer_metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """
+    Return all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: Metrics payload aggregated across workers in multiprocess mode.
+    """
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
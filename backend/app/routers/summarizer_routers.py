@@ -6,21 +6,45 @@ It handles article creation, retrieval, and deletion operations while managing
 error handling and database interactions.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from backend.app.logs.summarizer_logging import logger
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from backend.app.core.summarizer_admission import ingest_lane, run_ingestion
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.logs.summarizer_logging import get_logger
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from backend.app.schemas.summarizer_schemas import ArticleCreate, ArticleResponse
+from backend.app.schemas.summarizer_schemas import (
+    ArticleChangesResponse,
+    ArticleCreate,
+    ArticleDetailResponse,
+    ArticleResponse,
+    SimilarArticleResponse,
+)
+from backend.app.services.summarizer_article_cache import (
+    article_cache,
+    article_fragments,
+)
 from backend.app.services.summarizer_services import SummarizerService
-from backend.app.db.summarizer_db import get_db
+from backend.app.services.summarizer_similar_services import similar_articles
+from backend.app.services.summarizer_story_services import story_clusterer
+from backend.app.services.summarizer_user_services import feed_ranker
+from backend.app.db.summarizer_db import READ_PRIMARY_COOKIE, get_db, replicas
 from backend.app.exceptions.summarizer_exceptions import (
     ArticleNotFoundException,
     InvalidURLException,
     SummaryGenerationException,
     CategoryNotFoundException,
     ArticlesNotFoundForCategoryException,
+    OverloadedException,
+    ScrapeThrottledException,
 )
 
+logger = get_logger("routers")
+
 router = APIRouter()
 
 
@@ -34,46 +58,124 @@ def get_summarizer_service(db: Session = Depends(get_db)) -> SummarizerService:
     Returns:
         SummarizerService: An instance of the summarizer service.
     """
-    return SummarizerService(db)
+    return SummarizerService(
+        db,
+        ranker=feed_ranker,
+        similar=similar_articles,
+        clusterer=story_clusterer,
+        cache=article_cache,
+        fragments=article_fragments,
+    )
+
+
+class JSONFragmentsResponse(Response):
+    """A JSON array response assembled from already encoded objects."""
+
+    media_type = "application/json"
+
+    def render(self, content: List[bytes]) -> bytes:
+        return b"[" + b",".join(content) + b"]"
 
 
-@router.post("/articles/", response_model=ArticleResponse)
-def create_article(article: ArticleCreate, service=Depends(get_summarizer_service)):
+async def admit_ingestion():
+    """
+    Hold an ingestion slot for the duration of the request.
+
+    Raises:
+        HTTPException: 429 if too many submissions are waiting already
+                      503 if no slot freed up within INGEST_QUEUE_TIMEOUT
+    """
+    try:
+        await ingest_lane.acquire()
+    except OverloadedException as e:
+        logger.warning("Submission shed: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=429 if e.reason == "queue_full" else 503,
+            detail={"error": e.__class__.__name__, "message": str(e)},
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    began = time.monotonic()
+    try:
+        yield
+    finally:
+        ingest_lane.release(time.monotonic() - began)
+
+
+def _read_your_writes(response: Response):
+    """Send the client's reads to the primary until replicas have caught up."""
+    if replicas and settings.READ_YOUR_WRITES_SECONDS > 0:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+
+
+@router.post(
+    "/articles/",
+    response_model=ArticleResponse,
+    dependencies=[Depends(admit_ingestion)],
+)
+async def create_article(
+    article: ArticleCreate,
+    response: Response,
+    service=Depends(get_summarizer_service),
+):
     """
     Create a new article from a URL.
 
     Args:
         article (ArticleCreate): Article creation data containing URL.
+        response (Response): Carries the read-your-writes cookie.
         service (SummarizerService): Injected summarizer service.
 
     Returns:
         ArticleResponse: Created article details.
 
     Raises:
-        HTTPException: 503 if database unavailable
+        HTTPException: 503 if database unavailable, the source host is
+                      throttling scrapes or no ingestion slot freed up in time
+                      429 if too many submissions are already waiting
                       400 if validation fails
                       500 for unexpected errors
     """
     try:
-        return service.create_article(article)
+        created = await run_ingestion(service.create_article, article)
+        _read_your_writes(response)
+        return created
+    except ScrapeThrottledException as e:
+        logger.warning("Scrape throttled: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "ScrapeThrottledException", "message": str(e)},
+            headers={"Retry-After": str(max(1, round(e.retry_after)))},
+        )
     except InvalidURLException as e:
-        logger.error(f"Invalid URL error: {str(e)}")
+        logger.error("Invalid URL error: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=400, detail={"error": "InvalidURLException", "message": str(e)}
         )
     except SummaryGenerationException as e:
-        logger.error(f"Summary generation error: {str(e)}")
+        logger.error("Summary generation error: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=500,
             detail={"error": "SummaryGenerationException", "message": str(e)},
         )
     except ArticleNotFoundException as e:
-        logger.error(f"Application error: {str(e)}")
+        logger.error("Application error: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=400, detail={"error": e.__class__.__name__, "message": str(e)}
         )
     except SQLAlchemyError as e:
-        logger.error(f"Database error in create_article: {e}")
+        logger.error("Database error in create_article: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=503,
             detail={
@@ -82,18 +184,25 @@ def create_article(article: ArticleCreate, service=Depends(get_summarizer_servic
             },
         )
     except Exception as e:
-        logger.error(f"Unexpected error in create_article: {e}")
+        logger.error("Unexpected error in create_article: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=500, detail={"error": "InternalServerError", "message": str(e)}
         )
 
 
 @router.get("/articles/", response_model=list[ArticleResponse])
-def read_articles(service=Depends(get_summarizer_service)):
+def read_articles(
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    service=Depends(get_summarizer_service),
+):
     """
     Retrieve all articles in the system.
 
     Args:
+        created_after (datetime): Only articles ingested at or after this.
+        created_before (datetime): Only articles ingested before this.
         service (SummarizerService): Injected summarizer service.
 
     Returns:
@@ -104,32 +213,49 @@ def read_articles(service=Depends(get_summarizer_service)):
                       500 for unexpected errors
     """
     try:
-        return service.get_articles()
+        window = {"created_after": created_after, "created_before": created_before}
+        if settings.FAST_JSON:
+            return JSONFragmentsResponse(service.get_article_fragments(**window))
+        return service.get_articles(**window)
     except SQLAlchemyError as e:
-        logger.error(f"Database error in read_articles: {e}")
+        logger.error("Database error in read_articles: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=503, detail="Unable to fetch articles from database"
         )
     except Exception as e:
-        logger.error(f"Unexpected error in read_articles: {e}")
+        logger.error("Unexpected error in read_articles: %s", e)
+        count_error(e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 
 @router.get("/articles/category/{category}", response_model=list[ArticleResponse])
-def read_articles_by_category(category: str, service=Depends(get_summarizer_service)):
+def read_articles_by_category(
+    category: str,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    service=Depends(get_summarizer_service),
+):
     """
-    Retrieve articles filtered by category.
+    Retrieve articles filtered by category, and by ingestion time if given.
     """
     try:
-        return service.get_articles_by_category(category)
+        window = {"created_after": created_after, "created_before": created_before}
+        if settings.FAST_JSON:
+            return JSONFragmentsResponse(
+                service.get_article_fragments(category, **window)
+            )
+        return service.get_articles_by_category(category, **window)
     except (ArticlesNotFoundForCategoryException, CategoryNotFoundException) as e:
         # Handle both category-related exceptions
-        logger.warning(f"Category error: {str(e)}")
+        logger.warning("Category error: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
         ) from None
     except SQLAlchemyError as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=503,
             detail={
@@ -138,7 +264,8 @@ def read_articles_by_category(category: str, service=Depends(get_summarizer_serv
             },
         ) from None
     except Exception as e:
-        logger.error(f"Unexpected error in read_articles_by_category: {str(e)}")
+        logger.error("Unexpected error in read_articles_by_category: %s", e)
+        count_error(e)
         # Re-raise as HTTP 500 if it's truly unexpected
         raise HTTPException(
             status_code=500,
@@ -149,6 +276,176 @@ def read_articles_by_category(category: str, service=Depends(get_summarizer_serv
         ) from None
 
 
+@router.get("/articles/changes", response_model=ArticleChangesResponse)
+def read_article_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    service=Depends(get_summarizer_service),
+):
+    """
+    Retrieve article inserts, updates and deletions after a cursor (delta sync).
+
+    Args:
+        since (int): Cursor from the previous response; 0 for a full sync.
+        limit (int): Maximum number of changes.
+        service (SummarizerService): Injected summarizer service.
+
+    Returns:
+        ArticleChangesResponse: Changes in order, the cursor to pass next,
+        and whether more changes are waiting.
+
+    Raises:
+        HTTPException: 503 if database unavailable
+                      500 for unexpected errors
+    """
+    try:
+        return service.get_article_changes(since, limit)
+    except SQLAlchemyError as e:
+        logger.error("Database error in read_article_changes: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "DatabaseError",
+                "message": "Database service unavailable",
+            },
+        )
+    except Exception as e:
+        logger.error("Unexpected error in read_article_changes: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match names etag (weak comparison, RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+@router.get(
+    "/articles/{article_id}",
+    response_model=ArticleDetailResponse,
+    response_model_exclude_unset=True,
+)
+def read_article(
+    article_id: int,
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(None, pattern="^content$"),
+    service=Depends(get_summarizer_service),
+):
+    """
+    Retrieve a single article by its ID.
+
+    Args:
+        article_id (int): ID of the article.
+        include (str): "content" to include the article text.
+        service (SummarizerService): Injected summarizer service.
+
+    Returns:
+        ArticleDetailResponse: The article; content only when requested.
+        Responses carry an ETag and Cache-Control; a request whose
+        If-None-Match names the current ETag gets 304 Not Modified.
+
+    Raises:
+        HTTPException: 404 if article not found
+                      503 if database unavailable
+                      500 for unexpected errors
+    """
+    try:
+        entry = service.get_article_detail(article_id)
+    except ArticleNotFoundException as e:
+        logger.warning("Article not found: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        logger.error("Database error in read_article: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "DatabaseError",
+                "message": "Database service unavailable",
+            },
+        )
+    except Exception as e:
+        logger.error("Unexpected error in read_article: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+    # Each representation has its own tag
+    etag = f'"{entry.etag}-content"' if include else f'"{entry.etag}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.ARTICLE_CACHE_MAX_AGE}",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    if include:
+        return entry.article
+    return entry.article.model_dump(exclude={"content"})
+
+
+@router.get(
+    "/articles/{article_id}/similar", response_model=list[SimilarArticleResponse]
+)
+def read_similar_articles(
+    article_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    service=Depends(get_summarizer_service),
+):
+    """
+    Retrieve the articles most similar to an article ("more like this").
+
+    Args:
+        article_id (int): ID of the article.
+        limit (int): Maximum number of similar articles.
+        service (SummarizerService): Injected summarizer service.
+
+    Returns:
+        List[SimilarArticleResponse]: Similar articles, most similar first.
+
+    Raises:
+        HTTPException: 404 if article not found
+                      503 if database unavailable
+                      500 for unexpected errors
+    """
+    try:
+        return service.get_similar_articles(article_id, limit)
+    except ArticleNotFoundException as e:
+        logger.warning("Article not found: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        logger.error("Database error in read_similar_articles: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "DatabaseError",
+                "message": "Database service unavailable",
+            },
+        )
+    except Exception as e:
+        logger.error("Unexpected error in read_similar_articles: %s", e)
+        count_error(e)
+        raise HTTPException(
+            status_code=500, detail={"error": "InternalServerError", "message": str(e)}
+        )
+
+
 @router.delete("/articles/{article_id}")
 def delete_article(article_id: int, service=Depends(get_summarizer_service)):
     """
@@ -170,15 +467,18 @@ def delete_article(article_id: int, service=Depends(get_summarizer_service)):
         service.delete_article(article_id)
         return {"message": "Article deleted successfully"}
     except ArticleNotFoundException as e:
-        logger.error(f"Article not found: {str(e)}")
+        logger.error("Article not found: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
         )
     except SQLAlchemyError as e:
-        logger.error(f"Database error in delete_article: {e}")
+        logger.error("Database error in delete_article: %s", e)
+        count_error(e)
         raise HTTPException(
             status_code=503, detail=f"Unable to delete article {article_id}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error in delete_article: {e}")
+        logger.error("Unexpected error in delete_article: %s", e)
+        count_error(e)
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
@@ -0,0 +1,86 @@
+"""
+Story API Router Module.
+
+This module provides the routing logic for browsing stories: articles covering
+the same event, grouped together with one combined summary.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.logs.summarizer_logging import get_logger
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from backend.app.schemas.summarizer_schemas import (
+    StoryDetailResponse,
+    StoryResponse,
+)
+from backend.app.services.summarizer_story_services import StoryService
+from backend.app.db.summarizer_db import get_db
+from backend.app.exceptions.summarizer_exceptions import StoryNotFoundException
+
+logger = get_logger("routers")
+
+router = APIRouter()
+
+
+def get_story_service(db: Session = Depends(get_db)) -> StoryService:
+    """
+    Dependency injection for the StoryService.
+
+    Args:
+        db (Session): Database session provided by FastAPI dependency system.
+
+    Returns:
+        StoryService: An instance of the story service.
+    """
+    return StoryService(db)
+
+
+def _database_error(operation: str, e: SQLAlchemyError) -> HTTPException:
+    logger.error("Database error in %s: %s", operation, e)
+    count_error(e)
+    return HTTPException(
+        status_code=503,
+        detail={"error": "DatabaseError", "message": "Database service unavailable"},
+    )
+
+
+@router.get("/stories", response_model=list[StoryResponse])
+def read_stories(
+    category: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    service=Depends(get_story_service),
+):
+    """
+    Retrieve a page of stories, most recently updated first.
+
+    Raises:
+        HTTPException: 503 if database unavailable
+    """
+    try:
+        return service.get_stories(category, offset, limit)
+    except SQLAlchemyError as e:
+        raise _database_error("read_stories", e)
+
+
+@router.get("/stories/{story_id}", response_model=StoryDetailResponse)
+def read_story(story_id: int, service=Depends(get_story_service)):
+    """
+    Retrieve a story with its articles.
+
+    Raises:
+        HTTPException: 404 if story not found
+                      503 if database unavailable
+    """
+    try:
+        return service.get_story(story_id)
+    except StoryNotFoundException as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        raise _database_error("read_story", e)
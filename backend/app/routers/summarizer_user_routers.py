@@ -0,0 +1,153 @@
+"""
+User Profile and Personalized Feed API Router Module.
+
+This module provides the routing logic for managing user preference profiles
+(followed categories and keywords) and reading each user's precomputed feed.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.logs.summarizer_logging import get_logger
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from backend.app.schemas.summarizer_schemas import (
+    ArticleResponse,
+    UserProfileCreate,
+    UserProfileResponse,
+    UserProfileUpdate,
+)
+from backend.app.services.summarizer_user_services import UserService
+from backend.app.db.summarizer_db import get_db
+from backend.app.exceptions.summarizer_exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+)
+
+logger = get_logger("routers")
+
+router = APIRouter()
+
+
+def get_user_service(db: Session = Depends(get_db)) -> UserService:
+    """
+    Dependency injection for the UserService.
+
+    Args:
+        db (Session): Database session provided by FastAPI dependency system.
+
+    Returns:
+        UserService: An instance of the user service.
+    """
+    return UserService(db)
+
+
+def _not_found(e: UserNotFoundException) -> HTTPException:
+    count_error(e)
+    return HTTPException(
+        status_code=404, detail={"error": e.__class__.__name__, "message": str(e)}
+    )
+
+
+def _database_error(operation: str, e: SQLAlchemyError) -> HTTPException:
+    logger.error("Database error in %s: %s", operation, e)
+    count_error(e)
+    return HTTPException(
+        status_code=503,
+        detail={"error": "DatabaseError", "message": "Database service unavailable"},
+    )
+
+
+@router.post("/users/", response_model=UserProfileResponse)
+def create_user(user: UserProfileCreate, service=Depends(get_user_service)):
+    """
+    Create a user profile; its feed is built from recent articles.
+
+    Raises:
+        HTTPException: 409 if the name is taken
+                      503 if database unavailable
+    """
+    try:
+        return service.create_user(user)
+    except UserAlreadyExistsException as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=409, detail={"error": e.__class__.__name__, "message": str(e)}
+        )
+    except SQLAlchemyError as e:
+        raise _database_error("create_user", e)
+
+
+@router.get("/users/{user_id}", response_model=UserProfileResponse)
+def read_user(user_id: int, service=Depends(get_user_service)):
+    """
+    Retrieve a user profile.
+
+    Raises:
+        HTTPException: 404 if user not found
+                      503 if database unavailable
+    """
+    try:
+        return service.get_user(user_id)
+    except UserNotFoundException as e:
+        raise _not_found(e)
+    except SQLAlchemyError as e:
+        raise _database_error("read_user", e)
+
+
+@router.put("/users/{user_id}", response_model=UserProfileResponse)
+def update_user(
+    user_id: int, user: UserProfileUpdate, service=Depends(get_user_service)
+):
+    """
+    Change a user's followed categories or keywords; the feed is rebuilt.
+
+    Raises:
+        HTTPException: 404 if user not found
+                      503 if database unavailable
+    """
+    try:
+        return service.update_user(user_id, user)
+    except UserNotFoundException as e:
+        raise _not_found(e)
+    except SQLAlchemyError as e:
+        raise _database_error("update_user", e)
+
+
+@router.delete("/users/{user_id}")
+def delete_user(user_id: int, service=Depends(get_user_service)):
+    """
+    Delete a user profile and its feed.
+
+    Raises:
+        HTTPException: 404 if user not found
+                      503 if database unavailable
+    """
+    try:
+        service.delete_user(user_id)
+        return {"message": "User deleted successfully"}
+    except UserNotFoundException as e:
+        raise _not_found(e)
+    except SQLAlchemyError as e:
+        raise _database_error("delete_user", e)
+
+
+@router.get("/feed", response_model=list[ArticleResponse])
+def read_feed(
+    user_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    service=Depends(get_user_service),
+):
+    """
+    Retrieve a page of a user's personalized feed, best first.
+
+    Raises:
+        HTTPException: 404 if user not found
+                      503 if database unavailable
+    """
+    try:
+        return service.get_feed(user_id, offset, limit)
+    except UserNotFoundException as e:
+        raise _not_found(e)
+    except SQLAlchemyError as e:
+        raise _database_error("read_feed", e)
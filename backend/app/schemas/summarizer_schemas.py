@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 class ArticleBase(BaseModel):
@@ -28,6 +29,27 @@ class ArticleResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ArticleDetailResponse(ArticleResponse):
+    content: Optional[str] = None
+
+
+class SimilarArticleResponse(ArticleResponse):
+    similarity: float
+
+
+class ArticleChange(BaseModel):
+    op: Literal["insert", "update", "delete"]
+    id: int
+    changed_at: Optional[datetime] = None
+    article: Optional[ArticleResponse] = None
+
+
+class ArticleChangesResponse(BaseModel):
+    changes: List[ArticleChange]
+    cursor: int
+    has_more: bool
+
+
 class ArticleSummaryResponse(BaseModel):
     title: Optional[str] = None
     url: str
@@ -35,3 +57,71 @@ class ArticleSummaryResponse(BaseModel):
     summary: Optional[str] = None
     category: Optional[str] = None
     model_config = ConfigDict(from_attributes=True)
+
+
+class StoryResponse(BaseModel):
+    id: int
+    title: Optional[str] = None
+    summary: str
+    category: str
+    article_count: int
+    updated_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StoryDetailResponse(StoryResponse):
+    articles: List[ArticleResponse]
+
+
+class FeedCreate(BaseModel):
+    url: str
+    title: Optional[str] = None
+
+
+class FeedResponse(BaseModel):
+    id: int
+    url: str
+    title: Optional[str] = None
+    last_guid: Optional[str] = None
+    last_polled_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FeedPollResponse(BaseModel):
+    feed_id: int
+    new_items: int
+
+
+class UserProfileCreate(BaseModel):
+    name: str
+    categories: List[str] = []
+    keywords: List[str] = []
+
+
+class UserProfileUpdate(BaseModel):
+    categories: Optional[List[str]] = None
+    keywords: Optional[List[str]] = None
+
+
+class UserProfileResponse(BaseModel):
+    id: int
+    name: str
+    categories: List[str]
+    keywords: List[str]
+    created_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResummarizeJobResponse(BaseModel):
+    id: int
+    target_version: str
+    status: str
+    last_article_id: int
+    total: int
+    processed: int
+    failed: int
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,161 @@
+"""
+Article Cache Module.
+
+A bounded in-process LRU of recently read articles for GET /articles/{id}.
+Entries hold the validated article with its content and an ETag derived from
+it, so repeated reads of hot articles skip the database entirely.
+
+Deleting or re-summarizing an article invalidates its entry in this process.
+Other worker processes keep their copy for at most ARTICLE_CACHE_TTL seconds.
+
+ArticleFragments caches the JSON encoding of articles in list responses. Its
+entries are keyed by id and summary_version, the only columns whose change
+alters a listed article, so they never need invalidating.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Optional
+
+from backend.app.core.summarizer_config import settings
+from backend.app.schemas.summarizer_schemas import (
+    ArticleDetailResponse,
+    ArticleResponse,
+)
+
+
+class CachedArticle(NamedTuple):
+    article: ArticleDetailResponse
+    etag: str
+    expires: float
+
+    @classmethod
+    def of(cls, article: ArticleDetailResponse, ttl: float = 0.0) -> "CachedArticle":
+        """Wrap an article with an entity tag (unquoted) derived from its fields."""
+        digest = hashlib.blake2b(
+            article.model_dump_json().encode(), digest_size=8
+        ).hexdigest()
+        return cls(article, f"{article.id}-{digest}", time.monotonic() + ttl)
+
+
+class ArticleCache:
+    """Thread-safe LRU of articles keyed by id, with a time-to-live."""
+
+    def __init__(
+        self,
+        max_size: int = settings.ARTICLE_CACHE_SIZE,
+        ttl: float = settings.ARTICLE_CACHE_TTL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum cached articles; 0 disables caching
+            ttl (float): Seconds an entry is served before it is reloaded
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, CachedArticle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """
+        Changes whenever an entry is invalidated. Read it before loading an
+        article and pass it to put(), so a load that raced with a delete is
+        not cached.
+        """
+        return self._generation
+
+    def get(self, article_id: int) -> Optional[CachedArticle]:
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                del self._entries[article_id]
+                return None
+            self._entries.move_to_end(article_id)
+            return entry
+
+    def put(self, article: ArticleDetailResponse, generation: int) -> CachedArticle:
+        """Cache an article loaded while generation was current."""
+        entry = CachedArticle.of(article, self.ttl)
+        with self._lock:
+            if self.max_size <= 0 or generation != self._generation:
+                return entry
+            self._entries[article.id] = entry
+            self._entries.move_to_end(article.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, article_id: int):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(article_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class ArticleFragments:
+    """Thread-safe LRU of articles encoded as ArticleResponse JSON."""
+
+    # Columns a list query selects; rows are validated from them directly
+    COLUMNS = ("id", "summary_version", "title", "url", "summary", "category")
+
+    def __init__(self, max_size: int = settings.ARTICLE_FRAGMENT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum cached fragments; 0 disables caching
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def encode(self, rows: Iterable) -> List[bytes]:
+        """
+        JSON fragments for rows with the attributes in COLUMNS, in row order.
+
+        Rows already seen at the same summary_version are served from the
+        cache; the others are validated and encoded with orjson.
+        """
+        import orjson
+
+        rows = list(rows)
+        keys = [(row.id, row.summary_version) for row in rows]
+        with self._lock:
+            fragments = [self._entries.get(key) for key in keys]
+        encoded = {}
+        for i, fragment in enumerate(fragments):
+            if fragment is None:
+                article = ArticleResponse.model_validate(rows[i])
+                fragments[i] = encoded[keys[i]] = orjson.dumps(article.model_dump())
+        if self.max_size <= 0:
+            return fragments
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            self._entries.update(encoded)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return fragments
+
+
+article_cache = ArticleCache()
+article_fragments = ArticleFragments()
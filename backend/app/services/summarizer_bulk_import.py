@@ -0,0 +1,564 @@
+"""
+Bulk Article Import Module.
+
+Loads archived pages into the articles table without going through the HTTP
+API one URL at a time. Inputs are WARC files (.warc or .warc.gz) and
+directories of HTML files, read as streams. Pages are parsed in a process
+pool with the same extraction as scrape_article, and rows are loaded in
+chunks with COPY into a staging table followed by one INSERT per chunk that
+skips URLs already stored, as the API does.
+
+Summarizing is optional. With --summarize, articles go through the LLM
+batcher at no more than --llm-rate articles per second. Without it they are
+stored with an empty summary and no summary_version, and the re-summarization
+job fills them in later.
+
+After each chunk is committed, the number of input records consumed is
+written to a checkpoint file. A rerun with the same inputs continues after
+them. Memory stays flat because the inputs are streamed, a bounded number of
+pages is in flight, and rows are loaded chunk by chunk.
+
+Imported articles have no embeddings until the similar-articles backfill runs
+(python -m backend.app.services.summarizer_similar_services).
+
+Usage:
+    python -m backend.app.services.summarizer_bulk_import PATH [PATH ...]
+        [--base-url URL] [--workers N] [--chunk-size N] [--summarize]
+        [--llm-concurrency N] [--llm-rate R] [--checkpoint FILE]
+        [--report-interval S]
+"""
+
+import argparse
+import gzip
+import io
+import itertools
+import json
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import engine as default_engine
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.services.summarizer_service_helpers import (
+    parse_article,
+    summary_version,
+)
+
+logger = get_logger("bulk_import")
+
+HTML_SUFFIXES = (".html", ".htm")
+WARC_SUFFIXES = (".warc", ".warc.gz")
+# Larger archived responses are skipped rather than read into memory
+MAX_RECORD_BYTES = 10 * 2**20
+# articles.url and articles.title are VARCHAR(255)
+MAX_URL_LENGTH = 255
+MAX_TITLE_LENGTH = 255
+
+COLUMNS = ("url", "title", "content", "summary", "category", "summary_version")
+STAGING_TABLE = "article_import"
+PROGRESS_KEYS = ("records", "imported", "duplicates", "failed", "summarized")
+
+
+class Page(NamedTuple):
+    url: str
+    # The page itself, or the file to read it from in the worker process
+    html: Union[bytes, Path]
+    # Prefer the page's canonical link over url, for pages saved to disk
+    canonical: bool
+
+
+class Extracted(NamedTuple):
+    url: str
+    title: str
+    text: str
+
+
+def iter_html_dir(root: Path, base_url: Optional[str] = None) -> Iterator[Page]:
+    """
+    HTML files under root, in a stable order.
+
+    A page without a canonical link gets the URL base_url/<relative path>,
+    or its file:// URI without base_url.
+    """
+    for directory, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.lower().endswith(HTML_SUFFIXES):
+                continue
+            path = Path(directory) / name
+            if base_url:
+                url = f"{base_url.rstrip('/')}/{path.relative_to(root).as_posix()}"
+            else:
+                url = path.resolve().as_uri()
+            yield Page(url, path, True)
+
+
+def iter_warc(path: Path) -> Iterator[Page]:
+    """Successful HTML responses and HTML resources archived in a WARC file."""
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        while True:
+            headers = _warc_headers(f)
+            if headers is None:
+                return
+            length = int(headers.get("content-length", 0))
+            record_type = headers.get("warc-type")
+            content_type = headers.get("content-type", "")
+            url = headers.get("warc-target-uri", "").strip("<>")
+            wanted = (
+                record_type == "response"
+                and content_type.startswith("application/http")
+            ) or (record_type == "resource" and "html" in content_type)
+            if not wanted or not url or length > MAX_RECORD_BYTES:
+                f.seek(length, os.SEEK_CUR)
+                continue
+            block = f.read(length)
+            html = block if record_type == "resource" else _http_html(block)
+            if html is not None:
+                yield Page(url, html, False)
+
+
+def _warc_headers(f) -> Optional[Dict[str, str]]:
+    """Headers of the next WARC record, or None at the end of the file."""
+    line = f.readline()
+    # Records are separated by blank lines
+    while line in (b"\r\n", b"\n"):
+        line = f.readline()
+    if not line:
+        return None
+    if not line.startswith(b"WARC/"):
+        raise ValueError(f"Expected a WARC record, found {line[:40]!r}")
+    headers = {}
+    while True:
+        line = f.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("utf-8", "replace").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def _http_html(block: bytes) -> Optional[bytes]:
+    """The body of an archived HTTP response if it is a successful HTML page."""
+    head, _, body = block.partition(b"\r\n\r\n")
+    status_line, *lines = head.decode("latin-1").split("\r\n")
+    status = status_line.split(" ", 2)
+    if len(status) < 2 or status[1] != "200":
+        return None
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+    if "html" not in headers.get("content-type", ""):
+        return None
+    try:
+        if "chunked" in headers.get("transfer-encoding", ""):
+            body = _dechunk(body)
+        encoding = headers.get("content-encoding", "")
+        if encoding in ("gzip", "x-gzip"):
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+    except (OSError, ValueError, zlib.error) as e:
+        logger.warning("Skipping undecodable archived response: %s", e)
+        return None
+    return body
+
+
+def _dechunk(body: bytes) -> bytes:
+    chunks, position = [], 0
+    while True:
+        end = body.index(b"\r\n", position)
+        size = int(body[position:end].split(b";")[0], 16)
+        if size == 0:
+            return b"".join(chunks)
+        chunks.append(body[end + 2 : end + 2 + size])
+        position = end + 2 + size + 2
+
+
+def iter_pages(inputs: Iterable[Path], base_url: Optional[str] = None):
+    for path in inputs:
+        if path.is_dir():
+            yield from iter_html_dir(path, base_url)
+        elif path.name.endswith(WARC_SUFFIXES):
+            yield from iter_warc(path)
+        else:
+            raise ValueError(f"Not a WARC file or a directory: {path}")
+
+
+def extract(page: Page) -> Optional[Extracted]:
+    """Parse a page, in a worker process; None if it has no usable article."""
+    try:
+        html = page.html.read_bytes() if isinstance(page.html, Path) else page.html
+        article = parse_article(page.url, html)
+    except Exception as e:
+        logger.warning("Failed to parse %s: %s", page.url, e)
+        return None
+    content = article.text.strip()
+    url = (page.canonical and article.canonical_link) or page.url
+    if not content or len(url) > MAX_URL_LENGTH:
+        return None
+    return Extracted(url, (article.title or "")[:MAX_TITLE_LENGTH], content)
+
+
+def ordered_map(executor: Executor, fn: Callable, items: Iterable, window: int):
+    """executor.map with at most window items submitted ahead of the consumer."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class RateLimiter:
+    """Space calls evenly, at most rate per second across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next)
+            self._next = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\x00", "")
+    )
+
+
+def copy_rows(conn: Connection, table: str, columns: Iterable[str], rows):
+    """Load rows into table with COPY, in the connection's transaction."""
+    data = "".join("\t".join(map(_copy_value, row)) + "\n" for row in rows)
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(data)
+        else:  # psycopg2
+            cursor.copy_expert(sql, io.StringIO(data))
+    finally:
+        cursor.close()
+
+
+def load_checkpoint(path: Optional[Path], inputs: List[str]) -> Dict[str, int]:
+    """
+    Progress recorded for these inputs, or zeros without a checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint was written for other inputs
+    """
+    progress = dict.fromkeys(PROGRESS_KEYS, 0)
+    if path is None or not path.exists():
+        return progress
+    checkpoint = json.loads(path.read_text())
+    if checkpoint["inputs"] != inputs:
+        raise ValueError(
+            f"Checkpoint {path} is for other inputs: {checkpoint['inputs']}"
+        )
+    progress.update({key: checkpoint[key] for key in PROGRESS_KEYS})
+    return progress
+
+
+def save_checkpoint(path: Path, inputs: List[str], progress: Dict[str, int]):
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps({"inputs": inputs, **progress}, indent=2))
+    os.replace(temporary, path)
+
+
+class BulkImporter:
+    """Parse archived pages in parallel and load them in COPY chunks."""
+
+    def __init__(
+        self,
+        engine: Engine = default_engine,
+        schema: str = "summary",
+        table: str = "articles",
+        workers: int = os.cpu_count() or 1,
+        chunk_size: int = 500,
+        summarize: Optional[Callable[[str], dict]] = None,
+        llm_concurrency: int = settings.RESUMMARIZE_CONCURRENCY,
+        llm_rate: float = 2.0,
+        max_tasks_per_child: int = 1000,
+        report_interval: float = 10.0,
+        report: Callable[[str], None] = print,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            engine (Engine): Database to load into
+            schema (str): Schema of the articles table
+            table (str): Articles table
+            workers (int): Parser processes; 0 parses in this process
+            chunk_size (int): Records per COPY, transaction and checkpoint
+            summarize (Callable): Returns {'summary', 'category'} for content;
+                None stores articles unsummarized
+            llm_concurrency (int): Concurrent summarize calls
+            llm_rate (float): Articles summarized per second at most; 0 is
+                unlimited
+            max_tasks_per_child (int): Pages a parser process handles before
+                it is replaced, bounding parser memory growth
+            report_interval (float): Seconds between progress reports
+            report (Callable): Receives each progress line
+        """
+        self.engine = engine
+        self.schema = schema
+        self.table = table
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.summarize = summarize
+        self.llm_concurrency = llm_concurrency
+        self.limiter = RateLimiter(llm_rate)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.report_interval = report_interval
+        self.report = report
+
+    def run(
+        self,
+        inputs: List[Path],
+        base_url: Optional[str] = None,
+        checkpoint: Optional[Path] = None,
+    ) -> Dict[str, int]:
+        """
+        Import the inputs, continuing after the records in the checkpoint.
+
+        Returns:
+            dict: Totals of records read, articles imported, duplicate URLs
+                skipped, pages without an article, and articles summarized
+
+        Raises:
+            ValueError: If an input is neither a WARC file nor a directory,
+                or the checkpoint is for other inputs
+        """
+        for path in inputs:
+            if not (path.is_dir() or path.name.endswith(WARC_SUFFIXES)):
+                raise ValueError(f"Not a WARC file or a directory: {path}")
+        names = [str(path.resolve()) for path in inputs]
+        progress = load_checkpoint(checkpoint, names)
+        if progress["records"]:
+            self.report(f"Resuming after {progress['records']} records")
+        pages = itertools.islice(
+            iter_pages(inputs, base_url), progress["records"], None
+        )
+        pool = (
+            ProcessPoolExecutor(
+                self.workers, max_tasks_per_child=self.max_tasks_per_child
+            )
+            if self.workers > 0
+            else nullcontext()
+        )
+        started = last_report = time.monotonic()
+        first_record = progress["records"]
+        with pool, ThreadPoolExecutor(
+            max_workers=self.llm_concurrency, thread_name_prefix="bulk-import-llm"
+        ) as llm:
+            if self.workers > 0:
+                results = ordered_map(pool, extract, pages, self.workers * 4)
+            else:
+                results = map(extract, pages)
+            while True:
+                chunk = list(itertools.islice(results, self.chunk_size))
+                if not chunk:
+                    break
+                self._load_chunk(chunk, progress, llm)
+                if checkpoint is not None:
+                    save_checkpoint(checkpoint, names, progress)
+                now = time.monotonic()
+                if now - last_report >= self.report_interval:
+                    self._report(
+                        progress, progress["records"] - first_record, now - started
+                    )
+                    last_report = now
+        self._report(
+            progress, progress["records"] - first_record, time.monotonic() - started
+        )
+        return progress
+
+    def _load_chunk(self, chunk: List[Optional[Extracted]], progress, llm: Executor):
+        articles = [article for article in chunk if article is not None]
+        if self.summarize is not None:
+            # Spend no LLM calls on articles that are stored already
+            stored = self._stored_urls([article.url for article in articles])
+            fresh = [article for article in articles if article.url not in stored]
+            rows = list(llm.map(self._summarized_row, fresh))
+        else:
+            rows = [self._row(article, None) for article in articles]
+        imported = self._insert(rows)
+        progress["records"] += len(chunk)
+        progress["failed"] += len(chunk) - len(articles)
+        progress["imported"] += imported
+        progress["duplicates"] += len(articles) - imported
+        progress["summarized"] += sum(1 for row in rows if row[-1] is not None)
+
+    def _stored_urls(self, urls: List[str]) -> Set[str]:
+        if not urls:
+            return set()
+        with self.engine.connect() as conn:
+            return set(
+                conn.execute(
+                    text(
+                        f"SELECT url FROM {self.schema}.{self.table}"
+                        " WHERE url = ANY(:urls)"
+                    ),
+                    {"urls": urls},
+                ).scalars()
+            )
+
+    def _summarized_row(self, article: Extracted) -> tuple:
+        self.limiter.wait()
+        try:
+            return self._row(article, self.summarize(article.text))
+        except Exception as e:
+            # Stored unsummarized; the re-summarization job retries it
+            logger.error("Failed to summarize %s: %s", article.url, e)
+            count_error(e)
+            return self._row(article, None)
+
+    @staticmethod
+    def _row(article: Extracted, data: Optional[dict]) -> tuple:
+        if data is None:
+            summary, category, version = "", settings.DEFAULT_CATEGORY, None
+        else:
+            summary, category = data["summary"], data["category"]
+            version = summary_version()
+        return (
+            article.url,
+            article.title,
+            article.text,
+            summary,
+            category.lower(),
+            version,
+        )
+
+    def _insert(self, rows: List[tuple]) -> int:
+        """Load rows and return how many were new; one transaction."""
+        # Imported here: the services import the models next to the database
+        from backend.app.services.summarizer_services import lock_article_changes
+
+        if not rows:
+            return 0
+        columns = ", ".join(COLUMNS)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE}"
+                    " (ordinal INTEGER, url TEXT, title TEXT, content TEXT,"
+                    " summary TEXT, category TEXT, summary_version TEXT)"
+                    " ON COMMIT DELETE ROWS"
+                )
+            )
+            copy_rows(
+                conn,
+                STAGING_TABLE,
+                ("ordinal", *COLUMNS),
+                ((i, *row) for i, row in enumerate(rows)),
+            )
+            # New rows draw change_seq values; keep them in commit order
+            lock_article_changes(conn)
+            result = conn.execute(
+                text(
+                    f"INSERT INTO {self.schema}.{self.table} ({columns})"
+                    f" SELECT DISTINCT ON (i.url) {columns}"
+                    f" FROM {STAGING_TABLE} i WHERE NOT EXISTS ("
+                    f"SELECT 1 FROM {self.schema}.{self.table} a"
+                    " WHERE a.url = i.url) ORDER BY i.url, i.ordinal"
+                )
+            )
+        return result.rowcount
+
+    def _report(self, progress: Dict[str, int], records: int, elapsed: float):
+        rate = records / elapsed if elapsed > 0 else 0.0
+        self.report(
+            f"{progress['records']} records: {progress['imported']} imported,"
+            f" {progress['duplicates']} duplicates, {progress['failed']} without"
+            f" an article, {progress['summarized']} summarized"
+            f" ({rate:.1f} records/s)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="WARC files (.warc, .warc.gz) or directories of HTML files",
+    )
+    parser.add_argument(
+        "--base-url", help="URL prefix of HTML files without a canonical link"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--summarize", action="store_true")
+    parser.add_argument(
+        "--llm-concurrency", type=int, default=settings.RESUMMARIZE_CONCURRENCY
+    )
+    parser.add_argument(
+        "--llm-rate", type=float, default=2.0, help="articles per second, 0 unlimited"
+    )
+    parser.add_argument(
+        "--checkpoint", type=Path, default=Path("bulk_import_checkpoint.json")
+    )
+    parser.add_argument("--report-interval", type=float, default=10.0)
+    args = parser.parse_args()
+
+    summarize = None
+    if args.summarize:
+        from backend.app.services.summarizer_llm_batcher import llm_batcher
+
+        summarize = llm_batcher.summarize
+    importer = BulkImporter(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        summarize=summarize,
+        llm_concurrency=args.llm_concurrency,
+        llm_rate=args.llm_rate,
+        report_interval=args.report_interval,
+    )
+    try:
+        importer.run(args.inputs, args.base_url, args.checkpoint)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
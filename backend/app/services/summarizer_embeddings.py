@@ -0,0 +1,93 @@
+"""
+Article Embedding Module.
+
+Turns article text into unit-length float32 vectors for similar-article
+search. HashingEmbedder, the default, runs locally and needs no vocabulary or
+model: words and word pairs are hashed into a fixed number of signed
+dimensions, weighted by sublinear term frequency. AzureOpenAIEmbedder calls
+the embeddings deployment through the client used for summarization.
+
+Each embedder has a version that is stored with the vectors it produced,
+since vectors from different embedders or dimensions are not comparable.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import List
+
+import numpy as np
+
+from backend.app.core.summarizer_config import settings
+from backend.app.services.summarizer_service_helpers import create_embeddings
+from backend.app.services.summarizer_vector_index import normalize
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his in is it"
+    " its of on or said she that the their they this to was were which will with"
+    " would".split()
+)
+
+
+def embedding_text(title: str, content: str, max_words: int) -> str:
+    """Title and the start of the content, as embedded."""
+    return " ".join(f"{title or ''} {content or ''}".split()[:max_words])
+
+
+class HashingEmbedder:
+    """Feature-hashed bag of words and word pairs."""
+
+    def __init__(self, dim: int = settings.EMBEDDING_DIM):
+        self.dim = dim
+        self.version = f"hashing-v1:{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Return one unit-length row per text."""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = [w for w in _WORD.findall(text.lower()) if w not in STOP_WORDS]
+            features = Counter(words)
+            features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+            for feature, count in features.items():
+                digest = int.from_bytes(
+                    hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+                )
+                # The top bit picks the sign, so collisions tend to cancel out
+                sign = 1.0 if digest >> 63 else -1.0
+                vectors[row, digest % self.dim] += sign * (1.0 + math.log(count))
+        return normalize(vectors)
+
+
+class AzureOpenAIEmbedder:
+    """Vectors from the Azure OpenAI embeddings deployment."""
+
+    def __init__(self, dim: int = settings.EMBEDDING_DIM):
+        self.dim = dim
+        self.version = f"azure:{settings.AZURE_OPENAI_EMBEDDING_MODEL}:{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Return one unit-length row per text, from a single request."""
+        return normalize(np.array(create_embeddings(texts, self.dim), ndmin=2))
+
+
+def get_embedder(backend: str = None, dim: int = None):
+    """
+    Create the configured embedder.
+
+    Args:
+        backend (str): 'hashing' or 'azure' (defaults to EMBEDDING_BACKEND)
+        dim (int): Vector dimensions (defaults to EMBEDDING_DIM)
+
+    Raises:
+        ValueError: For an unknown backend
+    """
+    backend = backend or settings.EMBEDDING_BACKEND
+    dim = dim or settings.EMBEDDING_DIM
+    if backend == "hashing":
+        return HashingEmbedder(dim)
+    if backend == "azure":
+        return AzureOpenAIEmbedder(dim)
+    raise ValueError(f"Unknown embedding backend: {backend}")
@@ -0,0 +1,413 @@
+"""
+Feed Subscription Service Module.
+
+This module polls subscribed RSS/Atom feeds and hands newly published items to
+the article summarization pipeline. Feeds are fetched with conditional GETs and
+parsed incrementally, stopping at the last item seen on the previous poll, so
+large feeds are never built in memory.
+"""
+
+import queue
+import threading
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.app.core.summarizer_admission import lower_thread_priority
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.exceptions.summarizer_exceptions import FeedNotFoundException
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.models.summarizer_models import Feed
+from backend.app.schemas.summarizer_schemas import ArticleCreate, FeedCreate
+from backend.app.services.summarizer_scrape_scheduler import scrape_scheduler
+from backend.app.services.summarizer_similar_services import similar_articles
+from backend.app.services.summarizer_story_services import story_clusterer
+from backend.app.services.summarizer_user_services import feed_ranker
+
+logger = get_logger("feeds")
+
+
+class FeedItem(NamedTuple):
+    guid: str
+    link: str
+    title: Optional[str]
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag name."""
+    return tag.rpartition("}")[2]
+
+
+def _item_from_element(elem: ET.Element) -> Optional[FeedItem]:
+    """Build a FeedItem from an RSS <item> or Atom <entry> element."""
+    guid = link = title = None
+    for child in elem:
+        name = _local_name(child.tag)
+        if name in ("guid", "id"):
+            guid = (child.text or "").strip() or None
+        elif name == "title":
+            title = (child.text or "").strip() or None
+        elif name == "link":
+            # RSS carries the URL as text, Atom as an href attribute
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip() or None
+            elif child.get("rel", "alternate") == "alternate":
+                link = href.strip()
+    if not link:
+        return None
+    return FeedItem(guid=guid or link, link=link, title=title)
+
+
+def iter_feed_items(
+    source, stop_guid: Optional[str] = None, max_items: Optional[int] = None
+) -> Iterator[FeedItem]:
+    """
+    Stream items from an RSS or Atom document, newest first.
+
+    Parsed items are detached from the tree as soon as they are yielded, and
+    parsing stops at the first item matching stop_guid, so only the unseen head
+    of the feed is ever read.
+
+    Args:
+        source: File-like object or path containing the feed XML
+        stop_guid (str, optional): GUID of the newest item seen previously
+        max_items (int, optional): Maximum number of items to yield
+
+    Yields:
+        FeedItem: GUID, link and title of each new item
+    """
+    parents: List[ET.Element] = []
+    count = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if _local_name(elem.tag) not in ("item", "entry"):
+            continue
+        item = _item_from_element(elem)
+        if parents:
+            parents[-1].remove(elem)
+        if item is None:
+            continue
+        if stop_guid is not None and item.guid == stop_guid:
+            return
+        yield item
+        count += 1
+        if max_items is not None and count >= max_items:
+            return
+
+
+class IngestQueue:
+    """
+    Bounded queue of article URLs summarized by background worker threads.
+
+    Workers start lazily on the first submission and each opens its own
+    database session per item.
+    """
+
+    def __init__(self, workers: int, maxsize: int, session_factory=SessionLocal):
+        self.workers = workers
+        self.session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, url: str) -> bool:
+        """
+        Queue an article URL for summarization.
+
+        Args:
+            url (str): Article URL discovered in a feed
+
+        Returns:
+            bool: False if the queue is full and the URL was dropped
+        """
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(url)
+            return True
+        except queue.Full:
+            logger.warning("Ingest queue full, dropping feed item: %s", url)
+            return False
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self):
+        """Signal the workers to exit once the queue has drained."""
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+
+    def _ensure_workers(self):
+        if self._threads:
+            return
+        with self._lock:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._work, name="feed-ingest", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        # Imported here to avoid a circular import with the summarizer service
+        from backend.app.services.summarizer_services import SummarizerService
+
+        lower_thread_priority()
+        while True:
+            url = self._queue.get()
+            if url is None:
+                return
+            db = self.session_factory()
+            try:
+                SummarizerService(
+                    db,
+                    ranker=feed_ranker,
+                    similar=similar_articles,
+                    clusterer=story_clusterer,
+                ).create_article(ArticleCreate(url=url))
+            except Exception as e:
+                logger.error("Failed to ingest feed item %s: %s", url, e)
+                count_error(e)
+            finally:
+                db.close()
+
+
+ingest_queue = IngestQueue(
+    workers=settings.FEED_INGEST_WORKERS, maxsize=settings.FEED_INGEST_QUEUE_SIZE
+)
+
+
+class FeedService:
+    """
+    Service class managing feed subscriptions and polling them for new items.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        model=Feed,
+        enqueue: Callable[[str], bool] = ingest_queue.submit,
+    ):
+        """
+        Initialize the feed service.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            model: Database model class (defaults to Feed)
+            enqueue (Callable): Receives the URL of every new feed item
+        """
+        self.db = db
+        self.model = model
+        self.enqueue = enqueue
+
+    def create_feed(self, feed_create: FeedCreate) -> Feed:
+        """
+        Subscribe to a feed, returning the existing subscription for a known URL.
+
+        Args:
+            feed_create (FeedCreate): Feed URL and optional title
+
+        Returns:
+            Feed: Created or existing feed instance
+        """
+        try:
+            existing_feed = (
+                self.db.query(self.model)
+                .filter(self.model.url == feed_create.url)
+                .first()
+            )
+            if existing_feed:
+                logger.info("Feed with URL %s already exists", feed_create.url)
+                return existing_feed
+            feed = self.model(url=feed_create.url, title=feed_create.title)
+            self.db.add(feed)
+            self.db.commit()
+            self.db.refresh(feed)
+            logger.info("Feed created successfully: %s", feed.id)
+            return feed
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to create feed: %s", e)
+            raise
+
+    def get_feed(self, feed_id: int) -> Feed:
+        """
+        Retrieve a single feed by its ID.
+
+        Raises:
+            FeedNotFoundException: If feed doesn't exist
+        """
+        feed = self.db.query(self.model).filter(self.model.id == feed_id).first()
+        if not feed:
+            raise FeedNotFoundException(feed_id)
+        return feed
+
+    def get_feeds(self) -> List[Feed]:
+        """Retrieve all feed subscriptions."""
+        return self.db.query(self.model).order_by(self.model.id).all()
+
+    def delete_feed(self, feed_id: int):
+        """
+        Unsubscribe from a feed.
+
+        Raises:
+            FeedNotFoundException: If feed doesn't exist
+        """
+        try:
+            feed = self.get_feed(feed_id)
+            self.db.delete(feed)
+            self.db.commit()
+            logger.info("Feed deleted successfully: %s", feed_id)
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to delete feed %s: %s", feed_id, e)
+            raise
+
+    def poll_feed(self, feed_id: int) -> List[FeedItem]:
+        """
+        Fetch a feed and enqueue the items published since the last poll.
+
+        At most FEED_MAX_ITEMS_PER_POLL items are taken, the oldest ones, and
+        taking stops at the first item the ingest queue rejects; the rest are
+        left for the next poll, which fetches the feed in full again.
+
+        Args:
+            feed_id (int): ID of the feed to poll
+
+        Returns:
+            List[FeedItem]: New items enqueued, newest first
+
+        Raises:
+            FeedNotFoundException: If feed doesn't exist
+            ScrapeThrottledException: If the feed host is throttling us
+        """
+        feed = self.get_feed(feed_id)
+        headers = {"User-Agent": scrape_scheduler.user_agent}
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+        request = urllib.request.Request(feed.url, headers=headers)
+
+        items: List[FeedItem] = []
+        deferred = 0
+        validators = None
+        try:
+            with scrape_scheduler.slot(feed.url):
+                with urllib.request.urlopen(
+                    request, timeout=scrape_scheduler.timeout
+                ) as response:
+                    # Streamed newest first; only the oldest new items are kept
+                    oldest = deque(maxlen=settings.FEED_MAX_ITEMS_PER_POLL)
+                    for item in iter_feed_items(response, stop_guid=feed.last_guid):
+                        if len(oldest) == oldest.maxlen:
+                            deferred += 1
+                        oldest.append(item)
+                    items = list(oldest)
+                    validators = (
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            logger.info("Feed %s not modified since last poll", feed_id)
+
+        # Oldest first, so articles are summarized in publication order. The
+        # last seen guid only moves past items the queue accepted.
+        enqueued: List[FeedItem] = []
+        for item in reversed(items):
+            if not self.enqueue(item.link):
+                break
+            enqueued.append(item)
+        rejected = len(items) - len(enqueued)
+        if enqueued:
+            feed.last_guid = enqueued[-1].guid
+        if validators is not None and not deferred and not rejected:
+            # Otherwise the next poll must not get a 304
+            feed.etag, feed.last_modified = validators
+        feed.last_polled_at = datetime.now(timezone.utc)
+        self.db.commit()
+
+        logger.info("Polled feed %s: %s new items", feed_id, len(enqueued))
+        if deferred or rejected:
+            logger.info(
+                "Feed %s has %s more new items, left for the next poll",
+                feed_id,
+                deferred + rejected,
+            )
+        return enqueued[::-1]
+
+    def poll_all_feeds(self) -> int:
+        """
+        Poll every subscribed feed, skipping feeds that fail.
+
+        Returns:
+            int: Total number of new items enqueued
+        """
+        total = 0
+        for (feed_id,) in self.db.query(self.model.id).order_by(self.model.id).all():
+            try:
+                total += len(self.poll_feed(feed_id))
+            except Exception as e:
+                self.db.rollback()
+                logger.error("Failed to poll feed %s: %s", feed_id, e)
+                count_error(e)
+        return total
+
+
+class FeedPoller:
+    """Background thread polling all feeds every FEED_POLL_INTERVAL seconds."""
+
+    def __init__(self, interval: float, session_factory=SessionLocal):
+        self.interval = interval
+        self.session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="feed-poller", daemon=True
+        )
+        self._thread.start()
+        logger.info("Feed poller started with interval %ss", self.interval)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Feed poller stopped")
+
+    def _run(self):
+        while not self._stop.is_set():
+            db = self.session_factory()
+            try:
+                FeedService(db).poll_all_feeds()
+            except Exception as e:
+                logger.error("Feed polling round failed: %s", e)
+                count_error(e)
+            finally:
+                db.close()
+            self._stop.wait(self.interval)
+
+
+feed_poller = FeedPoller(interval=settings.FEED_POLL_INTERVAL)
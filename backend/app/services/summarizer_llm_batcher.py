@@ -0,0 +1,150 @@
+"""
+LLM Micro-batcher.
+
+Short articles are cheap to summarize but each call still pays the request
+latency and resends the whole instruction prompt. The batcher gathers short
+articles that arrive within a small time window and summarizes them with one
+call that returns a JSON array, then hands each waiting caller its own result.
+
+The first caller to arrive leads the batch: it waits up to the window for
+others to join (or until the batch is full), makes the batched call in its
+own thread, and wakes the followers. If the batched call fails or its reply
+cannot be split back into one result per article, every caller falls back to
+a single call for its own article.
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error, record_llm_batch
+from backend.app.core.summarizer_timing import stage
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.services.summarizer_service_helpers import (
+    generate_summary_classify_article,
+    generate_summary_classify_batch,
+)
+
+logger = get_logger("llm_batcher")
+
+
+class _Batch:
+    """Articles gathered for one batched call and, once done, their results."""
+
+    __slots__ = ("contents", "closed", "results", "done")
+
+    def __init__(self):
+        self.contents: List[str] = []
+        self.closed = False
+        # One result per article, or None if callers must fall back
+        self.results: Optional[List[dict]] = None
+        self.done = threading.Event()
+
+
+class LLMBatcher:
+    """Combine concurrent summaries of short articles into batched LLM calls."""
+
+    def __init__(
+        self,
+        batch_size: int = settings.LLM_BATCH_SIZE,
+        max_wait: float = settings.LLM_BATCH_MAX_WAIT,
+        max_words: int = settings.LLM_BATCH_MAX_WORDS,
+        summarize_one: Callable[[str], dict] = generate_summary_classify_article,
+        summarize_batch: Callable[
+            [List[str]], List[dict]
+        ] = generate_summary_classify_batch,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_size (int): Maximum articles per call; 1 disables batching
+            max_wait (float): Seconds the first article waits for others
+            max_words (int): Longer articles are always summarized alone
+            summarize_one (Callable): Returns {'summary', 'category'} for content
+            summarize_batch (Callable): Returns one such dict per content
+        """
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.max_words = max_words
+        self.summarize_one = summarize_one
+        self.summarize_batch = summarize_batch
+        self._cond = threading.Condition()
+        self._open: Optional[_Batch] = None
+
+    def summarize(self, content: str) -> dict:
+        """
+        Summarize and classify an article, batched with others when short.
+
+        Args:
+            content (str): Article content
+
+        Returns:
+            dict: Contains 'summary' and 'category' of the article
+
+        Raises:
+            Exception: If the (fallback) single call fails
+        """
+        if self.batch_size <= 1 or len(content.split()) > self.max_words:
+            return self.summarize_one(content)
+
+        with self._cond:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            index = len(batch.contents)
+            batch.contents.append(content)
+            if len(batch.contents) >= self.batch_size:
+                self._close(batch)
+
+        if leader:
+            self._lead(batch)
+        else:
+            with stage("llm_batch_wait"):
+                batch.done.wait()
+
+        if batch.results is None:
+            return self.summarize_one(content)
+        return batch.results[index]
+
+    def _close(self, batch: _Batch):
+        # Called with the condition held
+        batch.closed = True
+        if self._open is batch:
+            self._open = None
+        self._cond.notify_all()
+
+    def _lead(self, batch: _Batch):
+        try:
+            with stage("llm_batch_wait"):
+                deadline = time.monotonic() + self.max_wait
+                with self._cond:
+                    while not batch.closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._close(batch)
+                            break
+                        self._cond.wait(remaining)
+
+            if len(batch.contents) == 1:
+                # Nobody joined: the leader makes a plain single call
+                return
+            try:
+                batch.results = self.summarize_batch(batch.contents)
+                record_llm_batch(len(batch.contents), fallback=False)
+            except Exception as e:
+                logger.warning(
+                    "Batched summary of %s articles failed, falling back to "
+                    "single calls: %s",
+                    len(batch.contents),
+                    e,
+                )
+                count_error(e)
+                record_llm_batch(len(batch.contents), fallback=True)
+        finally:
+            batch.done.set()
+
+
+llm_batcher = LLMBatcher()
@@ -0,0 +1,327 @@
+"""
+Article Re-summarization Service Module.
+
+Regenerates the summaries of articles whose summary_version differs from the
+current model and prompt. The job works from the stored article content, so
+nothing is fetched from the network. It processes articles in id order, in
+batches, with a bounded number of concurrent LLM calls, and after every batch
+it records its position in the resummarize_jobs row. A stopped or interrupted
+job continues from that checkpoint.
+
+A Postgres advisory lock ensures only one worker process runs a job at a time.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import bindparam, or_, text, update
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.exceptions.summarizer_exceptions import (
+    ResummarizeJobActiveException,
+)
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.models.summarizer_models import Article, ResummarizeJob
+from backend.app.services.summarizer_article_cache import article_cache
+from backend.app.services.summarizer_service_helpers import (
+    generate_summary_classify_article,
+    summary_version,
+)
+from backend.app.services.summarizer_services import (
+    lock_article_changes,
+    mark_articles_updated,
+)
+
+logger = get_logger("resummarize")
+
+# Application-specific key for pg_try_advisory_lock
+RESUMMARIZE_LOCK_KEY = 72620514
+
+RUNNING = "running"
+PAUSED = "paused"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class Resummarizer:
+    """Background job bringing article summaries up to the current version."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        article_model=Article,
+        job_model=ResummarizeJob,
+        batch_size: int = settings.RESUMMARIZE_BATCH_SIZE,
+        concurrency: int = settings.RESUMMARIZE_CONCURRENCY,
+        summarize: Callable[[str], dict] = generate_summary_classify_article,
+        version: Callable[[], str] = summary_version,
+        cache=article_cache,
+    ):
+        """
+        Initialize the re-summarizer.
+
+        Args:
+            session_factory: Creates database sessions
+            article_model: Database model class (defaults to Article)
+            job_model: Job model class holding progress and the checkpoint
+            batch_size (int): Articles per batch and checkpoint
+            concurrency (int): Maximum concurrent summarize calls
+            summarize (Callable): Returns {'summary', 'category'} for content
+            version (Callable): Returns the current summary version
+            cache (ArticleCache): Read cache invalidated for updated articles
+        """
+        self.session_factory = session_factory
+        self.article_model = article_model
+        self.job_model = job_model
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.summarize = summarize
+        self.version = version
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pause = True
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> int:
+        """
+        Start or resume re-summarization towards the current version.
+
+        A paused or interrupted job for the same version continues from its
+        checkpoint; otherwise a new job is created.
+
+        Returns:
+            int: ID of the running job
+
+        Raises:
+            ResummarizeJobActiveException: If a job is running in any worker
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                raise ResummarizeJobActiveException()
+            db = self.session_factory()
+            lock_conn = db.get_bind().connect()
+            try:
+                acquired = lock_conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": RESUMMARIZE_LOCK_KEY},
+                ).scalar()
+                lock_conn.commit()
+                if not acquired:
+                    raise ResummarizeJobActiveException()
+                job = self._claim_job(db)
+                job_id = job.id
+            except Exception:
+                self._release(lock_conn)
+                raise
+            finally:
+                db.close()
+
+            self._stop.clear()
+            self._pause = True
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(job_id, lock_conn),
+                name="resummarize",
+                daemon=True,
+            )
+            self._thread.start()
+            return job_id
+
+    def stop(self, pause: bool = True):
+        """
+        Stop after the current batch.
+
+        Args:
+            pause (bool): Mark the job paused so it only resumes when started
+                again; with False it stays running and resumes on the next
+                startup
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._pause = pause
+        self._stop.set()
+        thread.join()
+        self._thread = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the running job to finish; returns False on timeout."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def resume_interrupted(self) -> Optional[int]:
+        """Resume a job left running by a previous process, if any."""
+        with self.session_factory() as db:
+            interrupted = (
+                db.query(self.job_model.id)
+                .filter(
+                    self.job_model.status == RUNNING,
+                    self.job_model.target_version == self.version(),
+                )
+                .first()
+            )
+        if interrupted is None:
+            return None
+        try:
+            return self.start()
+        except ResummarizeJobActiveException:
+            return None
+
+    def latest_job(self, db):
+        """Return the most recent job, or None."""
+        return db.query(self.job_model).order_by(self.job_model.id.desc()).first()
+
+    def _claim_job(self, db):
+        target = self.version()
+        job = (
+            db.query(self.job_model)
+            .filter(
+                self.job_model.target_version == target,
+                self.job_model.status.in_([RUNNING, PAUSED]),
+            )
+            .order_by(self.job_model.id.desc())
+            .first()
+        )
+        if job is None:
+            job = self.job_model(
+                target_version=target,
+                last_article_id=0,
+                total=self._outdated(db, target, 0).count(),
+                processed=0,
+                failed=0,
+                started_at=_now(),
+            )
+            db.add(job)
+        job.status = RUNNING
+        job.updated_at = _now()
+        db.commit()
+        logger.info(
+            "Re-summarization job %s towards %s from article %s",
+            job.id,
+            target,
+            job.last_article_id,
+        )
+        return job
+
+    def _outdated(self, db, target: str, after_id: int):
+        model = self.article_model
+        return db.query(model.id, model.created_at, model.content).filter(
+            model.id > after_id,
+            or_(model.summary_version.is_(None), model.summary_version != target),
+        )
+
+    def _summarize_row(self, row):
+        try:
+            return row.id, self.summarize(row.content)
+        except Exception as e:
+            logger.error("Failed to re-summarize article %s: %s", row.id, e)
+            count_error(e)
+            return row.id, None
+
+    def _run(self, job_id: int, lock_conn):
+        db = self.session_factory()
+        job = db.get(self.job_model, job_id)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="resummarize"
+            ) as executor:
+                while not self._stop.is_set():
+                    rows = (
+                        self._outdated(db, job.target_version, job.last_article_id)
+                        .order_by(self.article_model.id)
+                        .limit(self.batch_size)
+                        .all()
+                    )
+                    if not rows:
+                        job.status = COMPLETED
+                        job.finished_at = _now()
+                        break
+                    self._apply_batch(
+                        db, job, rows, executor.map(self._summarize_row, rows)
+                    )
+                else:
+                    if self._pause:
+                        job.status = PAUSED
+            job.updated_at = _now()
+            db.commit()
+            logger.info(
+                "Re-summarization job %s %s: %s processed, %s failed",
+                job.id,
+                job.status,
+                job.processed,
+                job.failed,
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error("Re-summarization job %s failed: %s", job_id, e)
+            count_error(e)
+            job.status = FAILED
+            job.error = str(e)
+            job.updated_at = _now()
+            db.commit()
+        finally:
+            db.close()
+            self._release(lock_conn)
+
+    def _apply_batch(self, db, job, rows, results):
+        created = {row.id: row.created_at for row in rows}
+        updates = []
+        for article_id, data in results:
+            if data is None:
+                job.failed += 1
+                continue
+            updates.append(
+                {
+                    "article_id": article_id,
+                    "article_created_at": created[article_id],
+                    "summary": data["summary"],
+                    "category": data["category"].lower(),
+                    "summary_version": job.target_version,
+                }
+            )
+        if updates:
+            table = self.article_model.__table__
+            lock_article_changes(db)
+            # Matching created_at as well lets Postgres update one partition
+            db.execute(
+                update(table).where(
+                    table.c.id == bindparam("article_id"),
+                    table.c.created_at == bindparam("article_created_at"),
+                ),
+                updates,
+            )
+            mark_articles_updated(
+                db, self.article_model, [row["article_id"] for row in updates]
+            )
+        job.processed += len(updates)
+        # Checkpoint: the next batch starts after the last article of this one
+        job.last_article_id = rows[-1].id
+        job.updated_at = _now()
+        db.commit()
+        for row in updates:
+            self.cache.invalidate(row["article_id"])
+
+    @staticmethod
+    def _release(lock_conn):
+        try:
+            lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": RESUMMARIZE_LOCK_KEY}
+            )
+            lock_conn.commit()
+        finally:
+            lock_conn.close()
+
+
+resummarizer = Resummarizer()
@@ -0,0 +1,324 @@
+"""
+Polite Scrape Scheduler.
+
+This module throttles outbound article downloads so that a burst of URLs from
+one publisher does not hammer that host. It enforces a global connection
+budget together with per-host concurrency caps and minimum delays, honours
+robots.txt crawl-delay directives, and backs off from hosts that start
+rejecting requests instead of retrying against them.
+"""
+
+import threading
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import record_cache
+from backend.app.core.summarizer_timing import stage
+from backend.app.exceptions.summarizer_exceptions import ScrapeThrottledException
+from backend.app.logs.summarizer_logging import get_logger
+
+logger = get_logger("scrape")
+
+# Responses that mean the host wants us to slow down
+BLOCKED_STATUS_CODES = frozenset({403, 429, 503})
+
+# Consecutive successes needed before a penalised host earns back a slot
+RECOVERY_SUCCESSES = 5
+
+
+class _HostState:
+    """Mutable scheduling state for a single host."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.next_start = 0.0
+        self.penalty_delay = 0.0
+        self.blocked_until = 0.0
+        self.successes = 0
+        self.crawl_delay = 0.0
+        self.robots_expires = 0.0
+        self.robots_lock = threading.Lock()
+
+
+class ScrapeScheduler:
+    """
+    Schedule article downloads politely across hosts.
+
+    All slot bookkeeping happens under a single condition variable, so waiting
+    scrapes are woken whenever a slot frees up or a host gets blocked.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 16,
+        per_host_concurrency: int = 2,
+        min_host_delay: float = 1.0,
+        max_host_delay: float = 60.0,
+        queue_timeout: float = 30.0,
+        block_cooldown: float = 60.0,
+        robots_ttl: float = 3600.0,
+        timeout: float = 10.0,
+        user_agent: str = "PersonalizedNewsSummarizer/0.1",
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_connections (int): Global cap on concurrent downloads
+            per_host_concurrency (int): Concurrent downloads allowed per host
+            min_host_delay (float): Minimum seconds between request starts per host
+            max_host_delay (float): Upper bound for crawl-delay and back-off
+            queue_timeout (float): Seconds a download may wait for a slot
+            block_cooldown (float): Seconds to pause a host after it throttles us
+            robots_ttl (float): Seconds to cache robots.txt (0 disables lookups)
+            timeout (float): Network timeout for each download
+            user_agent (str): User-Agent header and robots.txt agent name
+        """
+        self.max_connections = max_connections
+        self.per_host_concurrency = per_host_concurrency
+        self.min_host_delay = min_host_delay
+        self.max_host_delay = max_host_delay
+        self.queue_timeout = queue_timeout
+        self.block_cooldown = block_cooldown
+        self.robots_ttl = robots_ttl
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._cond = threading.Condition()
+        self._active = 0
+        self._hosts: Dict[str, _HostState] = {}
+
+    def fetch(self, url: str) -> str:
+        """
+        Download a page once a polite slot is available for its host.
+
+        Args:
+            url (str): URL to download
+
+        Returns:
+            str: Decoded response body
+
+        Raises:
+            ScrapeThrottledException: If the host is cooling down after throttling
+                                      us, or no slot freed up within the timeout
+            urllib.error.URLError: For other download failures
+        """
+        with self.slot(url), stage("scrape_download"):
+            return self._download(url)
+
+    @contextmanager
+    def slot(self, url: str):
+        """
+        Hold a polite download slot for the URL's host.
+
+        Callers that need their own request handling (conditional GETs,
+        streaming bodies) perform the request inside this block. HTTP errors
+        that signal throttling put the host into back-off.
+
+        Args:
+            url (str): URL about to be requested
+
+        Raises:
+            ScrapeThrottledException: If the host is cooling down, no slot freed
+                                      up in time, or the request was throttled
+        """
+        host = urlsplit(url).netloc.lower()
+        state = self._host_state(host)
+        with stage("scrape_wait"):
+            self._check_blocked(host, state)
+            crawl_delay = self._crawl_delay(url, host, state)
+            self._acquire(host, state, crawl_delay)
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        except urllib.error.HTTPError as e:
+            if e.code not in BLOCKED_STATUS_CODES:
+                raise
+            retry_after = self._block_host(host, state, _retry_after(e.headers))
+            raise ScrapeThrottledException(host, retry_after) from e
+        finally:
+            self._release(state, succeeded)
+
+    def stats(self) -> dict:
+        """Return a snapshot of the scheduler state for diagnostics."""
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "active": self._active,
+                "hosts": {
+                    host: {
+                        "active": state.active,
+                        "limit": state.limit,
+                        "delay": self._host_delay(state, state.crawl_delay),
+                        "blocked_for": max(0.0, state.blocked_until - now),
+                    }
+                    for host, state in self._hosts.items()
+                },
+            }
+
+    def _host_state(self, host: str) -> _HostState:
+        with self._cond:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.per_host_concurrency)
+            return state
+
+    def _host_delay(self, state: _HostState, crawl_delay: float) -> float:
+        return max(self.min_host_delay, crawl_delay, state.penalty_delay)
+
+    def _check_blocked(self, host: str, state: _HostState):
+        with self._cond:
+            now = time.monotonic()
+            if state.blocked_until > now:
+                raise ScrapeThrottledException(host, state.blocked_until - now)
+
+    def _acquire(self, host: str, state: _HostState, crawl_delay: float):
+        deadline = time.monotonic() + self.queue_timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if state.blocked_until > now:
+                    raise ScrapeThrottledException(host, state.blocked_until - now)
+                if state.active < state.limit and self._active < self.max_connections:
+                    wait = state.next_start - now
+                    if wait <= 0:
+                        state.active += 1
+                        self._active += 1
+                        state.next_start = now + self._host_delay(state, crawl_delay)
+                        return
+                else:
+                    wait = deadline - now
+                if now >= deadline:
+                    raise ScrapeThrottledException(
+                        host, self._host_delay(state, crawl_delay)
+                    )
+                self._cond.wait(min(wait, deadline - now))
+
+    def _release(self, state: _HostState, succeeded: bool):
+        """Free the slot; only completed requests count towards recovery."""
+        with self._cond:
+            state.active -= 1
+            self._active -= 1
+            if succeeded:
+                state.successes += 1
+                if state.successes >= RECOVERY_SUCCESSES:
+                    state.successes = 0
+                    state.limit = min(self.per_host_concurrency, state.limit + 1)
+                    state.penalty_delay /= 2
+            else:
+                state.successes = 0
+            self._cond.notify_all()
+
+    def _block_host(
+        self, host: str, state: _HostState, retry_after: Optional[float]
+    ) -> float:
+        """Halve the host's concurrency, double its delay and pause it."""
+        with self._cond:
+            cooldown = max(self.block_cooldown, retry_after or 0.0)
+            state.limit = max(1, state.limit // 2)
+            state.penalty_delay = min(
+                self.max_host_delay,
+                max(state.penalty_delay * 2, self.min_host_delay, 1.0),
+            )
+            state.successes = 0
+            state.blocked_until = max(state.blocked_until, time.monotonic() + cooldown)
+            self._cond.notify_all()
+        logger.warning(
+            "Host %s is throttling scrapes; pausing for %.0fs with concurrency %s",
+            host,
+            cooldown,
+            state.limit,
+        )
+        return cooldown
+
+    def _crawl_delay(self, url: str, host: str, state: _HostState) -> float:
+        """
+        Return the robots.txt crawl-delay for the URL's host, cached per TTL.
+
+        The robots.txt request holds a slot of its own, so it counts against
+        the global and per-host budgets like any other request to the host.
+        """
+        if self.robots_ttl <= 0:
+            return 0.0
+        if state.robots_expires > time.monotonic():
+            record_cache("robots", True)
+            return state.crawl_delay
+        with state.robots_lock:
+            # Another thread may have refreshed the entry while we waited
+            hit = state.robots_expires > time.monotonic()
+            if not hit:
+                state.crawl_delay = self._fetch_crawl_delay(url, host, state)
+                state.robots_expires = time.monotonic() + self.robots_ttl
+        record_cache("robots", hit)
+        return state.crawl_delay
+
+    def _fetch_crawl_delay(self, url: str, host: str, state: _HostState) -> float:
+        parts = urlsplit(url)
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        self._acquire(host, state, state.crawl_delay)
+        # A missing robots.txt is an answer too; only failed requests are not
+        answered = False
+        try:
+            body = self._download(robots_url)
+            answered = True
+        except urllib.error.HTTPError as e:
+            if e.code in BLOCKED_STATUS_CODES:
+                retry_after = self._block_host(host, state, _retry_after(e.headers))
+                raise ScrapeThrottledException(host, retry_after) from e
+            answered = e.code < 500
+            logger.info("No usable robots.txt at %s: %s", robots_url, e)
+            return 0.0
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.info("No usable robots.txt at %s: %s", robots_url, e)
+            return 0.0
+        finally:
+            self._release(state, answered)
+        parser = RobotFileParser()
+        parser.parse(body.splitlines())
+        delay = parser.crawl_delay(self.user_agent)
+        if delay is None:
+            rate = parser.request_rate(self.user_agent)
+            delay = rate.seconds / rate.requests if rate and rate.requests else 0.0
+        return min(float(delay), self.max_host_delay)
+
+    def _download(self, url: str) -> str:
+        request = urllib.request.Request(url, headers={"User-Agent": self.user_agent})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            return response.read().decode(charset, errors="replace")
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+scrape_scheduler = ScrapeScheduler(
+    max_connections=settings.SCRAPE_MAX_CONNECTIONS,
+    per_host_concurrency=settings.SCRAPE_PER_HOST_CONCURRENCY,
+    min_host_delay=settings.SCRAPE_MIN_HOST_DELAY,
+    max_host_delay=settings.SCRAPE_MAX_HOST_DELAY,
+    queue_timeout=settings.SCRAPE_QUEUE_TIMEOUT,
+    block_cooldown=settings.SCRAPE_BLOCK_COOLDOWN,
+    robots_ttl=settings.SCRAPE_ROBOTS_TTL,
+    timeout=settings.SCRAPE_TIMEOUT,
+    user_agent=settings.SCRAPE_USER_AGENT,
+)
@@ -2,21 +2,179 @@
 Helper Functions for Article Summarization Service.
 
 This module provides utility functions for article scraping and AI-powered
-summarization using Azure OpenAI services.
+summarization using Azure OpenAI services. newspaper and openai are imported
+on first use since they dominate the application's import time.
 """
 
+import hashlib
 import json
+import os
 import re
-from newspaper import Article as NewspaperArticle
-from backend.app.logs.summarizer_logging import logger
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+from backend.app.logs.summarizer_logging import get_logger
 from backend.app.core.summarizer_config import settings
-from openai import AzureOpenAI
+from backend.app.core.summarizer_metrics import record_llm_tokens
+from backend.app.core.summarizer_timing import stage
+from backend.app.exceptions.summarizer_exceptions import ScrapeThrottledException
+from backend.app.services.summarizer_scrape_scheduler import scrape_scheduler
+
+logger = get_logger("helpers")
+
+# Parsing is CPU-bound and would hold the GIL of the serving process, making
+# reads wait behind it. Scraped pages are parsed in a pool of processes at a
+# lower CPU priority instead, started on first use.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+SUMMARY_PROMPT = """
+        Analyze the following article and provide ONLY a JSON response with a summary and category(e.g., Technology, Sports, Business, Entertainment, Health, or General).
+        The response must be valid JSON with no additional text before or after.
+
+        Article:
+        {}
+
+        Response format:
+        {{
+          "summary": "Brief summary of the news article",
+          "category": "Relevant category"
+        }}
+        """
+
+BATCH_SUMMARY_PROMPT = """
+        Analyze each of the following {count} articles and provide ONLY a JSON array with one object per article, in the same order, each with the article's id, a summary and a category(e.g., Technology, Sports, Business, Entertainment, Health, or General).
+        The response must be valid JSON with no additional text before or after.
+
+        {articles}
+
+        Response format:
+        [
+          {{
+            "id": 1,
+            "summary": "Brief summary of the news article",
+            "category": "Relevant category"
+          }}
+        ]
+        """
+
+BATCH_ARTICLE = """Article {id}:
+        {content}
+
+        """
+
+STORY_SUMMARY_PROMPT = """
+        The following {count} news reports cover the same event. Combine them and provide ONLY a JSON response with a headline, one summary of the event and a category(e.g., Technology, Sports, Business, Entertainment, Health, or General).
+        The response must be valid JSON with no additional text before or after.
+
+        {reports}
+
+        Response format:
+        {{
+          "title": "Headline of the event",
+          "summary": "Brief summary of the event",
+          "category": "Relevant category"
+        }}
+        """
+
+STORY_REPORT = """Report {id}:
+        {summary}
+
+        """
+
+# Changes whenever either prompt changes
+PROMPT_VERSION = hashlib.sha256(
+    (SUMMARY_PROMPT + BATCH_SUMMARY_PROMPT + BATCH_ARTICLE).encode("utf-8")
+).hexdigest()[:12]
+
+
+def summary_version() -> str:
+    """
+    Identify the model and prompt producing summaries.
+
+    Stored on each article so summaries from an older model or prompt can be
+    found and regenerated.
+
+    Returns:
+        str: '<model deployment>:<prompt hash>'
+    """
+    return f"{settings.AZURE_OPENAI_MODEL}:{PROMPT_VERSION}"
+
+
+def story_summary_version() -> str:
+    """Identify the model and prompt producing story summaries."""
+    prompt_hash = hashlib.sha256(
+        (STORY_SUMMARY_PROMPT + STORY_REPORT).encode("utf-8")
+    ).hexdigest()[:12]
+    return f"{settings.AZURE_OPENAI_MODEL}:{prompt_hash}"
+
+
+def parse_article(url: str, html):
+    """
+    Extract the title and text of an article from its HTML.
+
+    Args:
+        url (str): URL the HTML was fetched from
+        html (str | bytes): The page; bytes are decoded as newspaper detects
+
+    Returns:
+        newspaper.Article: The parsed article, with title, text and
+            canonical_link
+    """
+    from newspaper import Article as NewspaperArticle
+
+    with stage("scrape_parse"):
+        article = NewspaperArticle(url)
+        article.download(input_html=html)
+        article.parse()
+    return article
+
+
+def _lower_priority():
+    if hasattr(os, "nice"):
+        os.nice(settings.INGEST_NICENESS)
+
+
+def _parse_title_text(url: str, html) -> dict:
+    article = parse_article(url, html)
+    return {"title": article.title, "text": article.text}
+
+
+def parse_pool() -> ProcessPoolExecutor:
+    """The worker's pool of parse processes, started on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            processes = settings.INGEST_PARSE_PROCESSES or max(
+                1, (os.cpu_count() or 1) - 1
+            )
+            # Spawned, as forking a process running threads is unsafe
+            _parse_pool = ProcessPoolExecutor(
+                processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_lower_priority,
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the parse processes; the next parse starts a new pool."""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown()
 
 
 def scrape_article(url: str) -> dict:
     """
     Scrape article content from a given URL.
 
+    The download goes through the polite scrape scheduler so that concurrent
+    requests for the same publisher respect its per-host limits.
+
     Args:
         url (str): URL of the article to scrape
 
@@ -24,17 +182,21 @@ def scrape_article(url: str) -> dict:
         dict: Contains 'title' and 'text' of the article
 
     Raises:
+        ScrapeThrottledException: If the host is throttling our scrapes
         Exception: If article scraping fails
     """
     try:
-        article = NewspaperArticle(url)
-        article.download()
-        article.parse()
-        logger.info(f"Article scraped successfully: {url}")
-        logger.info(f"Title: {article.title}")
-        return {"title": article.title, "text": article.text}
+        html = scrape_scheduler.fetch(url)
+        with stage("scrape_parse"):
+            article = parse_pool().submit(_parse_title_text, url, html).result()
+        logger.info("Article scraped successfully: %s", url)
+        logger.info("Title: %s", article["title"])
+        return article
+    except ScrapeThrottledException as e:
+        logger.warning("Scrape throttled for %s: %s", url, e)
+        raise
     except Exception as e:
-        logger.error(f"Failed to fetch article from {url}: {e}")
+        logger.error("Failed to fetch article from %s: %s", url, e)
         raise Exception("Failed to fetch article")
 
 
@@ -54,59 +216,191 @@ def generate_summary_classify_article(content: str) -> dict:
         Exception: For other failures
     """
     try:
-        client = AzureOpenAI(
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-        )
-        prompt = """
-        Analyze the following article and provide ONLY a JSON response with a summary and category(e.g., Technology, Sports, Business, Entertainment, Health, or General).
-        The response must be valid JSON with no additional text before or after.
+        with stage("prompt_build"):
+            prompt = SUMMARY_PROMPT.format(content)
 
-        Article:
-        {}
+        response_text = _complete(prompt)
 
-        Response format:
-        {{
-          "summary": "Brief summary of the news article",
-          "category": "Relevant category"
-        }}
-        """.format(
-            content
-        )
+        with stage("json_parse"):
+            # Try to find JSON in the response
+            json_match = re.search(r"(\{[\s\S]*\})", response_text)
+            if not json_match:
+                raise json.JSONDecodeError(
+                    "No JSON object found in response", response_text, 0
+                )
 
-        response = client.chat.completions.create(
-            model=settings.AZURE_OPENAI_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
+            clean_json = json_match.group(1)
+            data = json.loads(clean_json)
+
+            # Validate response structure
+            if not isinstance(data, dict) or not all(
+                k in data for k in ["summary", "category"]
+            ):
+                raise ValueError("Invalid response structure")
+
+        logger.info("Article summary and classification generated successfully")
+        return data
+    except json.JSONDecodeError as e:
+        logger.error("JSON parsing error. Raw response: %s", response_text)
+        logger.error("JSON error details: %s", e)
+        raise Exception("Failed to parse summary and category")
+    except Exception as e:
+        logger.error("Failed to generate summary and classify article: %s", e)
+        raise
+
+
+def generate_summary_classify_batch(contents: List[str]) -> List[dict]:
+    """
+    Summarize and classify several articles with a single Azure OpenAI call.
+
+    The instructions are sent once for the whole batch, which saves the
+    per-call latency and repeated prompt tokens for short articles.
+
+    Args:
+        contents (List[str]): Article contents, in order
+
+    Returns:
+        List[dict]: 'summary' and 'category' for each article, in input order
+
+    Raises:
+        ValueError: If the response is not a JSON array with one valid object
+            per article
+        Exception: For other failures
+    """
+    with stage("prompt_build"):
+        articles = "".join(
+            BATCH_ARTICLE.format(id=i, content=content)
+            for i, content in enumerate(contents, start=1)
         )
+        prompt = BATCH_SUMMARY_PROMPT.format(count=len(contents), articles=articles)
 
-        # Clean and extract response text
-        response_text = response.choices[0].message.content.strip()
-        logger.debug(f"Raw response: {response_text}")
+    response_text = _complete(prompt)
 
-        # Try to find JSON in the response
-        json_match = re.search(r"(\{[\s\S]*\})", response_text)
+    with stage("json_parse"):
+        json_match = re.search(r"(\[[\s\S]*\])", response_text)
         if not json_match:
-            raise json.JSONDecodeError(
-                "No JSON object found in response", response_text, 0
+            raise ValueError("No JSON array found in batch response")
+        try:
+            items = json.loads(json_match.group(1))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in batch response: {e}")
+
+        if not isinstance(items, list) or len(items) != len(contents):
+            raise ValueError(
+                f"Expected {len(contents)} results, got "
+                f"{len(items) if isinstance(items, list) else 'no list'}"
             )
+        if not all(
+            isinstance(item, dict) and "summary" in item and "category" in item
+            for item in items
+        ):
+            raise ValueError("Invalid response structure")
+        # Results carrying ids are put back in article order
+        if all("id" in item for item in items):
+            by_id = {str(item["id"]): item for item in items}
+            if set(by_id) != {str(i) for i in range(1, len(contents) + 1)}:
+                raise ValueError("Batch response ids do not match the articles")
+            items = [by_id[str(i)] for i in range(1, len(contents) + 1)]
 
-        clean_json = json_match.group(1)
-        data = json.loads(clean_json)
+    logger.info("Summaries generated for a batch of %s articles", len(contents))
+    return [
+        {"summary": item["summary"], "category": item["category"]} for item in items
+    ]
 
-        # Validate response structure
+
+def generate_story_summary(summaries: List[str]) -> dict:
+    """
+    Combine the summaries of articles about one event with a single call.
+
+    Args:
+        summaries (List[str]): Summaries of the story's articles
+
+    Returns:
+        dict: 'title', 'summary' and 'category' of the story
+
+    Raises:
+        ValueError: If the response is not a JSON object with those fields
+    """
+    with stage("prompt_build"):
+        reports = "".join(
+            STORY_REPORT.format(id=i, summary=summary)
+            for i, summary in enumerate(summaries, start=1)
+        )
+        prompt = STORY_SUMMARY_PROMPT.format(count=len(summaries), reports=reports)
+
+    response_text = _complete(prompt)
+
+    with stage("json_parse"):
+        json_match = re.search(r"(\{[\s\S]*\})", response_text)
+        if not json_match:
+            raise ValueError("No JSON object found in story response")
+        try:
+            data = json.loads(json_match.group(1))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in story response: {e}")
         if not isinstance(data, dict) or not all(
-            k in data for k in ["summary", "category"]
+            k in data for k in ["title", "summary", "category"]
         ):
             raise ValueError("Invalid response structure")
 
-        logger.info("Article summary and classification generated successfully")
-        return data
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parsing error. Raw response: {response_text}")
-        logger.error(f"JSON error details: {str(e)}")
-        raise Exception("Failed to parse summary and category")
-    except Exception as e:
-        logger.error(f"Failed to generate summary and classify article: {str(e)}")
-        raise
+    logger.info("Story summary generated from %s articles", len(summaries))
+    return {k: data[k] for k in ["title", "summary", "category"]}
+
+
+def create_embeddings(texts: List[str], dimensions: int) -> List[List[float]]:
+    """
+    Embed texts with the Azure OpenAI embeddings deployment.
+
+    Args:
+        texts (List[str]): Texts to embed, sent in one request
+        dimensions (int): Requested vector dimensions
+
+    Returns:
+        List[List[float]]: One vector per text, in input order
+    """
+    with stage("llm_call"):
+        response = _client().embeddings.create(
+            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
+            input=texts,
+            dimensions=dimensions,
+        )
+    if response.usage is not None:
+        record_llm_tokens(response.usage.prompt_tokens, 0)
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+def _client():
+    """Azure OpenAI client for the current settings, sharing its connection pool."""
+    return _cached_client(
+        settings.AZURE_OPENAI_API_KEY,
+        settings.AZURE_OPENAI_ENDPOINT,
+        settings.AZURE_OPENAI_API_VERSION,
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_client(api_key: str, endpoint: str, api_version: str):
+    from openai import AzureOpenAI
+
+    return AzureOpenAI(
+        api_key=api_key, azure_endpoint=endpoint, api_version=api_version
+    )
+
+
+def _complete(prompt: str) -> str:
+    """Send a single-message chat completion and return the reply text."""
+    with stage("llm_call"):
+        response = _client().chat.completions.create(
+            model=settings.AZURE_OPENAI_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+        )
+    if response.usage is not None:
+        record_llm_tokens(
+            response.usage.prompt_tokens, response.usage.completion_tokens
+        )
+
+    # Clean and extract response text
+    response_text = response.choices[0].message.content.strip()
+    logger.debug("Raw response: %s", response_text)
+    return response_text
@@ -5,14 +5,20 @@ This module provides core business logic for article summarization, including
 article creation, retrieval, and management functionality.
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func, select, text, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from backend.app.models.summarizer_models import Article
+from backend.app.models.summarizer_models import Article, ArticleTombstone
 from backend.app.schemas.summarizer_schemas import (
+    ArticleChange,
+    ArticleChangesResponse,
     ArticleCreate,
+    ArticleDetailResponse,
     ArticleResponse,
     ArticleSummaryResponse,
+    SimilarArticleResponse,
 )
 from backend.app.exceptions.summarizer_exceptions import (  # Update import path
     ArticleNotFoundException,
@@ -20,16 +26,71 @@ from backend.app.exceptions.summarizer_exceptions import (  # Update import path
     SummaryGenerationException,
     CategoryNotFoundException,
     ArticlesNotFoundForCategoryException,
+    ScrapeThrottledException,
 )
-from openai import AzureOpenAI
-from app.logs.summarizer_logging import logger
-from app.core.summarizer_config import settings
-from newspaper import Article as NewspaperArticle
-import json
-from app.services.summarizer_service_helpers import (
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.core.summarizer_timing import stage
+from backend.app.db.summarizer_replicas import read_only
+from backend.app.services.summarizer_article_cache import (
+    ArticleFragments,
+    CachedArticle,
+)
+from backend.app.services.summarizer_service_helpers import (
     scrape_article,
-    generate_summary_classify_article,
+    summary_version,
 )
+from backend.app.services.summarizer_llm_batcher import llm_batcher
+
+logger = get_logger("services")
+
+# Application-specific key for pg_advisory_xact_lock, ordering article changes
+ARTICLE_CHANGES_LOCK_KEY = 72620517
+
+
+def lock_article_changes(db: Session):
+    """
+    Take the article change lock until the transaction ends.
+
+    Every transaction that inserts, updates or deletes articles takes it before
+    drawing change_seq values and holds it until commit, so values become
+    visible in increasing order: a delta sync cursor never passes a change
+    that is committed later.
+    """
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": ARTICLE_CHANGES_LOCK_KEY}
+    )
+
+
+def mark_articles_updated(db: Session, model, article_ids: List[int]):
+    """Move updated articles to the end of the change feed; lock first."""
+    db.execute(
+        update(model)
+        .where(model.id.in_(article_ids))
+        .values(
+            change_seq=model.__table__.c.change_seq.default.next_value(),
+            updated_at=func.now(),
+        )
+    )
+
+
+def created_between(
+    query,
+    model,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+):
+    """
+    Restrict query to articles ingested in [created_after, created_before).
+
+    The articles table is partitioned by created_at, so the bounds also let
+    Postgres skip the partitions outside them.
+    """
+    if created_after is not None:
+        query = query.filter(model.created_at >= created_after)
+    if created_before is not None:
+        query = query.filter(model.created_at < created_before)
+    return query
 
 
 class SummarizerService:
@@ -40,16 +101,40 @@ class SummarizerService:
     while interfacing with the database and external APIs.
     """
 
-    def __init__(self, db: Session, model=Article):
+    def __init__(
+        self,
+        db: Session,
+        model=Article,
+        tombstone_model=ArticleTombstone,
+        ranker=None,
+        similar=None,
+        clusterer=None,
+        cache=None,
+        fragments=None,
+    ):
         """
         Initialize the summarizer service.
 
         Args:
             db (Session): SQLAlchemy database session
             model: Database model class (defaults to Article)
+            tombstone_model: Records deleted articles (defaults to ArticleTombstone)
+            ranker: FeedRanker told about created articles, if any
+            similar: SimilarArticles embedding and indexing articles, if any
+            clusterer: StoryClusterer grouping articles into stories, if any
+            cache: ArticleCache in front of get_article_detail, if any
+            fragments: ArticleFragments caching get_article_fragments, if any
         """
         self.db = db
         self.model = model
+        self.tombstone_model = tombstone_model
+        self.ranker = ranker
+        self.similar = similar
+        self.clusterer = clusterer
+        self.cache = cache
+        if fragments is None:
+            fragments = ArticleFragments(max_size=0)
+        self.fragments = fragments
 
     def summarize_article(self, url: str) -> ArticleSummaryResponse:
         """
@@ -62,14 +147,16 @@ class SummarizerService:
             ArticleSummaryResponse: Contains title, summary, category, and content
 
         Raises:
+            ScrapeThrottledException: If the article's host is throttling us
             Exception: If article fetching or summarization fails
         """
         try:
             article_data = scrape_article(url)
             if not article_data["text"]:
                 raise SummaryGenerationException("No content found in the article.")
-            result = generate_summary_classify_article(article_data["text"])
-            logger.info(f"Article summarized and classified successfully: {url}")
+            # Short articles are batched with others arriving at the same time
+            result = llm_batcher.summarize(article_data["text"])
+            logger.info("Article summarized and classified successfully: %s", url)
             return ArticleSummaryResponse(
                 title=article_data["title"],
                 url=url,
@@ -77,8 +164,10 @@ class SummarizerService:
                 category=result["category"].lower(),  # Ensure category is lowercase
                 content=article_data["text"],
             )
+        except ScrapeThrottledException:
+            raise
         except Exception as e:
-            logger.error(f"Error summarizing article: {e}")
+            logger.error("Error summarizing article: %s", e)
             raise SummaryGenerationException(str(e))
 
     def create_article(self, article_create: ArticleCreate) -> Article:
@@ -92,22 +181,28 @@ class SummarizerService:
             Article: Created article instance
 
         Raises:
+            ScrapeThrottledException: If the article's host is throttling us
             Exception: If article creation fails
         """
         try:
-            existing_article = (
-                self.db.query(self.model)
-                .filter(self.model.url == article_create.url)
-                .first()
-            )
+            with stage("dedup_query"):
+                existing_article = (
+                    self.db.query(self.model)
+                    .filter(self.model.url == article_create.url)
+                    .first()
+                )
             if existing_article:
                 logger.info(
-                    f"Article with URL {article_create.url} already exists, returning existing article."
+                    "Article with URL %s already exists, returning existing article.",
+                    article_create.url,
                 )
                 return existing_article
 
             if not article_create.url:
                 raise InvalidURLException("URL cannot be empty")
+            # Hand the connection back to the pool while the page is scraped
+            # and summarized, which takes seconds
+            self.db.rollback()
 
             article_summary = self.summarize_article(article_create.url)
             article_data = article_create.model_dump()
@@ -116,22 +211,50 @@ class SummarizerService:
             article_data.pop("content", None)
             article_data.pop("title", None)
 
+            embedding = self._embed(article_summary)
             new_article = self.model(
                 **article_data,
                 title=article_summary.title,
                 summary=article_summary.summary,
                 category=article_summary.category.lower(),
                 content=article_summary.content,
+                summary_version=summary_version(),
+                **embedding,
             )
-            self.db.add(new_article)
-            self.db.commit()
-            self.db.refresh(new_article)
-            logger.info(f"Article created successfully: {new_article.id}")
+            with stage("db_commit"):
+                lock_article_changes(self.db)
+                self.db.add(new_article)
+                self.db.commit()
+                self.db.refresh(new_article)
+            if self.ranker is not None:
+                self.ranker.article_added(new_article.id)
+            if embedding:
+                self.similar.article_added(new_article.id, embedding["embedding"])
+            if self.clusterer is not None:
+                self.clusterer.article_added(new_article.id)
+            logger.info("Article created successfully: %s", new_article.id)
             return new_article
+        except ScrapeThrottledException:
+            raise
         except Exception as e:
-            logger.error(f"Failed to create article: {e}")
+            logger.error("Failed to create article: %s", e)
             raise SummaryGenerationException(str(e))
 
+    def _embed(self, article_summary: ArticleSummaryResponse) -> dict:
+        """Embedding columns for a new article; empty if embedding fails."""
+        if self.similar is None:
+            return {}
+        try:
+            return self.similar.embedding_columns(
+                article_summary.title, article_summary.content
+            )
+        except Exception as e:
+            # The article is still stored; it can be embedded later
+            logger.error("Failed to embed article %s: %s", article_summary.url, e)
+            count_error(e)
+            return {}
+
+    @read_only
     def get_article(self, article_id: int) -> ArticleResponse:
         """
         Retrieve a single article by its ID.
@@ -153,48 +276,123 @@ class SummarizerService:
                 raise ArticleNotFoundException(
                     f"Article with ID {article_id} not found"
                 )
-            logger.info(f"Article retrieved successfully: {article_id}")
+            logger.info("Article retrieved successfully: %s", article_id)
             return article
         except ArticleNotFoundException as e:
-            logger.error(f"Failed to retrieve article {article_id}: {str(e)}")
+            logger.error("Failed to retrieve article %s: %s", article_id, e)
             raise
         except Exception as e:
-            logger.error(f"Failed to retrieve article {article_id}: {e}")
+            logger.error("Failed to retrieve article %s: %s", article_id, e)
             raise
 
-    def get_articles_by_category(self, category_name: str) -> List[ArticleResponse]:
+    def get_article_detail(self, article_id: int) -> CachedArticle:
+        """
+        Retrieve a single article with its content and ETag, from the cache
+        when possible.
+
+        Args:
+            article_id (int): ID of the article to retrieve
+
+        Returns:
+            CachedArticle: The article and its ETag
+
+        Raises:
+            ArticleNotFoundException: If article doesn't exist
         """
-        Retrieve all articles in a specific category.
+        if self.cache is not None:
+            entry = self.cache.get(article_id)
+            if entry is not None:
+                return entry
+            generation = self.cache.generation
+        article = ArticleDetailResponse.model_validate(self.get_article(article_id))
+        if self.cache is None:
+            return CachedArticle.of(article)
+        return self.cache.put(article, generation)
+
+    @read_only
+    def get_similar_articles(
+        self, article_id: int, limit: int = 10
+    ) -> List[SimilarArticleResponse]:
         """
-        try:
-            articles = (
-                self.db.query(self.model)
-                .filter(self.model.category == category_name.lower())
-                .all()
+        Retrieve the articles most similar to an article.
+
+        Args:
+            article_id (int): ID of the article
+            limit (int): Maximum number of similar articles
+
+        Returns:
+            List[SimilarArticleResponse]: Articles with their similarity,
+                most similar first
+
+        Raises:
+            ArticleNotFoundException: If article doesn't exist
+        """
+        return [
+            SimilarArticleResponse(
+                **ArticleResponse.model_validate(article).model_dump(),
+                similarity=score,
             )
+            for article, score in self.similar.similar(self.db, article_id, limit)
+        ]
+
+    @read_only
+    def get_articles_by_category(
+        self,
+        category_name: str,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[ArticleResponse]:
+        """
+        Retrieve all articles in a specific category, optionally only those
+        ingested in [created_after, created_before).
+        """
+        try:
+            articles = created_between(
+                self.db.query(self.model).filter(
+                    self.model.category == category_name.lower()
+                ),
+                self.model,
+                created_after,
+                created_before,
+            ).all()
 
             if not articles:
-                logger.warning(f"No articles found for category: {category_name}")
+                logger.warning("No articles found for category: %s", category_name)
                 raise ArticlesNotFoundForCategoryException(category_name)
 
-            logger.info(f"Found {len(articles)} articles for category: {category_name}")
+            logger.info(
+                "Found %s articles for category: %s", len(articles), category_name
+            )
             return articles
 
         except SQLAlchemyError as e:
             logger.error(
-                f"Database error fetching articles for category {category_name}: {e}"
+                "Database error fetching articles for category %s: %s",
+                category_name,
+                e,
             )
             raise
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching articles for category {category_name}: {e}"
+                "Unexpected error fetching articles for category %s: %s",
+                category_name,
+                e,
             )
             raise ArticlesNotFoundForCategoryException(category_name) from e
 
-    def get_articles(self) -> List[ArticleResponse]:
+    @read_only
+    def get_articles(
+        self,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[ArticleResponse]:
         """
         Retrieve all articles.
 
+        Args:
+            created_after (datetime): Only articles ingested at or after this
+            created_before (datetime): Only articles ingested before this
+
         Returns:
             List[ArticleResponse]: List of all articles
 
@@ -202,16 +400,127 @@ class SummarizerService:
             Exception: If retrieval fails
         """
         try:
-            articles = self.db.query(self.model).all()
+            articles = created_between(
+                self.db.query(self.model), self.model, created_after, created_before
+            ).all()
             if not articles:
-                logger.warning(f"Articles not found")
+                logger.warning("Articles not found")
                 return {"message": "Articles not found"}
             logger.info("Articles retrieved successfully")
             return articles
         except Exception as e:
-            logger.error(f"Failed to retrieve articles: {e}")
+            logger.error("Failed to retrieve articles: %s", e)
             raise
 
+    @read_only
+    def get_article_fragments(
+        self,
+        category: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[bytes]:
+        """
+        Retrieve all articles, or those of a category, as encoded JSON.
+
+        The fast path behind FAST_JSON: rows are selected as tuples of the
+        listed columns and encoded once per summary version.
+
+        Args:
+            category (str): Only articles of this category, if given
+            created_after (datetime): Only articles ingested at or after this
+            created_before (datetime): Only articles ingested before this
+
+        Returns:
+            List[bytes]: One JSON object per article
+
+        Raises:
+            ArticlesNotFoundForCategoryException: If the category has no articles
+        """
+        query = select(
+            *(getattr(self.model, column) for column in ArticleFragments.COLUMNS)
+        )
+        if category is not None:
+            query = query.where(self.model.category == category.lower())
+        query = created_between(query, self.model, created_after, created_before)
+        fragments = self.fragments.encode(self.db.execute(query))
+        if category is not None and not fragments:
+            logger.warning("No articles found for category: %s", category)
+            raise ArticlesNotFoundForCategoryException(category)
+        logger.info("Articles retrieved successfully: %s", len(fragments))
+        return fragments
+
+    @read_only
+    def get_article_changes(
+        self, since: int = 0, limit: int = 500
+    ) -> ArticleChangesResponse:
+        """
+        Retrieve the article inserts, updates and deletions after a cursor.
+
+        Changes are returned in change order, each article at most once with
+        its latest state. Passing the returned cursor as since continues
+        where this page ended; since=0 returns every current article.
+
+        Args:
+            since (int): Cursor returned by a previous call, or 0
+            limit (int): Maximum number of changes
+
+        Returns:
+            ArticleChangesResponse: Changes, the next cursor, and whether
+                more changes are waiting
+        """
+        model = self.model
+        tombstone = self.tombstone_model
+        rows = self.db.execute(
+            select(
+                model.change_seq,
+                model.id,
+                model.title,
+                model.url,
+                model.summary,
+                model.category,
+                model.created_at,
+                model.updated_at,
+            )
+            .where(model.change_seq > since)
+            .order_by(model.change_seq)
+            .limit(limit + 1)
+        ).all()
+        changes = [
+            (
+                row.change_seq,
+                ArticleChange(
+                    op="insert" if row.created_at == row.updated_at else "update",
+                    id=row.id,
+                    changed_at=row.updated_at,
+                    article=ArticleResponse.model_validate(row),
+                ),
+            )
+            for row in rows
+        ]
+        deleted = self.db.execute(
+            select(tombstone.change_seq, tombstone.article_id, tombstone.deleted_at)
+            .where(tombstone.change_seq > since)
+            .order_by(tombstone.change_seq)
+            .limit(limit + 1)
+        ).all()
+        changes.extend(
+            (
+                row.change_seq,
+                ArticleChange(
+                    op="delete", id=row.article_id, changed_at=row.deleted_at
+                ),
+            )
+            for row in deleted
+        )
+        changes.sort(key=lambda change: change[0])
+        page = changes[:limit]
+        logger.info("Article changes after %s: %s", since, len(page))
+        return ArticleChangesResponse(
+            changes=[change for _, change in page],
+            cursor=page[-1][0] if page else since,
+            has_more=len(changes) > limit,
+        )
+
     def delete_article(self, article_id: int):
         """
         Delete an article by its ID.
@@ -231,10 +540,19 @@ class SummarizerService:
                 raise ArticleNotFoundException(
                     f"Article with ID {article_id} not found"
                 )
-            self.db.delete(article)
-            self.db.commit()
-            logger.info(f"Article deleted successfully: {article_id}")
+            with stage("db_commit"):
+                if self.clusterer is not None:
+                    self.clusterer.article_deleted(self.db, article.story_id)
+                lock_article_changes(self.db)
+                self.db.add(self.tombstone_model(article_id=article_id))
+                self.db.delete(article)
+                self.db.commit()
+            if self.similar is not None:
+                self.similar.article_deleted(article_id)
+            if self.cache is not None:
+                self.cache.invalidate(article_id)
+            logger.info("Article deleted successfully: %s", article_id)
         except Exception as e:
             self.db.rollback()
-            logger.error(f"Failed to delete article {article_id}: {e}")
+            logger.error("Failed to delete article %s: %s", article_id, e)
             raise
@@ -0,0 +1,366 @@
+"""
+Similar Articles Service Module.
+
+Finds "more like this" articles with an approximate nearest-neighbor index of
+article embeddings. Articles are embedded after summarization and the vector
+is stored with the article as float32 bytes, together with the embedder
+version, so every worker can build or catch up its own index from the
+database. Storing a vector moves the article to the end of the change feed,
+so a worker catches up by loading the vectors of articles whose change_seq is
+past the last one it has seen. A worker starts from the latest on-disk
+snapshot when EMBEDDING_INDEX_DIR is set, then loads the vectors stored
+since. It writes a new snapshot every EMBEDDING_SNAPSHOT_EVERY additions and
+on shutdown.
+
+Articles summarized before embeddings existed are embedded by:
+
+    python -m backend.app.services.summarizer_similar_services
+
+numpy is imported on first use since it adds noticeably to the application's
+import time.
+"""
+
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, or_, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.core.summarizer_timing import stage
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.exceptions.summarizer_exceptions import ArticleNotFoundException
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.models.summarizer_models import Article
+from backend.app.services.summarizer_services import lock_article_changes
+
+logger = get_logger("similar")
+
+# Seconds between checks for vectors added by other workers
+SYNC_INTERVAL = 1.0
+SYNC_CHUNK = 1000
+BACKFILL_BATCH = 64
+
+
+class SimilarArticles:
+    """Per-process similar-article index kept in step with the database."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        article_model=Article,
+        embedder=None,
+        index_dir: str = settings.EMBEDDING_INDEX_DIR,
+        snapshot_every: int = settings.EMBEDDING_SNAPSHOT_EVERY,
+        probes: int = settings.EMBEDDING_IVF_PROBES,
+        min_train: int = settings.EMBEDDING_IVF_MIN_VECTORS,
+        max_words: int = settings.EMBEDDING_MAX_WORDS,
+        sync_interval: float = SYNC_INTERVAL,
+    ):
+        """
+        Initialize the service; the index is loaded on first use.
+
+        Args:
+            session_factory: Creates database sessions
+            article_model: Database model class (defaults to Article)
+            embedder: Embedder with `embed(texts)` and `version` (defaults
+                to the one selected by EMBEDDING_BACKEND)
+            index_dir (str): Snapshot directory; empty disables snapshots
+            snapshot_every (int): New vectors between snapshots
+            probes (int): Index groups scanned per search
+            min_train (int): Vectors below which searches are exact
+            max_words (int): Words of title and content embedded
+            sync_interval (float): Seconds between database catch-ups
+        """
+        self.session_factory = session_factory
+        self.article_model = article_model
+        self.index_dir = index_dir
+        self.snapshot_every = snapshot_every
+        self.probes = probes
+        self.min_train = min_train
+        self.max_words = max_words
+        self.sync_interval = sync_interval
+        self._embedder = embedder
+        self._index = None
+        # change_seq up to which the index has the database's vectors
+        self._synced_seq = 0
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            from backend.app.services.summarizer_embeddings import get_embedder
+
+            self._embedder = get_embedder()
+        return self._embedder
+
+    def embedding_columns(self, title: Optional[str], content: str) -> dict:
+        """
+        Embed an article.
+
+        Returns:
+            dict: 'embedding' (float32 bytes) and 'embedding_version' values
+                for the article row
+        """
+        from backend.app.services.summarizer_embeddings import embedding_text
+
+        with stage("embed"):
+            vector = self.embedder.embed(
+                [embedding_text(title, content, self.max_words)]
+            )[0]
+        return {
+            "embedding": vector.tobytes(),
+            "embedding_version": self.embedder.version,
+        }
+
+    def article_added(self, article_id: int, embedding: bytes):
+        """Index a stored article vector; snapshots when enough are new."""
+        import numpy as np
+
+        index = self._index
+        if index is None:
+            # Picked up from the database when the index is first loaded
+            return
+        index.add([article_id], np.frombuffer(embedding, dtype=np.float32))
+        if self.index_dir and index.added_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def article_deleted(self, article_id: int):
+        """Drop a deleted article from the index."""
+        if self._index is not None:
+            self._index.remove(article_id)
+
+    def similar(
+        self, db: Session, article_id: int, limit: int = 10
+    ) -> List[Tuple[Article, float]]:
+        """
+        Find the articles most similar to an article.
+
+        Args:
+            db (Session): Database session
+            article_id (int): Article to find neighbors of
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Tuple[Article, float]]: Articles with their cosine similarity,
+                most similar first
+
+        Raises:
+            ArticleNotFoundException: If the article doesn't exist
+        """
+        import numpy as np
+
+        model = self.article_model
+        index = self.index(db)
+        article = db.get(model, article_id)
+        if article is None:
+            index.remove(article_id)
+            raise ArticleNotFoundException(f"Article with ID {article_id} not found")
+
+        vector = index.vector(article_id)
+        if vector is None:
+            if article.embedding_version == self.embedder.version:
+                vector = np.frombuffer(article.embedding, dtype=np.float32)
+            else:
+                vector = self._embed([article])[0]
+                self._store(db, [article], [vector])
+            self.article_added(article_id, vector.tobytes())
+
+        hits = index.search(vector, limit, exclude=article_id)
+        articles = {
+            a.id: a for a in db.query(model).filter(model.id.in_([h[0] for h in hits]))
+        }
+        results = []
+        for hit_id, score in hits:
+            if hit_id not in articles:
+                # Deleted by another worker
+                index.remove(hit_id)
+                continue
+            results.append((articles[hit_id], score))
+        logger.info("Found %s articles similar to %s", len(results), article_id)
+        return results
+
+    def index(self, db: Session):
+        """Return the index, caught up with the database at most every sync_interval."""
+        with self._lock:
+            if self._index is None:
+                self._index = self._open()
+            if time.monotonic() - self._synced_at >= self.sync_interval:
+                self._sync(db)
+                self._synced_at = time.monotonic()
+            return self._index
+
+    def backfill(self, db: Session, batch_size: int = BACKFILL_BATCH) -> int:
+        """
+        Embed articles without a vector from the current embedder.
+
+        Returns:
+            int: Number of articles embedded
+        """
+        model = self.article_model
+        version = self.embedder.version
+        last_id, total = 0, 0
+        while True:
+            rows = (
+                db.query(model.id, model.created_at, model.title, model.content)
+                .filter(
+                    model.id > last_id,
+                    or_(
+                        model.embedding_version.is_(None),
+                        model.embedding_version != version,
+                    ),
+                )
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                return total
+            vectors = self._embed(rows)
+            self._store(db, rows, vectors)
+            if self._index is not None:
+                self._index.add([row.id for row in rows], vectors)
+            last_id = rows[-1].id
+            total += len(rows)
+            logger.info("Embedded %s articles (up to id %s)", total, last_id)
+
+    def embed_missing(self, db: Session, article_ids: List[int]):
+        """Embed and store the articles without a vector from the current embedder."""
+        model = self.article_model
+        rows = (
+            db.query(model.id, model.created_at, model.title, model.content)
+            .filter(
+                model.id.in_(article_ids),
+                or_(
+                    model.embedding_version.is_(None),
+                    model.embedding_version != self.embedder.version,
+                ),
+            )
+            .all()
+        )
+        if rows:
+            self._store(db, rows, self._embed(rows))
+
+    def snapshot(self):
+        """Write the index to EMBEDDING_INDEX_DIR."""
+        index = self._index
+        if index is None or not self.index_dir:
+            return
+        try:
+            path = index.save(
+                self.index_dir,
+                {"version": self.embedder.version, "change_seq": self._synced_seq},
+            )
+            logger.info("Index snapshot of %s vectors written to %s", len(index), path)
+        except OSError as e:
+            logger.error("Failed to write index snapshot: %s", e)
+            count_error(e)
+
+    def stop(self):
+        """Snapshot vectors added since the last snapshot."""
+        if self._index is not None and self._index.added_since_snapshot:
+            self.snapshot()
+
+    def _open(self):
+        from backend.app.services.summarizer_vector_index import VectorIndex
+
+        index = VectorIndex(
+            self.embedder.dim, probes=self.probes, min_train=self.min_train
+        )
+        if not self.index_dir:
+            return index
+        try:
+            meta = index.load(self.index_dir)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable index snapshot: %s", e)
+            count_error(e)
+            meta = None
+        if meta is not None and meta.get("version") != self.embedder.version:
+            logger.info("Ignoring index snapshot of embedder %s", meta.get("version"))
+            index = VectorIndex(
+                self.embedder.dim, probes=self.probes, min_train=self.min_train
+            )
+        elif meta is not None:
+            self._synced_seq = meta.get("change_seq", 0)
+            logger.info("Loaded index snapshot of %s vectors", len(index))
+        return index
+
+    def _embed(self, rows):
+        from backend.app.services.summarizer_embeddings import embedding_text
+
+        with stage("embed"):
+            return self.embedder.embed(
+                [embedding_text(r.title, r.content, self.max_words) for r in rows]
+            )
+
+    def _store(self, db: Session, rows, vectors):
+        """Write vectors of articles and commit; other workers load them by change_seq."""
+        table = self.article_model.__table__
+        lock_article_changes(db)
+        # Matching created_at as well lets Postgres update one partition
+        db.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("article_id"),
+                table.c.created_at == bindparam("article_created_at"),
+            )
+            .values(change_seq=table.c.change_seq.default.next_value()),
+            [
+                {
+                    "article_id": row.id,
+                    "article_created_at": row.created_at,
+                    "embedding": vector.tobytes(),
+                    "embedding_version": self.embedder.version,
+                }
+                for row, vector in zip(rows, vectors)
+            ],
+        )
+        db.commit()
+
+    def _sync(self, db: Session):
+        """Load vectors stored by other workers or before startup."""
+        import numpy as np
+
+        index = self._index
+        model = self.article_model
+        loaded = 0
+        while True:
+            rows = (
+                db.query(model.id, model.change_seq, model.embedding)
+                .filter(
+                    model.change_seq > self._synced_seq,
+                    model.embedding_version == self.embedder.version,
+                )
+                .order_by(model.change_seq)
+                .limit(SYNC_CHUNK)
+                .all()
+            )
+            new = [row for row in rows if row.id not in index]
+            if new:
+                index.add(
+                    [row.id for row in new],
+                    np.stack([np.frombuffer(r.embedding, np.float32) for r in new]),
+                )
+                loaded += len(new)
+            if rows:
+                self._synced_seq = rows[-1].change_seq
+            if len(rows) < SYNC_CHUNK:
+                break
+        if loaded:
+            logger.info("Loaded %s article vectors into the index", loaded)
+            if self.index_dir and index.added_since_snapshot >= self.snapshot_every:
+                self.snapshot()
+
+
+similar_articles = SimilarArticles()
+
+
+if __name__ == "__main__":
+    with SessionLocal() as session:
+        embedded = similar_articles.backfill(session)
+        similar_articles.index(session)
+    similar_articles.snapshot()
+    print(f"Embedded {embedded} articles")
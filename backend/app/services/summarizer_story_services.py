@@ -0,0 +1,406 @@
+"""
+Story Clustering Service Module.
+
+Groups articles covering the same event into stories. Clustering is
+incremental: a background worker takes newly created articles in batches and
+compares each with the centroids of the stories that received an article in
+the last STORY_WINDOW seconds. The article joins the most similar story if
+their cosine similarity reaches STORY_SIMILARITY, and starts a new story
+otherwise. Article vectors are the embeddings stored for similar-article
+search. The queue of new articles lives in memory, so the worker also
+clusters the articles of the last STORY_WINDOW seconds still without a story
+when it starts and every STORY_RESCAN_INTERVAL seconds: articles queued
+before a restart and bulk-imported ones.
+
+A story of one article shows that article's summary. When a story has grown
+by STORY_RESUMMARIZE_GROWTH since its summary was written, the summaries of
+its latest articles are combined into a new story summary with one LLM call,
+so an event covered by n articles costs O(log n) story summaries.
+
+A Postgres advisory lock serializes clustering across workers, so coverage
+arriving at several workers at once still ends up in one story.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, undefer
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.exceptions.summarizer_exceptions import StoryNotFoundException
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.models.summarizer_models import Article, Story
+from backend.app.schemas.summarizer_schemas import (
+    ArticleResponse,
+    StoryDetailResponse,
+    StoryResponse,
+)
+from backend.app.services.summarizer_service_helpers import (
+    generate_story_summary,
+    story_summary_version,
+)
+from backend.app.services.summarizer_similar_services import similar_articles
+
+logger = get_logger("stories")
+
+# Application-specific key for pg_advisory_xact_lock, serializing clusterers
+STORY_CLUSTER_LOCK_KEY = 72620516
+
+
+class StoryClusterer:
+    """Assign new articles to stories and keep story summaries current."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        article_model=Article,
+        story_model=Story,
+        similar=similar_articles,
+        window: float = settings.STORY_WINDOW,
+        threshold: float = settings.STORY_SIMILARITY,
+        growth: float = settings.STORY_RESUMMARIZE_GROWTH,
+        max_articles: int = settings.STORY_SUMMARY_MAX_ARTICLES,
+        batch_size: int = settings.STORY_CLUSTER_BATCH,
+        rescan_interval: float = settings.STORY_RESCAN_INTERVAL,
+        summarize: Callable[[List[str]], dict] = generate_story_summary,
+    ):
+        """
+        Initialize the clusterer.
+
+        Args:
+            session_factory: Creates database sessions for the worker
+            article_model: Database model class (defaults to Article)
+            story_model: Story model class (defaults to Story)
+            similar (SimilarArticles): Embeds articles stored without a vector
+            window (float): Seconds after its latest article a story stays open
+            threshold (float): Minimum cosine similarity to join a story
+            growth (float): Relative growth that triggers a new story summary
+            max_articles (int): Article summaries combined per story summary
+            batch_size (int): New articles clustered per transaction
+            rescan_interval (float): Seconds between checks for recent
+                articles without a story
+            summarize (Callable): Returns {'title', 'summary', 'category'}
+                for a list of article summaries
+        """
+        self.session_factory = session_factory
+        self.article_model = article_model
+        self.story_model = story_model
+        self.similar = similar
+        self.window = window
+        self.threshold = threshold
+        self.growth = growth
+        self.max_articles = max_articles
+        self.batch_size = batch_size
+        self.rescan_interval = rescan_interval
+        self.summarize = summarize
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        """Start the worker; it first clusters recent articles without a story."""
+        self._ensure_worker()
+
+    def article_added(self, article_id: int):
+        """Queue a newly created article for clustering."""
+        self._ensure_worker()
+        self._queue.put(article_id)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self):
+        """Signal the worker to exit once the queue has drained."""
+        with self._lock:
+            if self._thread is None:
+                return
+            self._stop.set()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._stop.clear()
+
+    def cluster_articles(self, db: Session, article_ids: List[int]) -> List[int]:
+        """
+        Assign articles to open stories or start new ones.
+
+        Args:
+            db (Session): Database session; committed on success
+            article_ids (List[int]): Articles not yet in a story
+
+        Returns:
+            List[int]: Stories that grew enough to need a new summary
+        """
+        import numpy as np
+
+        model = self.article_model
+        story_model = self.story_model
+        # Stored in a transaction of its own, not under the story lock
+        self.similar.embed_missing(db, article_ids)
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": STORY_CLUSTER_LOCK_KEY}
+        )
+        articles = (
+            db.query(model)
+            .options(undefer(model.embedding))
+            .filter(model.id.in_(article_ids), model.story_id.is_(None))
+            .order_by(model.id)
+            .all()
+        )
+        if not articles:
+            db.commit()
+            return []
+
+        now = datetime.now(timezone.utc)
+        dim = self.similar.embedder.dim
+        stories = [
+            story
+            for story in db.query(story_model)
+            .options(undefer(story_model.centroid))
+            .filter(story_model.updated_at >= now - timedelta(seconds=self.window))
+            # Stories of an earlier embedder with other dimensions stay closed
+            if len(story.centroid) == dim * 4
+        ]
+        centroids = np.array(
+            [np.frombuffer(story.centroid, np.float32) for story in stories],
+            dtype=np.float32,
+        ).reshape(len(stories), dim)
+        grown = {}
+        for article in articles:
+            vector = np.frombuffer(article.embedding, dtype=np.float32)
+            best = None
+            if stories:
+                similarity = centroids @ vector
+                best = int(np.argmax(similarity))
+                if similarity[best] < self.threshold:
+                    best = None
+            if best is None:
+                story = story_model(
+                    title=article.title,
+                    summary=article.summary,
+                    category=article.category,
+                    article_count=1,
+                    summarized_count=1,
+                    centroid=vector.tobytes(),
+                    created_at=now,
+                    updated_at=now,
+                )
+                db.add(story)
+                db.flush()
+                stories.append(story)
+                centroids = np.vstack([centroids, vector])
+            else:
+                story = stories[best]
+                centroid = centroids[best] * story.article_count + vector
+                centroids[best] = centroid / (np.linalg.norm(centroid) or 1.0)
+                story.centroid = centroids[best].tobytes()
+                story.article_count += 1
+                story.updated_at = now
+                grown[story.id] = story
+            article.story_id = story.id
+        outdated = [
+            story.id
+            for story in grown.values()
+            if story.article_count >= story.summarized_count * (1 + self.growth)
+        ]
+        db.commit()
+        logger.debug("Clustered %s articles into stories", len(articles))
+        return outdated
+
+    def summarize_story(self, db: Session, story_id: int):
+        """Combine the latest article summaries of a story into its summary."""
+        model = self.article_model
+        count = (
+            db.query(self.story_model.article_count)
+            .filter(self.story_model.id == story_id)
+            .scalar()
+        )
+        summaries = [
+            summary
+            for (summary,) in db.query(model.summary)
+            .filter(model.story_id == story_id)
+            .order_by(model.id.desc())
+            .limit(self.max_articles)
+        ]
+        # No transaction stays open during the LLM call
+        db.commit()
+        if count is None or not summaries:
+            return
+        data = self.summarize(list(reversed(summaries)))
+        db.query(self.story_model).filter(self.story_model.id == story_id).update(
+            {
+                "title": data["title"][:255],
+                "summary": data["summary"],
+                "category": data["category"].lower(),
+                "summarized_count": count,
+                "summary_version": story_summary_version(),
+            }
+        )
+        db.commit()
+        logger.info("Story %s summarized from %s articles", story_id, len(summaries))
+
+    def article_deleted(self, db: Session, story_id: Optional[int]):
+        """Account for a deleted article; the caller commits."""
+        if story_id is None:
+            return
+        story_model = self.story_model
+        db.query(story_model).filter(story_model.id == story_id).update(
+            {"article_count": story_model.article_count - 1}
+        )
+        db.query(story_model).filter(
+            story_model.id == story_id, story_model.article_count <= 0
+        ).delete()
+
+    def _ensure_worker(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._work, name="story-clusterer", daemon=True
+                )
+                self._thread.start()
+
+    def _work(self):
+        rescan_at = 0.0
+        while True:
+            if time.monotonic() >= rescan_at:
+                self._rescan()
+                rescan_at = time.monotonic() + self.rescan_interval
+            try:
+                article_id = self._queue.get(
+                    timeout=max(rescan_at - time.monotonic(), 0.0)
+                )
+            except queue.Empty:
+                continue
+            if article_id is None:
+                return
+            batch = [article_id]
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    article_id = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if article_id is None:
+                    stopping = True
+                    break
+                batch.append(article_id)
+            self._cluster(batch)
+            if stopping:
+                return
+
+    def _rescan(self):
+        """Cluster recent articles left without a story, in batches."""
+        model = self.article_model
+        since = datetime.now(timezone.utc) - timedelta(seconds=self.window)
+        db = self.session_factory()
+        try:
+            article_ids = [
+                article_id
+                for (article_id,) in db.query(model.id)
+                .filter(model.story_id.is_(None), model.created_at > since)
+                .order_by(model.id)
+            ]
+        except Exception as e:
+            logger.error("Failed to find articles without a story: %s", e)
+            count_error(e)
+            return
+        finally:
+            db.close()
+        if article_ids:
+            logger.info("Clustering %s articles without a story", len(article_ids))
+        for start in range(0, len(article_ids), self.batch_size):
+            if self._stop.is_set():
+                return
+            self._cluster(article_ids[start : start + self.batch_size])
+
+    def _cluster(self, batch: List[int]):
+        db = self.session_factory()
+        try:
+            for story_id in self.cluster_articles(db, batch):
+                try:
+                    self.summarize_story(db, story_id)
+                except Exception as e:
+                    # Retried when the story grows again
+                    db.rollback()
+                    logger.error("Failed to summarize story %s: %s", story_id, e)
+                    count_error(e)
+        except Exception as e:
+            db.rollback()
+            logger.error("Failed to cluster articles %s: %s", batch, e)
+            count_error(e)
+        finally:
+            db.close()
+
+
+story_clusterer = StoryClusterer()
+
+
+class StoryService:
+    """
+    Service class for browsing stories.
+    """
+
+    def __init__(self, db: Session, clusterer: StoryClusterer = story_clusterer):
+        """
+        Initialize the story service.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            clusterer (StoryClusterer): Maintains the stories; its models are used
+        """
+        self.db = db
+        self.model = clusterer.story_model
+        self.article_model = clusterer.article_model
+
+    def get_stories(
+        self, category: Optional[str] = None, offset: int = 0, limit: int = 20
+    ) -> List[StoryResponse]:
+        """
+        Retrieve a page of stories, most recently updated first.
+
+        Args:
+            category (str): Only stories of this category, if given
+            offset (int): Stories to skip
+            limit (int): Maximum stories returned
+        """
+        query = self.db.query(self.model)
+        if category:
+            query = query.filter(self.model.category == category.lower())
+        stories = (
+            query.order_by(self.model.updated_at.desc(), self.model.id.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        logger.info("Retrieved %s stories", len(stories))
+        return stories
+
+    def get_story(self, story_id: int) -> StoryDetailResponse:
+        """
+        Retrieve a story with its articles.
+
+        Raises:
+            StoryNotFoundException: If the story doesn't exist
+        """
+        story = self.db.get(self.model, story_id)
+        if story is None:
+            raise StoryNotFoundException(story_id)
+        articles = (
+            self.db.query(self.article_model)
+            .filter(self.article_model.story_id == story_id)
+            .order_by(self.article_model.id)
+            .all()
+        )
+        return StoryDetailResponse(
+            **StoryResponse.model_validate(story).model_dump(),
+            articles=[ArticleResponse.model_validate(a) for a in articles],
+        )
@@ -0,0 +1,514 @@
+"""
+User Profiles and Personalized Feeds Service Module.
+
+Users follow categories and keywords. Each user's feed is precomputed and
+stored as a compact array of article ids, best first, with a parallel array
+of scores, so reading a feed page is one primary-key lookup that slices the
+array plus one fetch of those articles.
+
+Feeds are maintained incrementally: when an article is created its id is
+queued, and a background worker fans batches of new articles out to the
+profiles whose categories or keywords they match (found through GIN indexes
+on the profile arrays), merging them into those feeds. A feed is rebuilt from
+recent articles only when its profile is created or changed.
+
+An article's score is fixed when it is ranked:
+
+    score = ranked_at / USER_FEED_HALF_LIFE + log2(relevance)
+
+so an article twice as relevant ranks like one USER_FEED_HALF_LIFE seconds
+newer, and stored feeds stay correctly ordered as time passes without being
+rescored.
+"""
+
+import math
+import queue
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import count_error
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.exceptions.summarizer_exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+)
+from backend.app.logs.summarizer_logging import get_logger
+from backend.app.models.summarizer_models import Article, UserFeed, UserProfile
+from backend.app.schemas.summarizer_schemas import (
+    UserProfileCreate,
+    UserProfileUpdate,
+)
+
+logger = get_logger("user_feeds")
+
+CATEGORY_WEIGHT = 2.0
+KEYWORD_WEIGHT = 1.0
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Application-specific key for pg_advisory_xact_lock, serializing rankers
+FEED_RANK_LOCK_KEY = 72620515
+
+# Merge each user's new (article, score) pairs into the stored arrays: keep the
+# latest score per article, order best first (newer id on ties), cap the length
+MERGE_FEEDS_SQL = """
+    WITH additions AS (
+        SELECT user_id, array_agg(article_id) AS article_ids,
+               array_agg(score) AS scores
+        FROM unnest(
+            CAST(:user_ids AS INTEGER[]),
+            CAST(:article_ids AS INTEGER[]),
+            CAST(:scores AS DOUBLE PRECISION[])
+        ) AS a(user_id, article_id, score)
+        GROUP BY user_id
+    )
+    UPDATE {table} AS f
+    SET article_ids = merged.article_ids,
+        scores = merged.scores,
+        updated_at = :updated_at
+    FROM additions AS a
+    CROSS JOIN LATERAL (
+        SELECT array_agg(article_id ORDER BY score DESC, article_id DESC)
+                   AS article_ids,
+               array_agg(score ORDER BY score DESC, article_id DESC) AS scores
+        FROM (
+            SELECT article_id, max(score) AS score
+            FROM (
+                SELECT article_id, score
+                FROM {table} AS cur,
+                     unnest(cur.article_ids, cur.scores) AS s(article_id, score)
+                WHERE cur.user_id = a.user_id
+                UNION ALL
+                SELECT * FROM unnest(a.article_ids, a.scores)
+            ) AS candidates
+            GROUP BY article_id
+            ORDER BY score DESC, article_id DESC
+            LIMIT :max_items
+        ) AS top
+    ) AS merged
+    WHERE f.user_id = a.user_id
+"""
+
+
+def normalize_categories(values: Iterable[str]) -> List[str]:
+    """Lowercase categories, deduplicated; multi-word ones are kept whole."""
+    categories = []
+    for value in values:
+        category = " ".join(value.lower().split())
+        if category and category not in categories:
+            categories.append(category)
+    return categories
+
+
+def normalize_terms(values: Iterable[str]) -> List[str]:
+    """Lowercase words of the given keywords, deduplicated."""
+    terms = []
+    for value in values:
+        for word in _WORD.findall(value.lower()):
+            if word not in terms:
+                terms.append(word)
+    return terms
+
+
+def relevance(
+    categories: Sequence[str], keywords: Sequence[str], category: str, words: set
+) -> float:
+    """
+    Relevance of an article to a profile; 0 if it matches nothing.
+
+    Args:
+        categories: Followed categories
+        keywords: Followed keywords
+        category (str): Article category, lowercase
+        words (set): Lowercase words of the article title and summary
+    """
+    score = CATEGORY_WEIGHT if category in categories else 0.0
+    return score + KEYWORD_WEIGHT * sum(1 for keyword in keywords if keyword in words)
+
+
+class FeedRanker:
+    """Maintain precomputed user feeds as articles arrive."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        article_model=Article,
+        profile_model=UserProfile,
+        feed_model=UserFeed,
+        max_items: int = settings.USER_FEED_MAX_ITEMS,
+        half_life: float = settings.USER_FEED_HALF_LIFE,
+        batch_size: int = settings.USER_FEED_RANK_BATCH,
+        backfill: int = settings.USER_FEED_BACKFILL_ARTICLES,
+    ):
+        """
+        Initialize the ranker.
+
+        Args:
+            session_factory: Creates database sessions for the worker
+            article_model: Database model class (defaults to Article)
+            profile_model: Profile model class (defaults to UserProfile)
+            feed_model: Feed model class (defaults to UserFeed)
+            max_items (int): Articles kept per feed
+            half_life (float): Seconds of recency worth doubling relevance
+            batch_size (int): New articles ranked per transaction
+            backfill (int): Recent articles ranked when a feed is rebuilt
+        """
+        self.session_factory = session_factory
+        self.article_model = article_model
+        self.profile_model = profile_model
+        self.feed_model = feed_model
+        self.max_items = max_items
+        self.half_life = half_life
+        self.batch_size = batch_size
+        self.backfill = backfill
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def article_added(self, article_id: int):
+        """Queue a newly created article for ranking into user feeds."""
+        self._ensure_worker()
+        self._queue.put(article_id)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self):
+        """Signal the worker to exit once the queue has drained."""
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def score(self, relevance: float, ranked_at: float) -> float:
+        return ranked_at / self.half_life + math.log2(relevance)
+
+    def rank_articles(self, db: Session, article_ids: List[int]) -> int:
+        """
+        Merge articles into the feeds of every profile they match.
+
+        Args:
+            db (Session): Database session; committed on success
+            article_ids (List[int]): Newly created articles
+
+        Returns:
+            int: Number of feeds updated
+        """
+        model = self.article_model
+        rows = (
+            db.query(model.id, model.title, model.summary, model.category)
+            .filter(model.id.in_(article_ids))
+            .all()
+        )
+        if not rows:
+            return 0
+        now = time.time()
+        # Batch-local inverted indexes, so only matching pairs are scored
+        by_category = defaultdict(list)
+        by_word = defaultdict(list)
+        for row in rows:
+            by_category[row.category.lower()].append(row.id)
+            for word in set(_WORD.findall(f"{row.title or ''} {row.summary}".lower())):
+                by_word[word].append(row.id)
+
+        profile = self.profile_model
+        profiles = (
+            db.query(profile.id, profile.categories, profile.keywords)
+            .filter(
+                or_(
+                    profile.categories.overlap(sorted(by_category)),
+                    profile.keywords.overlap(sorted(by_word)),
+                )
+            )
+            .all()
+        )
+        user_ids, matched_ids, scores = [], [], []
+        for user in profiles:
+            matches = defaultdict(float)
+            for category in user.categories:
+                for article_id in by_category.get(category, ()):
+                    matches[article_id] += CATEGORY_WEIGHT
+            for keyword in user.keywords:
+                for article_id in by_word.get(keyword, ()):
+                    matches[article_id] += KEYWORD_WEIGHT
+            for article_id, value in matches.items():
+                user_ids.append(user.id)
+                matched_ids.append(article_id)
+                scores.append(self.score(value, now))
+        if not user_ids:
+            db.commit()
+            return 0
+
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": FEED_RANK_LOCK_KEY}
+        )
+        # Only the new pairs travel; Postgres merges them into the stored arrays
+        result = db.execute(
+            text(MERGE_FEEDS_SQL.format(table=self.feed_model.__table__.fullname)),
+            {
+                "user_ids": user_ids,
+                "article_ids": matched_ids,
+                "scores": scores,
+                "max_items": self.max_items,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        )
+        db.commit()
+        return result.rowcount
+
+    def rebuild(self, db: Session, user) -> Tuple[List[int], List[float]]:
+        """
+        Rank recent articles for a new or changed profile and store its feed.
+
+        Backfilled articles are all ranked as of now, so among equally
+        relevant ones newer ids come first. The caller commits.
+
+        Args:
+            db (Session): Database session
+            user: Profile instance with categories and keywords set
+
+        Returns:
+            Tuple[List[int], List[float]]: The stored article ids and scores
+        """
+        model = self.article_model
+        # Serialize with rank_articles, so a merge committed between the
+        # backfill query and the upsert below is not overwritten
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": FEED_RANK_LOCK_KEY}
+        )
+        now = time.time()
+        items = []
+        if user.categories or user.keywords:
+            recent = (
+                db.query(model.id, model.title, model.summary, model.category)
+                .order_by(model.id.desc())
+                .limit(self.backfill)
+                .all()
+            )
+            for row in recent:
+                value = relevance(
+                    user.categories,
+                    user.keywords,
+                    row.category.lower(),
+                    set(_WORD.findall(f"{row.title or ''} {row.summary}".lower())),
+                )
+                if value > 0:
+                    items.append((self.score(value, now), row.id))
+        ids, scores = self._merge([], [], items)
+        values = {
+            "user_id": user.id,
+            "article_ids": ids,
+            "scores": scores,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        db.execute(
+            insert(self.feed_model)
+            .values(values)
+            .on_conflict_do_update(
+                index_elements=[self.feed_model.user_id],
+                set_={key: value for key, value in values.items() if key != "user_id"},
+            )
+        )
+        return ids, scores
+
+    def _merge(self, ids, scores, additions) -> Tuple[List[int], List[float]]:
+        merged = dict(zip(ids, scores))
+        for score, article_id in additions:
+            merged[article_id] = score
+        ranked = sorted(
+            merged.items(), key=lambda item: (item[1], item[0]), reverse=True
+        )[: self.max_items]
+        return [article_id for article_id, _ in ranked], [score for _, score in ranked]
+
+    def _ensure_worker(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._work, name="feed-ranker", daemon=True
+                )
+                self._thread.start()
+
+    def _work(self):
+        while True:
+            article_id = self._queue.get()
+            if article_id is None:
+                return
+            batch = [article_id]
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    article_id = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if article_id is None:
+                    stopping = True
+                    break
+                batch.append(article_id)
+            db = self.session_factory()
+            try:
+                updated = self.rank_articles(db, batch)
+                logger.debug(
+                    "Ranked %s new articles into %s feeds", len(batch), updated
+                )
+            except Exception as e:
+                db.rollback()
+                logger.error("Failed to rank articles %s into feeds: %s", batch, e)
+                count_error(e)
+            finally:
+                db.close()
+            if stopping:
+                return
+
+
+feed_ranker = FeedRanker()
+
+
+class UserService:
+    """
+    Service class managing user profiles and reading their precomputed feeds.
+    """
+
+    def __init__(self, db: Session, ranker: FeedRanker = feed_ranker):
+        """
+        Initialize the user service.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            ranker (FeedRanker): Maintains the feeds; its models are used
+        """
+        self.db = db
+        self.ranker = ranker
+        self.model = ranker.profile_model
+        self.feed_model = ranker.feed_model
+        self.article_model = ranker.article_model
+
+    def create_user(self, user_create: UserProfileCreate):
+        """
+        Create a user profile and build its feed from recent articles.
+
+        Raises:
+            UserAlreadyExistsException: If the name is taken
+        """
+        try:
+            if (
+                self.db.query(self.model.id)
+                .filter(self.model.name == user_create.name)
+                .first()
+            ):
+                raise UserAlreadyExistsException(user_create.name)
+            user = self.model(
+                name=user_create.name,
+                categories=normalize_categories(user_create.categories),
+                keywords=normalize_terms(user_create.keywords),
+                created_at=datetime.now(timezone.utc),
+            )
+            self.db.add(user)
+            self.db.flush()
+            self.ranker.rebuild(self.db, user)
+            self.db.commit()
+            self.db.refresh(user)
+            logger.info("User created successfully: %s", user.id)
+            return user
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to create user: %s", e)
+            raise
+
+    def get_user(self, user_id: int):
+        """
+        Retrieve a user profile by its ID.
+
+        Raises:
+            UserNotFoundException: If the user doesn't exist
+        """
+        user = self.db.query(self.model).filter(self.model.id == user_id).first()
+        if not user:
+            raise UserNotFoundException(user_id)
+        return user
+
+    def update_user(self, user_id: int, user_update: UserProfileUpdate):
+        """
+        Change a user's followed categories or keywords and rebuild the feed.
+
+        Raises:
+            UserNotFoundException: If the user doesn't exist
+        """
+        try:
+            user = self.get_user(user_id)
+            if user_update.categories is not None:
+                user.categories = normalize_categories(user_update.categories)
+            if user_update.keywords is not None:
+                user.keywords = normalize_terms(user_update.keywords)
+            self.db.flush()
+            self.ranker.rebuild(self.db, user)
+            self.db.commit()
+            self.db.refresh(user)
+            logger.info("User updated successfully: %s", user_id)
+            return user
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to update user %s: %s", user_id, e)
+            raise
+
+    def delete_user(self, user_id: int):
+        """
+        Delete a user profile and its feed.
+
+        Raises:
+            UserNotFoundException: If the user doesn't exist
+        """
+        try:
+            user = self.get_user(user_id)
+            self.db.query(self.feed_model).filter(
+                self.feed_model.user_id == user_id
+            ).delete()
+            self.db.delete(user)
+            self.db.commit()
+            logger.info("User deleted successfully: %s", user_id)
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to delete user %s: %s", user_id, e)
+            raise
+
+    def get_feed(self, user_id: int, offset: int = 0, limit: int = 20) -> list:
+        """
+        Read a page of a user's precomputed feed, best first.
+
+        Articles deleted since they were ranked are skipped, so a page can be
+        shorter than the limit.
+
+        Raises:
+            UserNotFoundException: If the user doesn't exist
+        """
+        feed = self.feed_model
+        page = (
+            self.db.query(feed.article_ids[offset + 1 : offset + limit])
+            .filter(feed.user_id == user_id)
+            .first()
+        )
+        if page is None:
+            self.get_user(user_id)
+            return []
+        ids = page[0] or []
+        if not ids:
+            return []
+        articles = {
+            article.id: article
+            for article in self.db.query(self.article_model).filter(
+                self.article_model.id.in_(ids)
+            )
+        }
+        return [articles[article_id] for article_id in ids if article_id in articles]
@@ -0,0 +1,342 @@
+"""
+Approximate Nearest-Neighbor Index for Article Vectors.
+
+An inverted-file (IVF) index in NumPy over unit-length float32 vectors, so
+the dot product is the cosine similarity. Vectors are grouped around k-means
+centroids, and a search scans only the groups of the `probes` centroids
+nearest to the query. Until the index holds `min_train` vectors it is not
+trained and searches are exact. The index grows incrementally: new vectors
+join the group of their nearest centroid, and the centroids are retrained
+whenever the index has grown fourfold since the last training.
+
+Snapshots are .npy files written to a new generation directory, which the
+CURRENT file then names. Loading maps the snapshot's vectors read-only, so a
+worker starts without reading them into memory and workers share the page
+cache. Vectors added after loading are kept in memory until the next snapshot.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+CURRENT = "CURRENT"
+KEEP_GENERATIONS = 2
+KMEANS_ITERATIONS = 10
+# Training sample size per centroid
+KMEANS_SAMPLE_PER_LIST = 64
+RETRAIN_GROWTH = 4
+CHUNK_ROWS = 65536
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length as float32; zero rows stay zero."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """Cosine-similarity index of vectors keyed by integer id."""
+
+    def __init__(self, dim: int, probes: int = 8, min_train: int = 4096, seed=0):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim (int): Vector dimensions
+            probes (int): Groups scanned per approximate search
+            min_train (int): Vectors below which searches are exact
+            seed: Seed for k-means sampling, for reproducible training
+        """
+        self.dim = dim
+        self.probes = probes
+        self.min_train = min_train
+        self.max_id = 0
+        self.added_since_snapshot = 0
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        # Rows [0, len(_base)) come from the mapped snapshot, the rest from _tail
+        self._base = np.empty((0, dim), dtype=np.float32)
+        self._tail = np.empty((0, dim), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._lists = np.empty(0, dtype=np.int32)
+        self._alive = np.empty(0, dtype=bool)
+        self._count = 0
+        self._positions = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_count = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._positions
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, ids: Iterable[int], vectors: np.ndarray):
+        """
+        Add or replace vectors.
+
+        Args:
+            ids (Iterable[int]): Ids of the vectors
+            vectors (np.ndarray): One row per id; normalized on insertion
+        """
+        ids = np.asarray(list(ids), dtype=np.int64)
+        vectors = normalize(np.reshape(vectors, (len(ids), self.dim)))
+        if not len(ids):
+            return
+        with self._lock:
+            start = self._count
+            end = start + len(ids)
+            self._reserve(end)
+            base = len(self._base)
+            self._tail[start - base : end - base] = vectors
+            self._ids[start:end] = ids
+            self._alive[start:end] = True
+            self._lists[start:end] = self._assign(vectors) if self.trained else 0
+            for row, item_id in enumerate(ids.tolist(), start):
+                replaced = self._positions.get(item_id)
+                if replaced is not None:
+                    self._alive[replaced] = False
+                self._positions[item_id] = row
+            self._count = end
+            self.max_id = max(self.max_id, int(ids.max()))
+            self.added_since_snapshot += len(ids)
+            self._maybe_train()
+
+    def remove(self, item_id: int) -> bool:
+        """Remove a vector; returns False if the id is not indexed."""
+        with self._lock:
+            row = self._positions.pop(item_id, None)
+            if row is None:
+                return False
+            self._alive[row] = False
+            return True
+
+    def vector(self, item_id: int) -> Optional[np.ndarray]:
+        """Return a copy of the stored (normalized) vector, or None."""
+        with self._lock:
+            row = self._positions.get(item_id)
+            if row is None:
+                return None
+            return np.array(self._take(np.array([row]))[0])
+
+    def search(
+        self,
+        vector: np.ndarray,
+        k: int,
+        exclude: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the vectors most similar to a query.
+
+        Args:
+            vector (np.ndarray): Query vector
+            k (int): Number of results
+            exclude (int): Id left out of the results, e.g. the query's own
+            exact (bool): Scan every vector instead of the nearest groups
+
+        Returns:
+            List[Tuple[int, float]]: (id, cosine similarity), most similar first
+        """
+        query = normalize(np.reshape(vector, self.dim))
+        with self._lock:
+            alive = self._alive[: self._count]
+            if exact or not self.trained:
+                rows = np.flatnonzero(alive)
+            else:
+                probes = min(self.probes, len(self._centroids))
+                similarity = self._centroids @ query
+                nearest = np.argpartition(-similarity, probes - 1)[:probes]
+                rows = np.flatnonzero(
+                    np.isin(self._lists[: self._count], nearest) & alive
+                )
+            if exclude is not None and exclude in self._positions:
+                rows = rows[rows != self._positions[exclude]]
+            if not len(rows) or k <= 0:
+                return []
+            scores = self._take(rows) @ query
+            ids = self._ids[rows]
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+    def save(self, directory: str, meta: Optional[dict] = None) -> str:
+        """
+        Write a snapshot and switch to its mapped vectors.
+
+        Removed and replaced vectors are dropped from the snapshot. Older
+        generations beyond the previous one are deleted; workers still
+        mapping them keep their open files.
+
+        Args:
+            directory (str): Snapshot directory, created if missing
+            meta (dict): Extra metadata stored with the snapshot
+
+        Returns:
+            str: Path of the new generation
+        """
+        os.makedirs(directory, exist_ok=True)
+        generation = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        staging = os.path.join(directory, f".tmp-{generation}")
+        path = os.path.join(directory, generation)
+        with self._lock:
+            rows = np.flatnonzero(self._alive[: self._count])
+            os.makedirs(staging)
+            vectors = np.lib.format.open_memmap(
+                os.path.join(staging, "vectors.npy"),
+                mode="w+",
+                dtype=np.float32,
+                shape=(len(rows), self.dim),
+            )
+            for start in range(0, len(rows), CHUNK_ROWS):
+                chunk = rows[start : start + CHUNK_ROWS]
+                vectors[start : start + len(chunk)] = self._take(chunk)
+            vectors.flush()
+            del vectors
+            np.save(os.path.join(staging, "ids.npy"), self._ids[rows])
+            np.save(os.path.join(staging, "lists.npy"), self._lists[rows])
+            if self.trained:
+                np.save(os.path.join(staging, "centroids.npy"), self._centroids)
+            with open(os.path.join(staging, "meta.json"), "w") as f:
+                json.dump(
+                    {
+                        **(meta or {}),
+                        "dim": self.dim,
+                        "count": len(rows),
+                        "trained_count": self._trained_count,
+                    },
+                    f,
+                )
+            os.rename(staging, path)
+            pointer = os.path.join(directory, f".{CURRENT}-{generation}")
+            with open(pointer, "w") as f:
+                f.write(generation)
+            os.replace(pointer, os.path.join(directory, CURRENT))
+            self._open(path)
+        _prune(directory, generation)
+        return path
+
+    def load(self, directory: str) -> Optional[dict]:
+        """
+        Replace the contents with the current snapshot of a directory.
+
+        Returns:
+            dict: The snapshot's metadata, or None if there is no snapshot
+
+        Raises:
+            ValueError: If the snapshot has different dimensions
+        """
+        try:
+            with open(os.path.join(directory, CURRENT)) as f:
+                generation = f.read().strip()
+        except FileNotFoundError:
+            return None
+        path = os.path.join(directory, generation)
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta["dim"] != self.dim:
+            raise ValueError(
+                f"Snapshot has {meta['dim']} dimensions, expected {self.dim}"
+            )
+        with self._lock:
+            self._open(path)
+        return meta
+
+    def _open(self, path: str):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        self._base = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        self._ids = np.load(os.path.join(path, "ids.npy"))
+        self._lists = np.load(os.path.join(path, "lists.npy"))
+        self._count = len(self._ids)
+        self._alive = np.ones(self._count, dtype=bool)
+        self._tail = np.empty((0, self.dim), dtype=np.float32)
+        self._positions = dict(zip(self._ids.tolist(), range(self._count)))
+        centroids = os.path.join(path, "centroids.npy")
+        self._centroids = np.load(centroids) if os.path.exists(centroids) else None
+        self._trained_count = meta["trained_count"]
+        self.max_id = int(self._ids.max()) if self._count else 0
+        self.added_since_snapshot = 0
+
+    def _reserve(self, rows: int):
+        capacity = len(self._ids)
+        if rows <= capacity:
+            return
+        capacity = max(rows, capacity * 2, 1024)
+        base = len(self._base)
+        tail = np.empty((capacity - base, self.dim), dtype=np.float32)
+        tail[: self._count - base] = self._tail[: self._count - base]
+        self._tail = tail
+        self._ids = np.resize(self._ids, capacity)
+        self._lists = np.resize(self._lists, capacity)
+        self._alive = np.resize(self._alive, capacity)
+
+    def _take(self, rows: np.ndarray) -> np.ndarray:
+        """Gather vectors of ascending row numbers from the snapshot and tail."""
+        base = len(self._base)
+        split = int(np.searchsorted(rows, base))
+        if split == len(rows):
+            return np.asarray(self._base[rows])
+        if split == 0:
+            return self._tail[rows - base]
+        return np.concatenate(
+            [self._base[rows[:split]], self._tail[rows[split:] - base]]
+        )
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _maybe_train(self):
+        live = len(self._positions)
+        if live < self.min_train:
+            return
+        if self.trained and live < self._trained_count * RETRAIN_GROWTH:
+            return
+        self._train()
+
+    def _train(self):
+        """Spherical k-means on a sample, then reassign every vector."""
+        rows = np.flatnonzero(self._alive[: self._count])
+        lists = max(1, int(np.sqrt(len(rows))))
+        sample_rows = self._rng.choice(
+            rows, min(len(rows), lists * KMEANS_SAMPLE_PER_LIST), replace=False
+        )
+        sample = self._take(np.sort(sample_rows))
+        centroids = sample[self._rng.choice(len(sample), lists, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            # Empty clusters keep their previous centroid
+            empty = np.bincount(labels, minlength=lists) == 0
+            sums[empty] = centroids[empty]
+            centroids = normalize(sums)
+        self._centroids = centroids
+        for start in range(0, self._count, CHUNK_ROWS):
+            chunk = np.arange(start, min(start + CHUNK_ROWS, self._count))
+            self._lists[chunk] = self._assign(self._take(chunk))
+        self._trained_count = len(rows)
+
+
+def _prune(directory: str, keep: str):
+    """Delete snapshot generations older than the previous one."""
+    generations = sorted(
+        name
+        for name in os.listdir(directory)
+        if not name.startswith(".") and name != CURRENT and name <= keep
+    )
+    for name in generations[:-KEEP_GENERATIONS]:
+        shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
@@ -0,0 +1,366 @@
+"""
+End-to-end API load benchmark.
+
+Starts a fake news site and a fake Azure OpenAI endpoint, runs the real
+FastAPI app under uvicorn against them and the configured database, then
+submits articles at increasing concurrency. Every request scrapes, parses,
+summarizes and stores a unique article. For each level it reports
+throughput, p50/p95/p99 latency and the app's resident memory, and writes
+the results as JSON for comparison with `backend.benchmarks.results`.
+
+With --read-concurrency, reader clients poll a cheap read endpoint (delta
+sync) alone first and then alongside every level, so the read latency under
+an ingestion flood can be compared with the idle read latency. Submissions
+shed by admission control (429/503) are counted separately.
+
+Usage:
+    python -m backend.benchmarks.bench_api [--concurrency 1,4,16]
+        [--requests N] [--site-latency S] [--llm-latency S]
+        [--llm-error-rate R] [--workers W] [--app-log-level LEVEL]
+        [--read-concurrency N] [--output FILE] [--compare BASELINE.json]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+from backend.benchmarks.fake_azure_openai import FakeAzureOpenAI
+from backend.benchmarks.fake_news_site import FakeNewsSite
+from backend.benchmarks.results import (
+    compare_results,
+    load_results,
+    run_metadata,
+    save_results,
+    summarize_latencies,
+)
+
+try:
+    import psutil
+except ImportError:  # Fall back to /proc on Linux
+    psutil = None
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+API_PREFIX = "/api/v1"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """Resident memory of a process and its children (uvicorn workers)."""
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            processes = [process, *process.children(recursive=True)]
+            return sum(p.memory_info().rss for p in processes)
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+class MemorySampler:
+    """Sample a process's RSS in the background and keep the peak."""
+
+    def __init__(self, pid: int, interval: float = 0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, rss_bytes(self.pid) or 0)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def start_app(port: int, env: dict, workers: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The app exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("The app did not start within 60 seconds")
+
+
+async def read_loop(
+    client: httpx.AsyncClient, done: asyncio.Event, latencies, statuses
+):
+    """Poll a cheap read endpoint until done is set."""
+    while not done.is_set():
+        start = time.perf_counter()
+        try:
+            response = await client.get(
+                f"{API_PREFIX}/articles/changes", params={"limit": 20}
+            )
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        latencies.append(time.perf_counter() - start)
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+async def run_reads(base_url: str, concurrency: int, seconds: float):
+    """Read with `concurrency` clients and nothing else for `seconds`."""
+    latencies: List[float] = []
+    statuses = {}
+    done = asyncio.Event()
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        readers = [
+            asyncio.ensure_future(read_loop(client, done, latencies, statuses))
+            for _ in range(concurrency)
+        ]
+        await asyncio.sleep(seconds)
+        done.set()
+        await asyncio.gather(*readers)
+    return latencies, statuses
+
+
+async def run_level(
+    base_url: str,
+    site: FakeNewsSite,
+    first_id: int,
+    requests: int,
+    concurrency: int,
+    read_concurrency: int = 0,
+):
+    """
+    Submit `requests` unique articles with `concurrency` concurrent clients,
+    while `read_concurrency` clients keep reading.
+    """
+    latencies: List[float] = []
+    statuses = {}
+    read_latencies: List[float] = []
+    read_statuses = {}
+    next_id = iter(range(first_id, first_id + requests))
+
+    async def client_loop(client: httpx.AsyncClient):
+        for article_id in next_id:
+            start = time.perf_counter()
+            try:
+                response = await client.post(
+                    f"{API_PREFIX}/articles/",
+                    json={"url": site.article_url(article_id)},
+                )
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    limits = httpx.Limits(max_connections=concurrency + read_concurrency)
+    done = asyncio.Event()
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=300
+    ) as client:
+        readers = [
+            asyncio.ensure_future(
+                read_loop(client, done, read_latencies, read_statuses)
+            )
+            for _ in range(read_concurrency)
+        ]
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await asyncio.gather(*readers)
+    return latencies, statuses, elapsed, read_latencies, read_statuses
+
+
+def delete_benchmark_articles(url_prefix: str) -> int:
+    from sqlalchemy import delete
+
+    from backend.app.db.summarizer_db import SessionLocal
+    from backend.app.models.summarizer_models import Article
+
+    with SessionLocal() as db:
+        result = db.execute(delete(Article).where(Article.url.like(f"{url_prefix}%")))
+        db.commit()
+        return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", default="1,4,16,32")
+    parser.add_argument("--requests", type=int, default=100, help="per level")
+    parser.add_argument("--site-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", default="bench_api_results.json")
+    parser.add_argument("--compare", help="baseline results file")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--app-log-level", default="WARNING")
+    parser.add_argument("--keep-articles", action="store_true")
+    parser.add_argument(
+        "--read-concurrency", type=int, default=0, help="readers during each level"
+    )
+    parser.add_argument(
+        "--read-baseline", type=float, default=5.0, help="seconds of idle reads"
+    )
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    site = FakeNewsSite(latency=args.site_latency).start()
+    llm = FakeAzureOpenAI(
+        latency=args.llm_latency, error_rate=args.llm_error_rate, seed=0
+    ).start()
+    port = free_port()
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join([str(REPO_ROOT), str(REPO_ROOT / "backend")]),
+        AZURE_OPENAI_ENDPOINT=llm.endpoint,
+        AZURE_OPENAI_API_KEY="benchmark",
+        # Every article comes from one fake host; do not throttle it
+        SCRAPE_MIN_HOST_DELAY="0",
+        SCRAPE_PER_HOST_CONCURRENCY=str(max(levels) * args.workers),
+        SCRAPE_MAX_CONNECTIONS=str(max(levels) * args.workers),
+        FEED_POLL_INTERVAL="0",
+        LOG_LEVEL=args.app_log_level,
+    )
+    app = start_app(port, env, args.workers)
+    base_url = f"http://127.0.0.1:{port}"
+    first_id = int(time.time() * 1000)
+
+    results = {"meta": run_metadata("bench_api", vars(args)), "levels": []}
+    try:
+        if args.read_concurrency:
+            read_latencies, read_statuses = asyncio.run(
+                run_reads(base_url, args.read_concurrency, args.read_baseline)
+            )
+            results["idle_reads"] = {
+                "requests": len(read_latencies),
+                "statuses": {str(k): v for k, v in read_statuses.items()},
+                "latency_ms": summarize_latencies(read_latencies),
+            }
+            print(
+                f"Idle reads: p50 {results['idle_reads']['latency_ms']['p50']:.1f} ms,"
+                f" p99 {results['idle_reads']['latency_ms']['p99']:.1f} ms"
+            )
+        print(
+            f"{'conc':>5} {'ok':>5} {'shed':>5} {'err':>5} {'req/s':>8} {'p50 ms':>9}"
+            f" {'p95 ms':>9} {'p99 ms':>9} {'rss MB':>8} {'read p99':>9}"
+        )
+        for concurrency in levels:
+            with MemorySampler(app.pid) as memory:
+                latencies, statuses, elapsed, read_latencies, read_statuses = (
+                    asyncio.run(
+                        run_level(
+                            base_url,
+                            site,
+                            first_id,
+                            args.requests,
+                            concurrency,
+                            args.read_concurrency,
+                        )
+                    )
+                )
+            first_id += args.requests
+            ok = statuses.get(200, 0)
+            shed = statuses.get(429, 0) + statuses.get(503, 0)
+            latency = summarize_latencies(latencies)
+            level = {
+                "concurrency": concurrency,
+                "requests": len(latencies),
+                "ok": ok,
+                "shed": shed,
+                "statuses": {str(k): v for k, v in statuses.items()},
+                "elapsed_s": round(elapsed, 3),
+                "throughput_rps": round(ok / elapsed, 3),
+                "latency_ms": latency,
+                "rss_mb": {
+                    "peak": round(memory.peak / 2**20, 1),
+                    "end": round((rss_bytes(app.pid) or 0) / 2**20, 1),
+                },
+            }
+            read_p99 = ""
+            if read_latencies:
+                level["reads"] = {
+                    "requests": len(read_latencies),
+                    "statuses": {str(k): v for k, v in read_statuses.items()},
+                    "latency_ms": summarize_latencies(read_latencies),
+                }
+                read_p99 = f"{level['reads']['latency_ms']['p99']:.1f}"
+            results["levels"].append(level)
+            print(
+                f"{concurrency:>5} {ok:>5} {shed:>5} {len(latencies) - ok - shed:>5}"
+                f" {level['throughput_rps']:>8.2f} {latency['p50']:>9.1f}"
+                f" {latency['p95']:>9.1f} {latency['p99']:>9.1f}"
+                f" {level['rss_mb']['peak']:>8.1f} {read_p99:>9}"
+            )
+    finally:
+        app.terminate()
+        app.wait(timeout=30)
+        results["meta"]["llm"] = {"requests": llm.requests, "throttled": llm.throttled}
+        site.stop()
+        llm.stop()
+        if not args.keep_articles:
+            deleted = delete_benchmark_articles(site.base_url)
+            print(f"Deleted {deleted} benchmark articles")
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        rows = compare_results(load_results(args.compare), results, args.threshold)
+        regressions = [row for row in rows if row["regression"]]
+        for row in regressions:
+            print(
+                f"REGRESSION at concurrency {row['concurrency']}: {row['metric']}"
+                f" {row['baseline']} -> {row['candidate']} ({row['change_pct']:+}%)"
+            )
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+LLM micro-batching throughput benchmark.
+
+Summarizes synthetic short articles through the LLM batcher against the fake
+Azure OpenAI endpoint, at several concurrency levels and batch sizes (batch
+size 1 is the unbatched baseline). The fake's latency grows with the tokens
+it generates, so a batched reply is slower than a single one, as with the
+real service. For each run it reports throughput, p50/p95/p99 latency per
+article, LLM calls and prompt tokens per article, and writes the results as
+JSON.
+
+Usage:
+    python -m backend.benchmarks.bench_llm_batching [--concurrency 1,8,32]
+        [--batch-sizes 1,4,8,16] [--articles N] [--words W] [--max-wait S]
+        [--llm-latency S] [--token-latency S] [--app-log-level LEVEL]
+        [--output FILE]
+"""
+
+import argparse
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.app.core.summarizer_config import settings
+from backend.app.services.summarizer_llm_batcher import LLMBatcher
+from backend.benchmarks.fake_azure_openai import FakeAzureOpenAI
+from backend.benchmarks.fake_news_site import SENTENCES
+from backend.benchmarks.results import run_metadata, save_results, summarize_latencies
+
+
+def short_article(article_id: int, words: int) -> str:
+    """A reproducible article of roughly `words` words."""
+    rng = random.Random(article_id)
+    text = []
+    while len(text) < words:
+        text.extend(rng.choice(SENTENCES).split())
+    return " ".join(text[:words])
+
+
+def run(batcher: LLMBatcher, contents, concurrency: int):
+    latencies = []
+
+    def summarize(content: str):
+        start = time.perf_counter()
+        batcher.summarize(content)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(summarize, contents))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--batch-sizes", default="1,4,8,16")
+    parser.add_argument("--articles", type=int, default=200, help="per run")
+    parser.add_argument("--words", type=int, default=150, help="per article")
+    parser.add_argument("--max-wait", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.002)
+    parser.add_argument("--app-log-level", default="WARNING")
+    parser.add_argument("--output", default="bench_llm_batching_results.json")
+    args = parser.parse_args()
+    logging.getLogger("summarizer").setLevel(args.app_log_level)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",")]
+
+    llm = FakeAzureOpenAI(
+        latency=args.llm_latency, token_latency=args.token_latency, seed=0
+    ).start()
+    settings.AZURE_OPENAI_ENDPOINT = llm.endpoint
+    settings.AZURE_OPENAI_API_KEY = "benchmark"
+
+    results = {"meta": run_metadata("bench_llm_batching", vars(args)), "levels": []}
+    print(
+        f"{'conc':>5} {'batch':>5} {'art/s':>8} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9} {'calls':>6} {'tok/art':>8}"
+    )
+    article_id = 0
+    try:
+        for concurrency in levels:
+            for batch_size in batch_sizes:
+                batcher = LLMBatcher(
+                    batch_size=batch_size,
+                    max_wait=args.max_wait,
+                    max_words=args.words,
+                )
+                contents = [
+                    short_article(article_id + i, args.words)
+                    for i in range(args.articles)
+                ]
+                article_id += args.articles
+                calls, tokens = llm.requests, llm.prompt_tokens
+                latencies, elapsed = run(batcher, contents, concurrency)
+                calls, tokens = llm.requests - calls, llm.prompt_tokens - tokens
+                latency = summarize_latencies(latencies)
+                level = {
+                    "concurrency": concurrency,
+                    "batch_size": batch_size,
+                    "articles": len(latencies),
+                    "elapsed_s": round(elapsed, 3),
+                    "throughput_aps": round(len(latencies) / elapsed, 3),
+                    "latency_ms": latency,
+                    "llm_calls": calls,
+                    "prompt_tokens_per_article": round(tokens / len(latencies), 1),
+                }
+                results["levels"].append(level)
+                print(
+                    f"{concurrency:>5} {batch_size:>5}"
+                    f" {level['throughput_aps']:>8.2f} {latency['p50']:>9.1f}"
+                    f" {latency['p95']:>9.1f} {latency['p99']:>9.1f}"
+                    f" {calls:>6} {level['prompt_tokens_per_article']:>8.1f}"
+                )
+    finally:
+        llm.stop()
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
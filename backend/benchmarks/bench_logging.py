@@ -0,0 +1,111 @@
+"""
+Per-request logging overhead benchmark.
+
+Compares the time a request thread spends in logging calls with the file and
+console handlers attached directly to the logger (the previous setup, using
+f-string messages) against the queue handler used by setup_logging (using
+lazy %-style messages). The simulated request emits the same records as a
+create_article call: two session logs from get_db plus the service logs.
+
+Usage:
+    python -m backend.benchmarks.bench_logging [--requests N]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+
+from backend.app.logs.summarizer_logging import (
+    LOG_FORMAT,
+    StructuredFormatter,
+    build_queue_handler,
+)
+
+URL = "https://news.example.com/2024/05/02/some-long-article-slug"
+TITLE = "Example headline about something newsworthy"
+
+
+def make_handlers(log_dir: str):
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, "bench.log"), maxBytes=5 * 1024 * 1024, backupCount=5
+    )
+    stream_handler = logging.StreamHandler(open(os.devnull, "w"))
+    for handler in (file_handler, stream_handler):
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(StructuredFormatter(LOG_FORMAT))
+    return [file_handler, stream_handler]
+
+
+def request_fstring(logger: logging.Logger, article_id: int):
+    logger.info("Database session created")
+    logger.info(f"Article scraped successfully: {URL}")
+    logger.info(f"Title: {TITLE}")
+    logger.debug(f"Raw response: {TITLE * 20}")
+    logger.info("Article summary and classification generated successfully")
+    logger.info(f"Article summarized and classified successfully: {URL}")
+    logger.info(f"Article created successfully: {article_id}")
+    logger.info("Database session closed")
+
+
+def request_lazy(logger: logging.Logger, article_id: int):
+    logger.info("Database session created")
+    logger.info("Article scraped successfully: %s", URL)
+    logger.info("Title: %s", TITLE)
+    logger.debug("Raw response: %s", TITLE * 20)
+    logger.info("Article summary and classification generated successfully")
+    logger.info("Article summarized and classified successfully: %s", URL)
+    logger.info("Article created successfully: %s", article_id)
+    logger.info("Database session closed")
+
+
+def run(name: str, logger: logging.Logger, request, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        request(logger, i)
+    elapsed = time.perf_counter() - start
+    per_request_us = elapsed / requests * 1e6
+    print(f"{name:<34} {per_request_us:8.1f} us/request")
+    return per_request_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        direct = logging.getLogger("bench.direct")
+        direct.propagate = False
+        direct.setLevel(logging.INFO)
+        for handler in make_handlers(log_dir):
+            direct.addHandler(handler)
+        before = run(
+            "direct handlers + f-strings", direct, request_fstring, args.requests
+        )
+
+        queued = logging.getLogger("bench.queued")
+        queued.propagate = False
+        queued.setLevel(logging.INFO)
+        queue_handler = build_queue_handler(make_handlers(log_dir), maxsize=10000)
+        queued.addHandler(queue_handler)
+        after = run("queue handler + %-style", queued, request_lazy, args.requests)
+        queue_handler.listener.stop()
+
+        silenced = logging.getLogger("bench.silenced")
+        silenced.propagate = False
+        silenced.setLevel(logging.WARNING)
+        silenced.addHandler(build_queue_handler(make_handlers(log_dir), 10000))
+        silent = run(
+            "queue handler, level WARNING", silenced, request_lazy, args.requests
+        )
+
+    print(f"speedup (queued vs direct):        {before / after:8.1f}x")
+    print(f"speedup (silenced vs direct):      {before / silent:8.1f}x")
+    print(f"records dropped by queue handler:  {queue_handler.dropped:8d}")
+
+
+if __name__ == "__main__":
+    main()
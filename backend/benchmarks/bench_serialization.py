@@ -0,0 +1,117 @@
+"""
+Article list serialization benchmark.
+
+Measures the CPU time to turn a page of articles into a JSON response body,
+the work a list endpoint does after its query returns:
+
+- response_model: Pydantic validation of ORM objects and JSON encoding by the
+  response model, as FastAPI does for `response_model=list[ArticleResponse]`
+- jsonable_encoder: validation, jsonable_encoder and the standard json module,
+  as JSONResponse does
+- fast_cold: the FAST_JSON path with an empty fragment cache: validation from
+  row tuples and orjson encoding of every article
+- fast_warm: the FAST_JSON path once every article's fragment is cached
+
+Nothing touches the database or the network; results are written as JSON.
+
+Usage:
+    python -m backend.benchmarks.bench_serialization [--rows N] [--repeats N]
+        [--output FILE]
+"""
+
+import argparse
+import json
+import time
+from collections import namedtuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from backend.app.models.summarizer_models import Article
+from backend.app.routers.summarizer_routers import JSONFragmentsResponse
+from backend.app.schemas.summarizer_schemas import ArticleResponse
+from backend.app.services.summarizer_article_cache import ArticleFragments
+from backend.benchmarks.fake_news_site import SENTENCES
+from backend.benchmarks.results import run_metadata, save_results, summarize_latencies
+
+Row = namedtuple("Row", ArticleFragments.COLUMNS)
+ARTICLES = TypeAdapter(list[ArticleResponse])
+
+
+def make_rows(count: int):
+    return [
+        Row(
+            id=i,
+            summary_version="gpt4o-mini:0123456789ab",
+            title=f"Headline number {i} about something newsworthy",
+            url=f"https://news.example.com/2024/05/02/article-{i}",
+            summary=" ".join(SENTENCES[i % len(SENTENCES) :][:3]),
+            category="technology",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def response_model(objects, fragments) -> bytes:
+    return ARTICLES.dump_json(ARTICLES.validate_python(objects, from_attributes=True))
+
+
+def standard_json(objects, fragments) -> bytes:
+    articles = [ArticleResponse.model_validate(article) for article in objects]
+    return JSONResponse(jsonable_encoder(articles)).body
+
+
+def fast(rows, fragments) -> bytes:
+    return JSONFragmentsResponse(fragments.encode(rows)).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", default="bench_serialization_results.json")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    objects = [
+        Article(**{column: getattr(row, column) for column in Row._fields})
+        for row in rows
+    ]
+    warm = ArticleFragments(max_size=args.rows)
+    warm.encode(rows)
+    modes = {
+        "response_model": (response_model, objects, None),
+        "jsonable_encoder": (standard_json, objects, None),
+        "fast_cold": (fast, rows, ArticleFragments(max_size=0)),
+        "fast_warm": (fast, rows, warm),
+    }
+
+    expected = json.loads(response_model(objects, None))
+    results = {"meta": run_metadata("bench_serialization", vars(args))}
+    print(f"{'mode':<18} {'p50 ms':>9} {'p95 ms':>9} {'us/row':>8} {'bytes':>10}")
+    for mode, (serialize, inputs, fragments) in modes.items():
+        body = serialize(inputs, fragments)
+        assert json.loads(body) == expected, mode
+        latencies = []
+        for _ in range(args.repeats):
+            began = time.perf_counter()
+            serialize(inputs, fragments)
+            latencies.append(time.perf_counter() - began)
+        summary = summarize_latencies(latencies)
+        results[mode] = {
+            "latency_ms": summary,
+            "us_per_row": round(summary["p50"] * 1000 / args.rows, 3),
+            "bytes": len(body),
+        }
+        print(
+            f"{mode:<18} {summary['p50']:>9.2f} {summary['p95']:>9.2f}"
+            f" {results[mode]['us_per_row']:>8.3f} {len(body):>10}"
+        )
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Similar-article index benchmark.
+
+Embeds synthetic articles with the hashing embedder (sentences from the fake
+news site plus a few Zipf-distributed topic words each) and grows the vector
+index in batches, the way articles arrive. It then compares approximate and
+exact search: latency percentiles and recall@k of the approximate results.
+Finally it writes a snapshot and measures how long a new worker takes to load
+it. Nothing touches the database or the network; results are written as JSON.
+
+Usage:
+    python -m backend.benchmarks.bench_similar [--articles N] [--dim D]
+        [--probes P] [--min-train N] [--queries N] [--k K] [--output FILE]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from backend.app.services.summarizer_embeddings import HashingEmbedder
+from backend.app.services.summarizer_vector_index import VectorIndex
+from backend.benchmarks.fake_news_site import SENTENCES
+from backend.benchmarks.results import run_metadata, save_results, summarize_latencies
+
+TOPICS = [f"topic{i}" for i in range(2000)]
+TOPIC_WEIGHTS = [1 / rank for rank in range(1, len(TOPICS) + 1)]
+ADD_BATCH = 1000
+
+
+def synthetic_article(rng: random.Random) -> str:
+    topics = rng.choices(TOPICS, TOPIC_WEIGHTS, k=4)
+    return " ".join(rng.sample(SENTENCES, 3) + topics * 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--probes", type=int, default=8)
+    parser.add_argument("--min-train", type=int, default=4096)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--output", default="bench_similar_results.json")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    embedder = HashingEmbedder(args.dim)
+    index = VectorIndex(args.dim, probes=args.probes, min_train=args.min_train)
+    results = {"meta": run_metadata("bench_similar", vars(args))}
+
+    embed_seconds = add_seconds = 0.0
+    query_vectors = []
+    for start in range(0, args.articles, ADD_BATCH):
+        count = min(ADD_BATCH, args.articles - start)
+        texts = [synthetic_article(rng) for _ in range(count)]
+        began = time.perf_counter()
+        vectors = embedder.embed(texts)
+        embed_seconds += time.perf_counter() - began
+        began = time.perf_counter()
+        index.add(range(start + 1, start + count + 1), vectors)
+        add_seconds += time.perf_counter() - began
+        if len(query_vectors) < args.queries:
+            query_vectors.extend(vectors[: args.queries - len(query_vectors)])
+    results["embed_per_s"] = round(args.articles / embed_seconds, 1)
+    results["add_per_s"] = round(args.articles / add_seconds, 1)
+    results["bytes_per_vector"] = args.dim * 4
+    print(
+        f"Embedded {args.articles} articles: {results['embed_per_s']:.0f}/s,"
+        f" indexed {results['add_per_s']:.0f}/s (including training),"
+        f" {results['bytes_per_vector']} bytes per vector"
+    )
+
+    latencies = {"approximate": [], "exact": []}
+    recall = []
+    for query in query_vectors:
+        found = {}
+        for mode in latencies:
+            began = time.perf_counter()
+            hits = index.search(query, args.k, exact=mode == "exact")
+            latencies[mode].append(time.perf_counter() - began)
+            found[mode] = {item_id for item_id, _ in hits}
+        recall.append(len(found["approximate"] & found["exact"]) / args.k)
+    results["search_ms"] = {
+        mode: summarize_latencies(values) for mode, values in latencies.items()
+    }
+    results["recall_at_k"] = round(float(np.mean(recall)), 4)
+    print(f"{'search':<12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for mode, summary in results["search_ms"].items():
+        print(
+            f"{mode:<12} {summary['p50']:>9.2f} {summary['p95']:>9.2f}"
+            f" {summary['p99']:>9.2f}"
+        )
+    print(f"Recall@{args.k} of approximate search: {results['recall_at_k']:.3f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        began = time.perf_counter()
+        index.save(directory)
+        save_seconds = time.perf_counter() - began
+        began = time.perf_counter()
+        loaded = VectorIndex(args.dim, probes=args.probes, min_train=args.min_train)
+        loaded.load(directory)
+        load_seconds = time.perf_counter() - began
+        began = time.perf_counter()
+        loaded.search(query_vectors[0], args.k)
+        first_search = time.perf_counter() - began
+    results["snapshot_s"] = {
+        "save": round(save_seconds, 3),
+        "load": round(load_seconds, 3),
+        "first_search": round(first_search, 3),
+    }
+    print(
+        f"Snapshot written in {save_seconds:.2f}s, loaded in {load_seconds:.3f}s,"
+        f" first search {first_search * 1000:.1f} ms"
+    )
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Personalized feed benchmark with many synthetic users.
+
+Creates synthetic user profiles (random followed categories and keywords) in
+the configured database; keywords and article topics follow a Zipf
+distribution over a topic vocabulary. It then ingests synthetic articles in
+batches through the feed ranker and measures the fan-out cost. Afterwards it reads random
+feed pages and, for comparison, ranks feeds at read time the way a profile
+rebuild does. Reports ingestion throughput, read latency percentiles and
+stored bytes per feed, writes the results as JSON, and deletes everything it
+created.
+
+Usage:
+    python -m backend.benchmarks.bench_user_feeds [--users N] [--articles N]
+        [--batch N] [--reads N] [--read-time-reads N] [--feed-size N]
+        [--output FILE]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from sqlalchemy import func, insert, text
+
+from backend.app.db.summarizer_db import SessionLocal
+from backend.app.models.summarizer_models import Article, UserFeed, UserProfile
+from backend.app.services.summarizer_user_services import (
+    FeedRanker,
+    UserService,
+    normalize_terms,
+)
+from backend.benchmarks.fake_news_site import SENTENCES
+from backend.benchmarks.results import run_metadata, save_results, summarize_latencies
+
+CATEGORIES = ("sports", "business", "technology", "entertainment", "health", "general")
+# Topic words with Zipf-distributed popularity
+TOPICS = [f"topic{i}" for i in range(2000)]
+TOPIC_WEIGHTS = [1 / rank for rank in range(1, len(TOPICS) + 1)]
+NAME_PREFIX = "bench-user-"
+URL_PREFIX = "https://bench-user-feeds.invalid/"
+
+
+def create_users(db, count: int, rng: random.Random):
+    profiles = [
+        {
+            "name": f"{NAME_PREFIX}{i}",
+            "categories": rng.sample(CATEGORIES, rng.randint(0, 2)),
+            "keywords": normalize_terms(
+                rng.choices(TOPICS, TOPIC_WEIGHTS, k=rng.randint(0, 3))
+            ),
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, 5000):
+        db.execute(insert(UserProfile), profiles[start : start + 5000])
+    # Empty feeds, as profile creation would leave them with no articles yet
+    db.execute(
+        text(
+            "INSERT INTO summary.user_feeds (user_id, article_ids, scores)"
+            " SELECT id, '{}', '{}' FROM summary.user_profiles WHERE name LIKE :p"
+        ),
+        {"p": NAME_PREFIX + "%"},
+    )
+    db.commit()
+    return [
+        user_id
+        for (user_id,) in db.query(UserProfile.id).filter(
+            UserProfile.name.like(NAME_PREFIX + "%")
+        )
+    ]
+
+
+def create_articles(db, first: int, count: int, rng: random.Random):
+    rows = [
+        {
+            "url": f"{URL_PREFIX}{first + i}",
+            "title": rng.choice(SENTENCES),
+            "content": "content",
+            "summary": " ".join(
+                rng.sample(SENTENCES, 2) + rng.choices(TOPICS, TOPIC_WEIGHTS, k=3)
+            ),
+            "category": rng.choice(CATEGORIES),
+        }
+        for i in range(count)
+    ]
+    return list(db.execute(insert(Article).returning(Article.id), rows).scalars())
+
+
+def cleanup(db):
+    db.execute(
+        text("DELETE FROM summary.user_profiles WHERE name LIKE :p"),  # feeds cascade
+        {"p": NAME_PREFIX + "%"},
+    )
+    db.execute(
+        text("DELETE FROM summary.articles WHERE url LIKE :p"), {"p": URL_PREFIX + "%"}
+    )
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=100, help="articles per rank")
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--read-time-reads", type=int, default=100)
+    parser.add_argument("--feed-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--app-log-level", default="WARNING")
+    parser.add_argument("--output", default="bench_user_feeds_results.json")
+    args = parser.parse_args()
+    logging.getLogger("summarizer").setLevel(args.app_log_level)
+    rng = random.Random(args.seed)
+    ranker = FeedRanker(max_items=args.feed_size, backfill=args.articles)
+    results = {"meta": run_metadata("bench_user_feeds", vars(args))}
+
+    db = SessionLocal()
+    cleanup(db)
+    try:
+        start = time.perf_counter()
+        user_ids = create_users(db, args.users, rng)
+        print(f"Created {len(user_ids)} users in {time.perf_counter() - start:.1f}s")
+
+        rank_latencies, feeds_updated = [], 0
+        ingest_start = time.perf_counter()
+        for first in range(0, args.articles, args.batch):
+            ids = create_articles(
+                db, first, min(args.batch, args.articles - first), rng
+            )
+            db.commit()
+            start = time.perf_counter()
+            feeds_updated += ranker.rank_articles(db, ids)
+            rank_latencies.append(time.perf_counter() - start)
+        ingest_elapsed = time.perf_counter() - ingest_start
+        rank_elapsed = sum(rank_latencies)
+        results["ingest"] = {
+            "articles": args.articles,
+            "batches": len(rank_latencies),
+            "feed_updates": feeds_updated,
+            "rank_s": round(rank_elapsed, 3),
+            "articles_per_s": round(args.articles / rank_elapsed, 1),
+            "feed_updates_per_s": round(feeds_updated / rank_elapsed, 1),
+            "batch_latency_ms": summarize_latencies(rank_latencies),
+            "elapsed_s": round(ingest_elapsed, 3),
+        }
+        print(
+            f"Ranked {args.articles} articles into {feeds_updated} feed updates:"
+            f" {results['ingest']['articles_per_s']} articles/s,"
+            f" batch p50 {results['ingest']['batch_latency_ms']['p50']} ms"
+        )
+
+        service = UserService(db, ranker=ranker)
+        read_latencies = []
+        for _ in range(args.reads):
+            user_id = rng.choice(user_ids)
+            start = time.perf_counter()
+            service.get_feed(user_id, rng.choice((0, 0, 0, 20, 40)), 20)
+            read_latencies.append(time.perf_counter() - start)
+            db.rollback()
+        results["precomputed_reads_ms"] = summarize_latencies(read_latencies)
+
+        read_time_latencies = []
+        for _ in range(args.read_time_reads):
+            user = db.get(UserProfile, rng.choice(user_ids))
+            start = time.perf_counter()
+            ids, _ = ranker.rebuild(db, user)
+            db.query(Article).filter(Article.id.in_(ids[:20])).all()
+            read_time_latencies.append(time.perf_counter() - start)
+            db.rollback()
+        results["read_time_ranking_ms"] = summarize_latencies(read_time_latencies)
+
+        sizes = (
+            db.query(
+                func.avg(
+                    func.pg_column_size(UserFeed.article_ids)
+                    + func.pg_column_size(UserFeed.scores)
+                ),
+                func.avg(func.cardinality(UserFeed.article_ids)),
+            )
+            .filter(UserFeed.user_id.in_(user_ids[:1000]))
+            .one()
+        )
+        results["feed_storage"] = {
+            "avg_bytes": round(float(sizes[0] or 0), 1),
+            "avg_items": round(float(sizes[1] or 0), 1),
+        }
+        print(
+            f"{'reads':<22} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}\n"
+            + "\n".join(
+                f"{name:<22} {summary['p50']:>9.2f} {summary['p95']:>9.2f}"
+                f" {summary['p99']:>9.2f}"
+                for name, summary in (
+                    ("precomputed feed", results["precomputed_reads_ms"]),
+                    ("read-time ranking", results["read_time_ranking_ms"]),
+                )
+            )
+        )
+        print(
+            f"Feed rows average {results['feed_storage']['avg_items']} items,"
+            f" {results['feed_storage']['avg_bytes']} bytes"
+        )
+    finally:
+        db.rollback()
+        cleanup(db)
+        db.close()
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""
+Fake Azure OpenAI chat completions endpoint for benchmarks and tests.
+
+Implements POST /openai/deployments/<model>/chat/completions closely enough
+for the openai client: plain and streamed (server-sent events) responses,
+token usage, configurable latency, and injected 429 rate-limit errors with
+Retry-After headers. The reply is the JSON object the summarizer prompt asks
+for, built from the article text in the prompt, or a JSON array with one such
+object per article for batched prompts. Story prompts combining several
+reports get one object with a title.
+
+POST /openai/deployments/<model>/embeddings returns bag-of-words vectors, so
+texts sharing words get similar embeddings.
+
+Usage:
+    python -m backend.benchmarks.fake_azure_openai [--port P] [--latency S]
+        [--error-rate R] [--token-latency S]
+"""
+
+import argparse
+import base64
+import json
+import math
+import random
+import re
+import struct
+import threading
+import time
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETIONS_PATH = re.compile(r"^/openai/deployments/([^/]+)/chat/completions")
+EMBEDDINGS_PATH = re.compile(r"^/openai/deployments/([^/]+)/embeddings")
+ARTICLE_TEXT = re.compile(r"Article:\s*(.*?)\s*Response format:", re.S)
+BATCH_ARTICLE_TEXT = re.compile(
+    r"Article (\d+):\s*(.*?)\s*(?=Article \d+:|Response format:)", re.S
+)
+STORY_REPORT_TEXT = re.compile(
+    r"Report \d+:\s*(.*?)\s*(?=Report \d+:|Response format:)", re.S
+)
+
+CATEGORY_KEYWORDS = (
+    ("Sports", ("championship", "team", "final")),
+    ("Business", ("bank", "interest", "company", "quarters")),
+    ("Technology", ("battery", "grid", "researchers")),
+    ("Entertainment", ("streaming", "films", "ticket")),
+    ("Health", ("exercise", "sleep", "study")),
+)
+
+
+def count_tokens(text: str) -> int:
+    """Rough token estimate: about four characters per token."""
+    return max(1, len(text) // 4)
+
+
+def _summarize(text: str, summary_words: int) -> dict:
+    lowered = text.lower()
+    category = next(
+        (
+            name
+            for name, keywords in CATEGORY_KEYWORDS
+            if any(keyword in lowered for keyword in keywords)
+        ),
+        "General",
+    )
+    summary = " ".join(text.split()[:summary_words])
+    return {"summary": summary, "category": category}
+
+
+def fake_summary(prompt: str, summary_words: int = 40) -> str:
+    """Build the JSON reply the summarizer prompt (single or batched) expects."""
+    reports = STORY_REPORT_TEXT.findall(prompt)
+    if reports:
+        story = _summarize(" ".join(reports), summary_words)
+        return json.dumps({"title": " ".join(reports[0].split()[:8]), **story})
+    articles = BATCH_ARTICLE_TEXT.findall(prompt)
+    if articles:
+        return json.dumps(
+            [
+                {"id": int(article_id), **_summarize(text, summary_words)}
+                for article_id, text in articles
+            ]
+        )
+    match = ARTICLE_TEXT.search(prompt)
+    text = match.group(1) if match else prompt
+    return json.dumps(_summarize(text, summary_words))
+
+
+def fake_embedding(text: str, dimensions: int) -> list:
+    """Unit-length bag-of-words vector of a text."""
+    vector = [0.0] * dimensions
+    for word in re.findall(r"\w+", text.lower()):
+        vector[zlib.crc32(word.encode()) % dimensions] += 1.0
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class _CompletionsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        embeddings = EMBEDDINGS_PATH.match(self.path)
+        if embeddings:
+            self._embeddings(embeddings.group(1), json.loads(body or b"{}"))
+            return
+        match = COMPLETIONS_PATH.match(self.path)
+        if not match:
+            self._send_json(404, {"error": {"code": "404", "message": "Not found"}})
+            return
+        if server.should_throttle():
+            self._send_throttled()
+            return
+
+        request = json.loads(body or b"{}")
+        prompt = "\n".join(
+            message.get("content") or "" for message in request.get("messages", [])
+        )
+        content = fake_summary(prompt, server.summary_words)
+        usage = {
+            "prompt_tokens": count_tokens(prompt),
+            "completion_tokens": count_tokens(content),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        server.record_usage(usage)
+        latency = server.latency + server.token_latency * usage["completion_tokens"]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        if request.get("stream"):
+            include_usage = (request.get("stream_options") or {}).get("include_usage")
+            self._stream(
+                completion_id,
+                match.group(1),
+                content,
+                usage if include_usage else None,
+                latency,
+            )
+            return
+
+        server.wait(latency)
+        self._send_json(
+            200,
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": match.group(1),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            },
+        )
+
+    def _stream(
+        self, completion_id: str, model: str, content: str, usage, latency: float
+    ):
+        server = self.server
+        chunks = max(1, server.stream_chunks)
+        size = math.ceil(len(content) / chunks)
+        pieces = [content[i : i + size] for i in range(0, len(content), size)]
+        delay = latency / (len(pieces) + 1)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(delta, finish_reason=None, chunk_usage=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": (
+                    []
+                    if chunk_usage
+                    else [
+                        {
+                            "index": 0,
+                            "delta": delta,
+                            "finish_reason": finish_reason,
+                        }
+                    ]
+                ),
+            }
+            if chunk_usage:
+                chunk["usage"] = chunk_usage
+            self.wfile.write(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+            self.wfile.flush()
+
+        server.wait(delay)
+        event({"role": "assistant", "content": ""})
+        for piece in pieces:
+            server.wait(delay)
+            event({"content": piece})
+        event({}, finish_reason="stop")
+        if usage:
+            event({}, chunk_usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _embeddings(self, model: str, request: dict):
+        server = self.server
+        if server.should_throttle():
+            self._send_throttled()
+            return
+        texts = request.get("input") or []
+        if isinstance(texts, str):
+            texts = [texts]
+        dimensions = request.get("dimensions") or 1536
+        vectors = [fake_embedding(text, dimensions) for text in texts]
+        if request.get("encoding_format") == "base64":
+            # The openai client asks for packed float32 by default
+            vectors = [
+                base64.b64encode(struct.pack(f"<{dimensions}f", *vector)).decode()
+                for vector in vectors
+            ]
+        tokens = sum(count_tokens(text) for text in texts)
+        server.record_usage({"prompt_tokens": tokens, "completion_tokens": 0})
+        server.wait(server.latency)
+        self._send_json(
+            200,
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": vector}
+                    for i, vector in enumerate(vectors)
+                ],
+                "model": model,
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+        )
+
+    def _send_throttled(self):
+        retry_after = self.server.retry_after
+        body = json.dumps(
+            {
+                "error": {
+                    "code": "429",
+                    "message": "Requests to the ChatCompletions_Create Operation "
+                    "have exceeded the rate limit. Please retry later.",
+                }
+            }
+        ).encode()
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", str(max(1, math.ceil(retry_after))))
+        self.send_header("retry-after-ms", str(int(retry_after * 1000)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAzureOpenAI(ThreadingHTTPServer):
+    """
+    Threaded HTTP server imitating Azure OpenAI chat completions.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free port
+        latency (float): Seconds per completion (spread over chunks when streaming)
+        token_latency (float): Extra seconds per completion token generated
+        error_rate (float): Fraction of requests answered with 429
+        retry_after (float): Retry delay advertised on 429 responses, in seconds
+        stream_chunks (int): Content chunks per streamed response
+        summary_words (int): Words of article text used as the summary
+        seed (int): Seed for the 429 injection, for reproducible runs
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 0.1,
+        stream_chunks: int = 8,
+        summary_words: int = 40,
+        seed: int = None,
+        token_latency: float = 0.0,
+    ):
+        super().__init__(("127.0.0.1", port), _CompletionsHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.stream_chunks = stream_chunks
+        self.summary_words = summary_words
+        self.token_latency = token_latency
+        self.requests = 0
+        self.throttled = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            throttle = self._random.random() < self.error_rate
+            if throttle:
+                self.throttled += 1
+            return throttle
+
+    def record_usage(self, usage: dict):
+        with self._lock:
+            self.prompt_tokens += usage["prompt_tokens"]
+            self.completion_tokens += usage["completion_tokens"]
+
+    @staticmethod
+    def wait(seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def start(self) -> "FakeAzureOpenAI":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--stream-chunks", type=int, default=8)
+    parser.add_argument("--token-latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeAzureOpenAI(
+        args.port,
+        args.latency,
+        args.error_rate,
+        args.retry_after,
+        args.stream_chunks,
+        token_latency=args.token_latency,
+    )
+    print(f"Fake Azure OpenAI endpoint at {server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
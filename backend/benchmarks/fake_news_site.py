@@ -0,0 +1,180 @@
+"""
+Fake news site for benchmarks and tests.
+
+Serves deterministic synthetic articles at /articles/<id>.html after a
+configurable latency. Every id is valid, so load runs can use unique URLs and
+never hit the duplicate-URL check. robots.txt allows everything and sets no
+crawl-delay.
+
+Usage:
+    python -m backend.benchmarks.fake_news_site [--port P] [--latency S]
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ARTICLE_PATH = re.compile(r"^/articles/(\d+)\.html$")
+
+HEADLINES = (
+    "City council approves new budget for public transport",
+    "Researchers report progress on battery storage for the grid",
+    "Local team wins the championship after a dramatic final",
+    "Central bank holds interest rates steady amid slowing growth",
+    "New study links regular exercise to better sleep",
+    "Streaming service announces a slate of original films",
+)
+
+SENTENCES = (
+    "Officials said the decision was made after months of public consultation.",
+    "The plan is expected to take effect at the beginning of next year.",
+    "Critics argued that the costs had been underestimated from the start.",
+    "Supporters say the change will benefit thousands of residents in the region.",
+    "The company did not respond to a request for comment on Tuesday.",
+    "Analysts expect the figures to improve over the coming quarters.",
+    "It is the first time such a measure has been tried in the country.",
+    "A spokesperson confirmed that talks with the unions were still ongoing.",
+    "The results were published in a peer-reviewed journal this week.",
+    "Several experts cautioned that more data would be needed before drawing conclusions.",
+    "Ticket sales have risen sharply since the announcement was made.",
+    "The mayor described the vote as a turning point for the city.",
+)
+
+ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta property="og:title" content="{title}">
+</head>
+<body>
+<header><nav><a href="/">Home</a> <a href="/world">World</a></nav></header>
+<article>
+<h1>{title}</h1>
+{paragraphs}
+</article>
+<footer>Copyright Fake News Site</footer>
+</body>
+</html>
+"""
+
+ROBOTS_TXT = b"User-agent: *\nAllow: /\n"
+
+
+def render_article(article_id: int, paragraphs: int = 8) -> bytes:
+    """Render the same synthetic article for a given id on every call."""
+    rng = random.Random(article_id)
+    title = f"{rng.choice(HEADLINES)} ({article_id})"
+    body = "\n".join(
+        "<p>{}</p>".format(" ".join(rng.choices(SENTENCES, k=rng.randint(3, 6))))
+        for _ in range(paragraphs)
+    )
+    return ARTICLE_TEMPLATE.format(title=title, paragraphs=body).encode("utf-8")
+
+
+class _ArticleHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        site = self.server
+        site.count_request()
+        if self.path == "/robots.txt":
+            self._send(200, "text/plain", ROBOTS_TXT)
+            return
+        match = ARTICLE_PATH.match(self.path)
+        if not match:
+            self._send(404, "text/plain", b"not found")
+            return
+        site.wait()
+        self._send(
+            200,
+            "text/html; charset=utf-8",
+            render_article(int(match.group(1)), site.paragraphs),
+        )
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeNewsSite(ThreadingHTTPServer):
+    """
+    Threaded HTTP server serving synthetic articles.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free port
+        latency (float): Seconds to wait before serving an article
+        jitter (float): Extra random latency, uniform in [0, jitter] seconds
+        paragraphs (int): Paragraphs per article
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        paragraphs: int = 8,
+    ):
+        super().__init__(("127.0.0.1", port), _ArticleHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.paragraphs = paragraphs
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def article_url(self, article_id: int) -> str:
+        return f"{self.base_url}/articles/{article_id}.html"
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def wait(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def start(self) -> "FakeNewsSite":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--paragraphs", type=int, default=8)
+    args = parser.parse_args()
+
+    site = FakeNewsSite(args.port, args.latency, args.jitter, args.paragraphs)
+    print(f"Serving fake articles at {site.article_url(1)}")
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        site.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark result files and regression comparison.
+
+Results are JSON documents with run metadata and one entry per concurrency
+level. Two runs are compared level by level: a drop in throughput or a rise in
+p95/p99 latency beyond the threshold is reported as a regression.
+
+Usage:
+    python -m backend.benchmarks.results BASELINE.json CANDIDATE.json
+        [--threshold PERCENT]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# (metric path, True if higher is better)
+COMPARED_METRICS = (
+    (("throughput_rps",), True),
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p95"), False),
+    (("latency_ms", "p99"), False),
+    (("rss_mb", "peak"), False),
+    (("reads", "latency_ms", "p99"), False),
+)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values; q in [0, 100]."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds from durations in seconds."""
+    values = sorted(seconds * 1000 for seconds in latencies)
+    if not values:
+        return {}
+    return {
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def run_metadata(name: str, parameters: dict) -> dict:
+    """Describe the environment a benchmark ran in."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "benchmark": name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit or None,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parameters": parameters,
+    }
+
+
+def save_results(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _metric(level: dict, path) -> Optional[float]:
+    value = level
+    for key in path:
+        if not isinstance(value, dict) or value.get(key) is None:
+            return None
+        value = value[key]
+    return value
+
+
+def compare_results(baseline: dict, candidate: dict, threshold: float = 10.0):
+    """
+    Compare two result documents level by level.
+
+    Args:
+        baseline (dict): Earlier results
+        candidate (dict): New results
+        threshold (float): Allowed change in percent before flagging a regression
+
+    Returns:
+        List[dict]: One row per compared metric, with a 'regression' flag
+    """
+    rows = []
+    candidate_levels = {
+        level["concurrency"]: level for level in candidate.get("levels", [])
+    }
+    for base_level in baseline.get("levels", []):
+        level = candidate_levels.get(base_level["concurrency"])
+        if level is None:
+            continue
+        for path, higher_is_better in COMPARED_METRICS:
+            before, after = _metric(base_level, path), _metric(level, path)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "concurrency": base_level["concurrency"],
+                    "metric": ".".join(path),
+                    "baseline": before,
+                    "candidate": after,
+                    "change_pct": round(change, 1),
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rows = compare_results(
+        load_results(args.baseline), load_results(args.candidate), args.threshold
+    )
+    print(
+        f"{'conc':>5} {'metric':<16} {'baseline':>12} {'candidate':>12} {'change':>9}"
+    )
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['concurrency']:>5} {row['metric']:<16} {row['baseline']:>12.2f}"
+            f" {row['candidate']:>12.2f} {row['change_pct']:>+8.1f}%{flag}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} regression(s) beyond {args.threshold:.0f}%")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from backend.benchmarks.results import compare_results, percentile, summarize_latencies
+
+
+def level(concurrency, throughput, p95):
+    return {
+        "concurrency": concurrency,
+        "throughput_rps": throughput,
+        "latency_ms": {"p50": p95 / 2, "p95": p95, "p99": p95},
+    }
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([5], 95) == 5
+
+
+def test_summarize_latencies_in_milliseconds():
+    summary = summarize_latencies([0.1, 0.2, 0.3, 0.4])
+
+    assert summary["p50"] == 200
+    assert summary["max"] == 400
+    assert summary["mean"] == 250
+
+
+def test_compare_flags_throughput_drop_and_latency_rise():
+    baseline = {"levels": [level(1, 10.0, 100.0), level(8, 40.0, 400.0)]}
+    candidate = {"levels": [level(1, 9.5, 104.0), level(8, 30.0, 480.0)]}
+
+    rows = compare_results(baseline, candidate, threshold=10.0)
+    regressions = {(r["concurrency"], r["metric"]) for r in rows if r["regression"]}
+
+    assert regressions == {
+        (8, "throughput_rps"),
+        (8, "latency_ms.p50"),
+        (8, "latency_ms.p95"),
+        (8, "latency_ms.p99"),
+    }
+
+
+def test_compare_skips_levels_missing_from_candidate():
+    baseline = {"levels": [level(1, 10.0, 100.0), level(64, 50.0, 900.0)]}
+    candidate = {"levels": [level(1, 12.0, 90.0)]}
+
+    rows = compare_results(baseline, candidate)
+
+    assert {row["concurrency"] for row in rows} == {1}
+    assert not any(row["regression"] for row in rows)
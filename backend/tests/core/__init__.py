@@ -0,0 +1 @@
+# Initialize the core tests package
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+from backend.app.core.summarizer_admission import AdmissionLane, run_ingestion
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_metrics import ADMISSION_SHED
+from backend.app.exceptions.summarizer_exceptions import OverloadedException
+
+
+def shed(reason):
+    return ADMISSION_SHED.labels(lane="test", reason=reason)._value.get()
+
+
+def lane(max_in_flight=1, max_queue=2, queue_timeout=5.0):
+    return AdmissionLane("test", max_in_flight, max_queue, queue_timeout)
+
+
+def test_slots_are_handed_to_waiters_in_order():
+    admission = lane(max_in_flight=2)
+    order = []
+
+    async def request(name, seconds):
+        await admission.acquire()
+        order.append(name)
+        await asyncio.sleep(seconds)
+        admission.release(seconds)
+
+    async def flood():
+        await asyncio.gather(
+            request("a", 0.05),
+            request("b", 0.1),
+            request("c", 0.01),
+            request("d", 0.01),
+        )
+
+    asyncio.run(flood())
+
+    assert order == ["a", "b", "c", "d"]
+    assert admission.in_flight == 0
+    assert admission.queued == 0
+
+
+def test_full_queue_is_rejected_at_once():
+    admission = lane(max_in_flight=1, max_queue=1)
+    before = shed("queue_full")
+
+    async def flood():
+        await admission.acquire()
+        waiting = asyncio.ensure_future(admission.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(OverloadedException) as e:
+            await admission.acquire()
+        admission.release()
+        await waiting
+        admission.release()
+        return e.value
+
+    error = asyncio.run(flood())
+
+    assert error.reason == "queue_full"
+    assert error.retry_after >= 1
+    assert shed("queue_full") == before + 1
+    assert admission.in_flight == 0
+
+
+def test_waiters_past_the_deadline_are_shed():
+    admission = lane(queue_timeout=0.05)
+    before = shed("timeout")
+
+    async def stuck():
+        await admission.acquire()
+        with pytest.raises(OverloadedException) as e:
+            await admission.acquire()
+        admission.release()
+        return e.value
+
+    assert asyncio.run(stuck()).reason == "timeout"
+    assert shed("timeout") == before + 1
+    assert admission.queued == 0
+    assert admission.in_flight == 0
+
+
+def test_cancelled_waiters_do_not_leak_slots():
+    admission = lane(max_in_flight=1)
+
+    async def disconnects():
+        await admission.acquire()
+        # Cancelled while queued
+        queued = asyncio.ensure_future(admission.acquire())
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        assert admission.queued == 0
+
+        # Cancelled right after being granted the slot
+        granted = asyncio.ensure_future(admission.acquire())
+        await asyncio.sleep(0)
+        admission.release()
+        granted.cancel()
+        await asyncio.gather(granted, return_exceptions=True)
+        if not granted.cancelled():
+            # The grant won the race; the request holds the slot as usual
+            admission.release()
+
+    asyncio.run(disconnects())
+
+    assert admission.in_flight == 0
+    assert admission.queued == 0
+
+
+def test_retry_after_grows_with_the_queue():
+    admission = lane(max_in_flight=2, max_queue=10)
+    admission.service_time = 3.0
+
+    assert admission.retry_after() == 2
+
+    async def queue_up():
+        await admission.acquire()
+        await admission.acquire()
+        waiters = [asyncio.ensure_future(admission.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        retry_after = admission.retry_after()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        return retry_after
+
+    assert asyncio.run(queue_up()) == 6
+
+
+def test_disabled_lane_admits_everything():
+    admission = lane(max_in_flight=0, max_queue=0)
+
+    async def flood():
+        for _ in range(10):
+            await admission.acquire()
+
+    asyncio.run(flood())
+    admission.release()
+    assert admission.in_flight == 0
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="per-thread priorities"
+)
+def test_ingestion_runs_on_lower_priority_threads():
+    def priority():
+        thread = threading.get_native_id()
+        return thread, os.getpriority(os.PRIO_PROCESS, thread)
+
+    thread, niceness = asyncio.run(run_ingestion(priority))
+
+    assert thread != threading.get_native_id()
+    assert niceness == min(
+        19, os.getpriority(os.PRIO_PROCESS, 0) + settings.INGEST_NICENESS
+    )
+    # The serving thread keeps its priority
+    assert priority()[1] == os.getpriority(os.PRIO_PROCESS, 0)
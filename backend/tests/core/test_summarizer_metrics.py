@@ -0,0 +1,120 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from backend.app.core.summarizer_metrics import (
+    count_error,
+    install_metrics,
+    instrument_engine,
+    observe_stage,
+    record_cache,
+)
+from backend.app.core.summarizer_middleware import RequestContextMiddleware
+from backend.app.core.summarizer_timing import remove_stage_observer, stage
+from backend.app.exceptions.summarizer_exceptions import InvalidURLException
+from backend.app.routers import summarizer_metrics_routers
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    app.include_router(summarizer_metrics_routers.router)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with stage("llm_call"):
+            pass
+        return {"item_id": item_id}
+
+    return TestClient(app)
+
+
+def test_request_latency_is_recorded_by_route_template():
+    client = make_client()
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = sample("summarizer_request_duration_seconds_count", **labels)
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert sample("summarizer_request_duration_seconds_count", **labels) == before + 2
+
+
+def test_stage_observer_feeds_stage_histogram():
+    engine = create_engine("sqlite://")
+    install_metrics(engine)
+    try:
+        before = sample("summarizer_stage_duration_seconds_count", stage="llm_call")
+        with stage("llm_call"):
+            pass
+        after = sample("summarizer_stage_duration_seconds_count", stage="llm_call")
+        assert after == before + 1
+    finally:
+        remove_stage_observer(observe_stage)
+
+
+def test_db_query_latency_by_operation():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    before = sample("summarizer_db_query_duration_seconds_count", operation="SELECT")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+        try:
+            conn.execute(text("SELECT * FROM missing_table"))
+        except Exception:
+            pass
+        assert conn.info["query_start"] == []
+
+    after = sample("summarizer_db_query_duration_seconds_count", operation="SELECT")
+    assert after == before + 2
+
+
+def test_error_counters_start_at_zero_and_count():
+    assert (
+        REGISTRY.get_sample_value(
+            "summarizer_errors_total", {"exception": "FeedNotFoundException"}
+        )
+        is not None
+    )
+    before = sample("summarizer_errors_total", exception="InvalidURLException")
+
+    count_error(InvalidURLException("bad"))
+
+    assert sample("summarizer_errors_total", exception="InvalidURLException") == (
+        before + 1
+    )
+
+
+def test_cache_hits_and_misses():
+    hits = sample("summarizer_cache_requests_total", cache="test", result="hit")
+    misses = sample("summarizer_cache_requests_total", cache="test", result="miss")
+
+    record_cache("test", True)
+    record_cache("test", True)
+    record_cache("test", False)
+
+    assert sample("summarizer_cache_requests_total", cache="test", result="hit") == (
+        hits + 2
+    )
+    assert sample("summarizer_cache_requests_total", cache="test", result="miss") == (
+        misses + 1
+    )
+
+
+def test_metrics_endpoint_exposes_text_format():
+    client = make_client()
+    client.get("/items/1")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "summarizer_request_duration_seconds_bucket" in response.text
+    assert "summarizer_requests_in_flight" in response.text
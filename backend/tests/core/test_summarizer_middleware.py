@@ -0,0 +1,105 @@
+import json
+import logging
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.core.summarizer_middleware import RequestContextMiddleware
+from backend.app.core.summarizer_timing import current_request, stage
+from backend.app.logs.summarizer_logging import StructuredFormatter, get_logger
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def access_records():
+    handler = CollectingHandler()
+    access_logger = get_logger("access")
+    access_logger.addHandler(handler)
+    yield handler.records
+    access_logger.removeHandler(handler)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with stage("dedup_query"):
+            time.sleep(0.01)
+        with stage("llm_call"):
+            time.sleep(0.02)
+        with stage("llm_call"):
+            time.sleep(0.01)
+        return {"item_id": item_id, "request_id": current_request().request_id}
+
+    return TestClient(app)
+
+
+def test_request_id_is_generated_and_returned(client):
+    response = client.get("/items/1")
+
+    request_id = response.headers["X-Request-ID"]
+    assert len(request_id) == 32
+    assert response.json()["request_id"] == request_id
+
+
+def test_incoming_request_id_is_reused(client):
+    response = client.get("/items/1", headers={"X-Request-ID": "abc-123"})
+
+    assert response.headers["X-Request-ID"] == "abc-123"
+    assert response.json()["request_id"] == "abc-123"
+
+
+def test_access_record_contains_stage_timings(client, access_records):
+    client.get("/items/7", headers={"X-Request-ID": "req-7"})
+
+    assert len(access_records) == 1
+    fields = access_records[0].fields
+    assert fields["request_id"] == "req-7"
+    assert fields["route"] == "/items/{item_id}"
+    assert fields["status"] == 200
+    assert fields["stages_ms"]["dedup_query"] >= 10
+    assert fields["stages_ms"]["llm_call"] >= 30
+    assert fields["duration_ms"] >= 40
+
+
+def test_stage_outside_request_is_a_no_op():
+    assert current_request() is None
+    with stage("scrape_download"):
+        pass
+    assert current_request() is None
+
+
+def test_structured_formatter_emits_json_for_fields():
+    formatter = StructuredFormatter("%(request_id)s %(message)s")
+    record = logging.LogRecord(
+        "summarizer.access", logging.INFO, __file__, 1, "request", None, None
+    )
+    record.fields = {"request_id": "req-1", "stages_ms": {"llm_call": 12.5}}
+
+    payload = json.loads(formatter.format(record))
+
+    assert payload["message"] == "request"
+    assert payload["request_id"] == "req-1"
+    assert payload["stages_ms"] == {"llm_call": 12.5}
+
+
+def test_structured_formatter_plain_records_use_text_format():
+    formatter = StructuredFormatter("%(request_id)s %(message)s")
+    record = logging.LogRecord(
+        "summarizer.db", logging.INFO, __file__, 1, "session %s", ("created",), None
+    )
+
+    assert formatter.format(record) == "- session created"
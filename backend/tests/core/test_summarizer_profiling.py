@@ -0,0 +1,118 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.core import summarizer_timing
+from backend.app.core.summarizer_config import settings
+from backend.app.core.summarizer_middleware import RequestContextMiddleware
+from backend.app.core.summarizer_profiling import profiler
+from backend.app.core.summarizer_timing import stage
+from backend.app.routers import summarizer_admin_routers
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def spin(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    app.include_router(summarizer_admin_routers.router)
+
+    @app.get("/summarize")
+    def summarize():
+        with stage("scrape_parse"):
+            spin(0.03)
+        with stage("llm_call"):
+            spin(0.05)
+        return {"ok": True}
+
+    yield TestClient(app)
+    profiler.stop()
+
+
+def test_admin_endpoints_require_token(client, monkeypatch):
+    assert client.get("/admin/profiling/status").status_code == 401
+    assert (
+        client.get(
+            "/admin/profiling/status", headers={"X-Admin-Token": "wrong"}
+        ).status_code
+        == 401
+    )
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert client.get("/admin/profiling/status", headers=ADMIN).status_code == 403
+
+
+def test_profiles_next_n_requests(client):
+    response = client.post(
+        "/admin/profiling/start?requests=2&interval_ms=1", headers=ADMIN
+    )
+    assert response.status_code == 200
+    assert response.json()["active"]
+
+    for _ in range(3):
+        client.get("/summarize")
+
+    status = client.get("/admin/profiling/status", headers=ADMIN).json()
+    assert not status["active"]
+    assert status["requests_profiled"] == 2
+    assert status["samples"] > 0
+
+    stacks = client.get("/admin/profiling/stacks", headers=ADMIN).text
+    lines = stacks.splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    llm_samples = sum(
+        int(line.rsplit(" ", 1)[1]) for line in lines if line.startswith("llm_call;")
+    )
+    parse_samples = sum(
+        int(line.rsplit(" ", 1)[1])
+        for line in lines
+        if line.startswith("scrape_parse;")
+    )
+    assert llm_samples > parse_samples > 0
+    assert any(":spin " in line for line in lines)
+
+
+def test_profiles_for_a_duration(client):
+    client.post("/admin/profiling/start?seconds=0.2&interval_ms=1", headers=ADMIN)
+    client.get("/summarize")
+    client.get("/summarize")
+
+    assert client.get("/admin/profiling/status", headers=ADMIN).json()["active"]
+    time.sleep(0.3)
+    status = client.get("/admin/profiling/status", headers=ADMIN).json()
+    assert not status["active"]
+    assert status["requests_profiled"] == 2
+
+
+def test_only_one_session_at_a_time(client):
+    client.post("/admin/profiling/start?seconds=5", headers=ADMIN)
+
+    response = client.post("/admin/profiling/start?seconds=5", headers=ADMIN)
+
+    assert response.status_code == 409
+    client.post("/admin/profiling/stop", headers=ADMIN)
+    assert not client.get("/admin/profiling/status", headers=ADMIN).json()["active"]
+
+
+def test_start_requires_a_limit(client):
+    assert client.post("/admin/profiling/start", headers=ADMIN).status_code == 400
+
+
+def test_stage_hook_is_removed_when_session_ends(client):
+    client.post("/admin/profiling/start?requests=1", headers=ADMIN)
+    assert summarizer_timing._stage_hook is profiler
+
+    client.get("/summarize")
+
+    assert summarizer_timing._stage_hook is None
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from backend.app.core.summarizer_config import settings
+from backend.app.db.summarizer_migrations import MIGRATIONS, run_migrations
+
+SCHEMA = "migrations_test"
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+
+
+@pytest.fixture
+def clean_schema():
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    yield SCHEMA
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+def test_migrations_create_tables(clean_schema):
+    applied = run_migrations(engine, schema=clean_schema)
+
+    assert applied == [migration.version for migration in MIGRATIONS]
+    tables = set(inspect(engine).get_table_names(schema=clean_schema))
+    assert {"articles", "feeds", "schema_migrations"} <= tables
+
+
+def test_migrations_are_applied_once(clean_schema):
+    run_migrations(engine, schema=clean_schema)
+
+    assert run_migrations(engine, schema=clean_schema) == []
+    with engine.connect() as conn:
+        count = conn.execute(
+            text(f"SELECT count(*) FROM {clean_schema}.schema_migrations")
+        ).scalar()
+    assert count == len(MIGRATIONS)
+
+
+def test_migrations_adopt_existing_tables(clean_schema):
+    # Databases created from scripts/db/init_schema.sql already have the tables
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {clean_schema}"))
+        conn.execute(
+            text(
+                f"CREATE TABLE {clean_schema}.articles (id SERIAL PRIMARY KEY,"
+                " title VARCHAR(255), url VARCHAR(255) NOT NULL,"
+                " content TEXT NOT NULL, summary TEXT NOT NULL,"
+                " category VARCHAR(255) NOT NULL)"
+            )
+        )
+
+    applied = run_migrations(engine, schema=clean_schema)
+
+    assert applied == [migration.version for migration in MIGRATIONS]
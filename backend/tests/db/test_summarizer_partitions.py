@@ -0,0 +1,142 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from backend.app.core.summarizer_config import settings
+from backend.app.db.summarizer_migrations import run_migrations
+from backend.app.db.summarizer_partitions import (
+    PartitionMaintainer,
+    add_months,
+    list_partitions,
+    month_start,
+    partition_name,
+)
+
+SCHEMA = "partitions_test"
+# The migration attaches the old table up to the month after the real now
+NOW = datetime.now(timezone.utc)
+THIS_MONTH = month_start(NOW)
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+
+
+@pytest.fixture
+def schema():
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    run_migrations(engine, schema=SCHEMA)
+    yield SCHEMA
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+def maintainer(**kwargs) -> PartitionMaintainer:
+    kwargs.setdefault("months_ahead", 1)
+    kwargs.setdefault("retention_months", 0)
+    return PartitionMaintainer(engine=engine, schema=SCHEMA, **kwargs)
+
+
+def insert(created_at: datetime) -> int:
+    with engine.begin() as conn:
+        return conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA}.articles"
+                " (url, content, summary, category, created_at, updated_at)"
+                " VALUES ('https://example.com', 'c', 's', 'news', :at, :at)"
+                " RETURNING id"
+            ),
+            {"at": created_at},
+        ).scalar()
+
+
+def partition_of(article_id: int) -> str:
+    with engine.connect() as conn:
+        return conn.execute(
+            text(
+                f"SELECT tableoid::regclass::text FROM {SCHEMA}.articles"
+                " WHERE id = :id"
+            ),
+            {"id": article_id},
+        ).scalar()
+
+
+def partitions() -> list:
+    with engine.begin() as conn:
+        return sorted(p.name for p in list_partitions(conn, SCHEMA, "articles"))
+
+
+def test_month_arithmetic():
+    moment = datetime(2026, 5, 17, 12, tzinfo=timezone.utc)
+    assert month_start(moment) == datetime(2026, 5, 1, tzinfo=timezone.utc)
+    assert add_months(month_start(moment), 8) == datetime(
+        2027, 1, 1, tzinfo=timezone.utc
+    )
+    assert add_months(month_start(moment), -5) == datetime(
+        2025, 12, 1, tzinfo=timezone.utc
+    )
+
+
+def test_upcoming_partitions_are_created_once(schema):
+    # The migration attached the existing table for everything up to next month
+    assert partitions() == ["articles_default", "articles_legacy"]
+
+    created = maintainer(months_ahead=3).run_once(now=NOW)["created"]
+
+    assert created == [
+        partition_name("articles", add_months(THIS_MONTH, n)) for n in (1, 2, 3)
+    ]
+    assert maintainer(months_ahead=3).run_once(now=NOW)["created"] == []
+    assert partition_of(insert(add_months(THIS_MONTH, 3))) == f"{SCHEMA}.{created[-1]}"
+
+
+def test_rows_move_out_of_the_default_partition(schema):
+    early = insert(add_months(THIS_MONTH, 2))
+    assert partition_of(early) == f"{SCHEMA}.articles_default"
+
+    maintainer(months_ahead=2).run_once(now=NOW)
+
+    name = partition_name("articles", add_months(THIS_MONTH, 2))
+    assert partition_of(early) == f"{SCHEMA}.{name}"
+
+
+def test_queries_bounded_by_created_at_are_pruned(schema):
+    maintainer(months_ahead=3).run_once(now=NOW)
+    month = add_months(THIS_MONTH, 2)
+
+    with engine.connect() as conn:
+        plan = "\n".join(
+            conn.execute(
+                text(
+                    f"EXPLAIN SELECT id FROM {SCHEMA}.articles"
+                    " WHERE created_at >= :lower AND created_at < :upper"
+                ),
+                {"lower": month, "upper": add_months(month, 1)},
+            ).scalars()
+        )
+
+    assert partition_name("articles", month) in plan
+    assert "articles_legacy" not in plan
+    assert "articles_default" not in plan
+
+
+def test_expired_partitions_are_dropped_with_tombstones(schema):
+    old = insert(THIS_MONTH)
+    maintainer(months_ahead=2).run_once(now=NOW)
+    recent = insert(add_months(THIS_MONTH, 2))
+
+    # Four months on, keep two full months before the current one
+    later = add_months(THIS_MONTH, 4)
+    dropped = maintainer(months_ahead=0, retention_months=2).run_once(now=later)
+
+    assert sorted(dropped["dropped"]) == [
+        "articles_legacy",
+        partition_name("articles", add_months(THIS_MONTH, 1)),
+    ]
+    assert partition_of(old) is None
+    assert partition_of(recent) is not None
+    with engine.connect() as conn:
+        tombstones = conn.execute(
+            text(f"SELECT article_id FROM {SCHEMA}.article_tombstones")
+        ).scalars()
+        assert list(tombstones) == [old]
@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.summarizer_replicas import (
+    PRIMARY_ONLY,
+    ReplicaSet,
+    RoutingSession,
+    read_only,
+)
+
+
+def stand_in(path, name):
+    engine = create_engine(f"sqlite:///{path / name}.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE server (name TEXT)"))
+        conn.execute(text("INSERT INTO server VALUES (:name)"), {"name": name})
+    return engine
+
+
+class Reader:
+    def __init__(self, db):
+        self.db = db
+
+    @read_only
+    def server(self):
+        return self.db.execute(text("SELECT name FROM server")).scalar()
+
+    def write(self, name):
+        self.db.execute(text("UPDATE server SET name = :name"), {"name": name})
+        self.db.commit()
+
+
+@pytest.fixture
+def primary(tmp_path):
+    return stand_in(tmp_path, "primary")
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    return ReplicaSet(
+        [stand_in(tmp_path, "replica_a"), stand_in(tmp_path, "replica_b")],
+        retry_interval=60.0,
+    )
+
+
+def reader(primary, replicas):
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)
+    return Reader(factory())
+
+
+def test_reads_rotate_over_replicas(primary, replicas):
+    served = [reader(primary, replicas).server() for _ in range(4)]
+
+    assert served == ["replica_a", "replica_b", "replica_a", "replica_b"]
+
+
+def test_a_session_reads_from_one_replica(primary, replicas):
+    service = reader(primary, replicas)
+
+    assert {service.server() for _ in range(3)} == {"replica_a"}
+
+
+def test_writes_and_plain_reads_go_to_the_primary(primary, replicas):
+    service = reader(primary, replicas)
+    service.write("written")
+
+    assert service.db.execute(text("SELECT name FROM server")).scalar() == "written"
+    assert service.server() == "replica_a"
+
+
+def test_read_your_writes_reads_from_the_primary(primary, replicas):
+    service = reader(primary, replicas)
+    service.db.info[PRIMARY_ONLY] = True
+
+    assert service.server() == "primary"
+
+
+def test_without_replicas_reads_go_to_the_primary(primary):
+    assert reader(primary, ReplicaSet([])).server() == "primary"
+
+
+def test_failed_replica_is_skipped_until_it_recovers(tmp_path, primary):
+    broken = create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+    replicas = ReplicaSet([broken, stand_in(tmp_path, "replica_b")], 60.0)
+
+    # The failed read is retried on the primary, then the replica is skipped
+    assert reader(primary, replicas).server() == "primary"
+    assert replicas.healthy() == 1
+    assert [reader(primary, replicas).server() for _ in range(2)] == [
+        "replica_b",
+        "replica_b",
+    ]
+
+    # Once the retry interval has passed, a successful probe restores it
+    (tmp_path / "missing").mkdir()
+    stand_in(tmp_path / "missing", "replica")
+    replicas.retry_interval = 0.0
+    assert [reader(primary, replicas).server() for _ in range(2)] == [
+        "replica",
+        "replica_b",
+    ]
+    assert replicas.healthy() == 2
+
+
+def test_failures_without_a_replica_are_raised(tmp_path):
+    broken = create_engine(f"sqlite:///{tmp_path}/missing/primary.db")
+
+    with pytest.raises(OperationalError):
+        reader(broken, ReplicaSet([])).server()
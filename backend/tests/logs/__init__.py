@@ -0,0 +1 @@
+# Initialize the logs tests package
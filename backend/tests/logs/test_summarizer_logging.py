@@ -0,0 +1,81 @@
+import logging
+import queue
+
+from backend.app.logs.summarizer_logging import (
+    DroppingQueueHandler,
+    apply_module_levels,
+    build_queue_handler,
+    get_logger,
+)
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def make_record(level, msg, *args):
+    return logging.LogRecord("summarizer.test", level, __file__, 1, msg, args, None)
+
+
+def test_full_queue_drops_info_records():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+    for i in range(5):
+        handler.handle(make_record(logging.INFO, "info %s", i))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_full_queue_keeps_warnings_by_evicting_oldest():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    handler.handle(make_record(logging.INFO, "old"))
+    handler.handle(make_record(logging.INFO, "newer"))
+
+    handler.handle(make_record(logging.WARNING, "warning"))
+
+    queued = [handler.queue.get_nowait().msg for _ in range(2)]
+    assert queued == ["newer", "warning"]
+    assert handler.dropped == 1
+
+
+def test_records_are_formatted_on_listener_thread():
+    handler = DroppingQueueHandler(queue.Queue())
+    record = make_record(logging.INFO, "article %s", 42)
+
+    handler.handle(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued.msg == "article %s"
+    assert queued.args == (42,)
+
+
+def test_queue_listener_delivers_records():
+    target = CollectingHandler()
+    queue_handler = build_queue_handler([target], maxsize=100)
+    logger = logging.getLogger("summarizer_test_listener")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    try:
+        logger.warning("scraped %s", "https://example.com")
+    finally:
+        queue_handler.listener.stop()
+        logger.removeHandler(queue_handler)
+
+    assert target.messages == ["scraped https://example.com"]
+
+
+def test_apply_module_levels():
+    apply_module_levels("db=WARNING, summarizer.scrape=DEBUG")
+    try:
+        assert get_logger("db").getEffectiveLevel() == logging.WARNING
+        assert get_logger("scrape").getEffectiveLevel() == logging.DEBUG
+        assert not get_logger("db").isEnabledFor(logging.INFO)
+    finally:
+        get_logger("db").setLevel(logging.NOTSET)
+        get_logger("scrape").setLevel(logging.NOTSET)
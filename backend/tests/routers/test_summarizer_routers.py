@@ -1,10 +1,27 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
+from backend.app.core.summarizer_admission import AdmissionLane
+from backend.app.core.summarizer_metrics import ERRORS
 from backend.app.main import app
+from backend.app.routers import summarizer_routers
 from backend.app.routers.summarizer_routers import get_summarizer_service
-from backend.app.schemas.summarizer_schemas import ArticleCreate, ArticleResponse
+from backend.app.exceptions.summarizer_exceptions import (
+    ArticleNotFoundException,
+    CategoryNotFoundException,
+)
+from backend.app.schemas.summarizer_schemas import (
+    ArticleChange,
+    ArticleChangesResponse,
+    ArticleCreate,
+    ArticleDetailResponse,
+    ArticleResponse,
+    SimilarArticleResponse,
+)
+from backend.app.services.summarizer_article_cache import CachedArticle
 from backend.app.db.summarizer_db import get_db
+from backend.app.db.summarizer_replicas import ReplicaSet
 from backend.app.core.summarizer_config import settings
 
 client = TestClient(app)
@@ -24,7 +41,7 @@ class MockSummarizerService:
             url="https://example.com/test",
         )
 
-    def get_articles(self) -> list:
+    def get_articles(self, created_after=None, created_before=None) -> list:
         return [
             ArticleResponse(
                 id=1,
@@ -35,7 +52,9 @@ class MockSummarizerService:
             )
         ]
 
-    def get_articles_by_category(self, category_name: str) -> list:
+    def get_articles_by_category(self, category_name: str, **window) -> list:
+        if category_name == "Missing":
+            raise CategoryNotFoundException(category_name)
         return [
             ArticleResponse(
                 id=1,
@@ -46,10 +65,60 @@ class MockSummarizerService:
             )
         ]
 
+    def get_article_changes(self, since: int = 0, limit: int = 500):
+        changes = [
+            ArticleChange(
+                op="insert",
+                id=1,
+                article=ArticleResponse(id=1, url="https://example.com/test"),
+            ),
+            ArticleChange(op="delete", id=2),
+        ]
+        return ArticleChangesResponse(
+            changes=changes[since:][:limit],
+            cursor=since + min(limit, len(changes[since:])),
+            has_more=since + limit < len(changes),
+        )
+
+    def get_article_fragments(self, category=None, **window) -> list:
+        return [b'{"id":1,"url":"https://example.com/test"}', b'{"id":2,"url":"x"}']
+
+    def get_article_detail(self, article_id: int) -> CachedArticle:
+        if article_id != 1:
+            raise ArticleNotFoundException(f"Article with ID {article_id} not found")
+        return CachedArticle.of(
+            ArticleDetailResponse(
+                id=1,
+                title="Test",
+                summary="Test summary",
+                category="Test",
+                url="https://example.com/test",
+                content="Test content",
+            )
+        )
+
+    def get_similar_articles(self, article_id: int, limit: int = 10) -> list:
+        if article_id != 1:
+            raise ArticleNotFoundException(f"Article with ID {article_id} not found")
+        return [
+            SimilarArticleResponse(
+                id=2,
+                title="Related",
+                summary="Related summary",
+                category="Test",
+                url="https://example.com/related",
+                similarity=0.75,
+            )
+        ][:limit]
+
     def delete_article(self, article_id: int):
         pass
 
 
+def errors(exception):
+    return ERRORS.labels(exception=exception)._value.get()
+
+
 @pytest.fixture
 def mock_service():
     return MockSummarizerService(None)
@@ -84,6 +153,45 @@ def test_create_article(override_get_summarizer_service):
         "category": "Test",
         "url": "https://example.com/test",
     }
+    # Without read replicas there is nothing to stick to
+    assert "read_primary" not in response.cookies
+
+
+def test_create_article_sticks_reads_to_the_primary(
+    override_get_summarizer_service, monkeypatch
+):
+    monkeypatch.setattr(
+        summarizer_routers, "replicas", ReplicaSet([create_engine("sqlite://")])
+    )
+
+    response = client.post(
+        f"{API_PREFIX}/articles/", json={"url": "https://example.com/test"}
+    )
+
+    assert response.status_code == 200
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith("read_primary=1")
+    assert f"Max-Age={settings.READ_YOUR_WRITES_SECONDS}" in cookie
+
+
+def test_create_article_is_shed_when_ingestion_is_saturated(
+    override_get_summarizer_service, monkeypatch
+):
+    # No slots and no queue: every submission is rejected at once
+    monkeypatch.setattr(
+        summarizer_routers, "ingest_lane", AdmissionLane("test", 1, 0, 1.0)
+    )
+    summarizer_routers.ingest_lane._in_flight = 1
+
+    response = client.post(
+        f"{API_PREFIX}/articles/", json={"url": "https://example.com/test"}
+    )
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["detail"]["error"] == "OverloadedException"
+    # Reads do not go through the ingestion lane
+    assert client.get(f"{API_PREFIX}/articles/").status_code == 200
 
 
 def test_read_articles(override_get_summarizer_service):
@@ -114,7 +222,108 @@ def test_read_articles_by_category(override_get_summarizer_service):
     ]
 
 
+def test_read_articles_by_missing_category_is_counted(
+    override_get_summarizer_service,
+):
+    before = errors("CategoryNotFoundException")
+
+    response = client.get(f"{API_PREFIX}/articles/category/Missing")
+
+    assert response.status_code == 404
+    assert errors("CategoryNotFoundException") == before + 1
+
+
 def test_remove_article(override_get_summarizer_service):
     response = client.delete(f"{API_PREFIX}/articles/1")
     assert response.status_code == 200
     assert response.json() == {"message": "Article deleted successfully"}
+
+
+def test_read_similar_articles(override_get_summarizer_service):
+    response = client.get(f"{API_PREFIX}/articles/1/similar?limit=5")
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": 2,
+            "title": "Related",
+            "summary": "Related summary",
+            "category": "Test",
+            "url": "https://example.com/related",
+            "similarity": 0.75,
+        }
+    ]
+
+    before = errors("ArticleNotFoundException")
+    assert client.get(f"{API_PREFIX}/articles/2/similar").status_code == 404
+    assert errors("ArticleNotFoundException") == before + 1
+    assert client.get(f"{API_PREFIX}/articles/1/similar?limit=0").status_code == 422
+
+
+def test_read_article(override_get_summarizer_service):
+    response = client.get(f"{API_PREFIX}/articles/1")
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": 1,
+        "title": "Test",
+        "summary": "Test summary",
+        "category": "Test",
+        "url": "https://example.com/test",
+    }
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    etag = response.headers["etag"]
+
+    response = client.get(f"{API_PREFIX}/articles/1?include=content")
+    assert response.json()["content"] == "Test content"
+    assert response.headers["etag"] != etag
+
+    response = client.get(f"{API_PREFIX}/articles/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    before = errors("ArticleNotFoundException")
+    assert client.get(f"{API_PREFIX}/articles/2").status_code == 404
+    assert errors("ArticleNotFoundException") == before + 1
+    assert client.get(f"{API_PREFIX}/articles/1?include=html").status_code == 422
+
+
+def test_read_articles_fast_json(override_get_summarizer_service, monkeypatch):
+    monkeypatch.setattr(settings, "FAST_JSON", True)
+
+    for path in ("/articles/", "/articles/category/Test"):
+        response = client.get(f"{API_PREFIX}{path}")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            {"id": 1, "url": "https://example.com/test"},
+            {"id": 2, "url": "x"},
+        ]
+
+
+def test_read_article_changes(override_get_summarizer_service):
+    response = client.get(f"{API_PREFIX}/articles/changes?limit=1")
+    assert response.status_code == 200
+    assert response.json() == {
+        "changes": [
+            {
+                "op": "insert",
+                "id": 1,
+                "changed_at": None,
+                "article": {
+                    "id": 1,
+                    "title": None,
+                    "url": "https://example.com/test",
+                    "summary": None,
+                    "category": None,
+                },
+            }
+        ],
+        "cursor": 1,
+        "has_more": True,
+    }
+
+    response = client.get(f"{API_PREFIX}/articles/changes?since=1")
+    assert response.json()["changes"] == [
+        {"op": "delete", "id": 2, "changed_at": None, "article": None}
+    ]
+    assert response.json()["has_more"] is False
+    assert client.get(f"{API_PREFIX}/articles/changes?since=-1").status_code == 422
@@ -0,0 +1,104 @@
+import json
+import time
+from types import SimpleNamespace
+
+from backend.app.schemas.summarizer_schemas import ArticleDetailResponse
+from backend.app.services.summarizer_article_cache import (
+    ArticleCache,
+    ArticleFragments,
+)
+
+
+def article(article_id, summary="Summary"):
+    return ArticleDetailResponse(
+        id=article_id,
+        url=f"https://example.com/{article_id}",
+        title="Title",
+        summary=summary,
+        category="general",
+        content="Content",
+    )
+
+
+def test_least_recently_used_articles_are_evicted():
+    cache = ArticleCache(max_size=2, ttl=60)
+    for article_id in (1, 2):
+        cache.put(article(article_id), cache.generation)
+    cache.get(1)
+    cache.put(article(3), cache.generation)
+
+    assert cache.get(2) is None
+    assert cache.get(1).article.id == 1
+    assert cache.get(3).article.id == 3
+
+
+def test_entries_expire():
+    cache = ArticleCache(max_size=2, ttl=0.01)
+    cache.put(article(1), cache.generation)
+    time.sleep(0.02)
+
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_etag_follows_the_article():
+    cache = ArticleCache(max_size=2, ttl=60)
+    first = cache.put(article(1), cache.generation)
+    same = cache.put(article(1), cache.generation)
+    changed = cache.put(article(1, "New summary"), cache.generation)
+
+    assert first.etag == same.etag
+    assert first.etag != changed.etag
+    assert first.etag.startswith("1-")
+
+
+def test_loads_racing_an_invalidation_are_not_cached():
+    cache = ArticleCache(max_size=2, ttl=60)
+    generation = cache.generation
+    # Deleted after the reader loaded it, before the reader cached it
+    cache.invalidate(1)
+
+    entry = cache.put(article(1), generation)
+
+    assert entry.article.id == 1
+    assert cache.get(1) is None
+
+
+def row(article_id, version="v1", summary="Summary"):
+    return SimpleNamespace(
+        id=article_id,
+        summary_version=version,
+        title="Title",
+        url=f"https://example.com/{article_id}",
+        summary=summary,
+        category="general",
+    )
+
+
+def test_fragments_encode_list_articles():
+    fragments = ArticleFragments(max_size=10)
+
+    encoded = fragments.encode([row(1), row(2)])
+
+    assert [json.loads(fragment) for fragment in encoded] == [
+        {
+            "id": article_id,
+            "title": "Title",
+            "url": f"https://example.com/{article_id}",
+            "summary": "Summary",
+            "category": "general",
+        }
+        for article_id in (1, 2)
+    ]
+
+
+def test_fragments_are_reused_until_the_summary_version_changes():
+    fragments = ArticleFragments(max_size=2)
+    first = fragments.encode([row(1)])[0]
+
+    assert fragments.encode([row(1, summary="Ignored")])[0] is first
+    updated = fragments.encode([row(1, "v2", "New summary")])[0]
+    assert json.loads(updated)["summary"] == "New summary"
+
+    fragments.encode([row(2), row(3)])
+    assert len(fragments) == 2
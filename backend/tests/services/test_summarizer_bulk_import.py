@@ -0,0 +1,209 @@
+import gzip
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.models.summarizer_models import TestArticle
+from backend.app.services.summarizer_bulk_import import (
+    BulkImporter,
+    _copy_value,
+    iter_html_dir,
+    iter_warc,
+)
+from backend.benchmarks.fake_news_site import render_article
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def warc_record(record_type, url, content_type, block):
+    headers = (
+        f"WARC/1.0\r\nWARC-Type: {record_type}\r\nWARC-Target-URI: {url}\r\n"
+        f"Content-Type: {content_type}\r\nContent-Length: {len(block)}\r\n\r\n"
+    )
+    return headers.encode() + block + b"\r\n\r\n"
+
+
+def http_response(status, content_type, body, headers=""):
+    head = f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n{headers}\r\n"
+    return head.encode() + body
+
+
+def chunked(body, size=100):
+    parts = [body[i : i + size] for i in range(0, len(body), size)]
+    return (
+        b"".join(b"%x\r\n%s\r\n" % (len(part), part) for part in parts) + b"0\r\n\r\n"
+    )
+
+
+def write_warc(path, records):
+    data = b"".join(records)
+    if path.name.endswith(".gz"):
+        data = gzip.compress(data)
+    path.write_bytes(data)
+    return path
+
+
+def write_site(root, ids):
+    for article_id in ids:
+        section = root / f"section{article_id % 2}"
+        section.mkdir(parents=True, exist_ok=True)
+        (section / f"{article_id}.html").write_bytes(render_article(article_id))
+    return root
+
+
+@pytest.fixture
+def db():
+    session = TestingSessionLocal()
+    session.query(TestArticle).delete()
+    session.commit()
+    yield session
+    session.query(TestArticle).delete()
+    session.commit()
+    session.close()
+
+
+def importer(**kwargs):
+    kwargs.setdefault("workers", 0)
+    kwargs.setdefault("chunk_size", 2)
+    return BulkImporter(
+        engine=engine,
+        schema="test_summary",
+        table="test_articles",
+        report=lambda line: None,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("name", ["archive.warc", "archive.warc.gz"])
+def test_warc_yields_successful_html_pages(tmp_path, name):
+    page = render_article(1)
+    path = write_warc(
+        tmp_path / name,
+        [
+            warc_record("warcinfo", "", "application/warc-fields", b"software: x"),
+            warc_record(
+                "request", "https://a.example/1", "application/http", b"GET / HTTP/1.1"
+            ),
+            warc_record(
+                "response",
+                "https://a.example/1",
+                "application/http; msgtype=response",
+                http_response(
+                    "200 OK",
+                    "text/html; charset=utf-8",
+                    chunked(gzip.compress(page)),
+                    "Transfer-Encoding: chunked\r\nContent-Encoding: gzip\r\n",
+                ),
+            ),
+            warc_record(
+                "response",
+                "https://a.example/missing",
+                "application/http; msgtype=response",
+                http_response("404 Not Found", "text/html", b"<p>gone</p>"),
+            ),
+            warc_record(
+                "response",
+                "https://a.example/logo.png",
+                "application/http; msgtype=response",
+                http_response("200 OK", "image/png", b"\x89PNG"),
+            ),
+            warc_record("resource", "https://a.example/2", "text/html", page),
+        ],
+    )
+
+    pages = list(iter_warc(path))
+
+    assert [p.url for p in pages] == ["https://a.example/1", "https://a.example/2"]
+    assert all(p.html == page for p in pages)
+
+
+def test_html_directory_pages_in_stable_order(tmp_path):
+    site = write_site(tmp_path / "site", [1, 2, 3])
+    (site / "section0" / "notes.txt").write_text("not a page")
+
+    pages = list(iter_html_dir(site, "https://a.example/archive/"))
+
+    assert [p.url for p in pages] == [
+        "https://a.example/archive/section0/2.html",
+        "https://a.example/archive/section1/1.html",
+        "https://a.example/archive/section1/3.html",
+    ]
+    assert list(iter_html_dir(site))[0].url.startswith("file://")
+
+
+def test_copy_values_are_escaped():
+    assert _copy_value(None) == "\\N"
+    assert _copy_value("a\tb\nc\\d\x00") == "a\\tb\\nc\\\\d"
+
+
+def test_import_loads_articles_and_resumes(db, tmp_path):
+    site = write_site(tmp_path / "site", [1, 2, 3])
+    (site / "section1" / "empty.html").write_text("<html><body></body></html>")
+    checkpoint = tmp_path / "checkpoint.json"
+    summarized = []
+
+    def summarize(content):
+        summarized.append(content)
+        return {"summary": content[:40], "category": "Science"}
+
+    progress = importer(summarize=summarize, llm_rate=0).run(
+        [site], "https://a.example", checkpoint
+    )
+
+    assert progress == {
+        "records": 4,
+        "imported": 3,
+        "duplicates": 0,
+        "failed": 1,
+        "summarized": 3,
+    }
+    articles = db.query(TestArticle).order_by(TestArticle.url).all()
+    assert [a.url for a in articles] == [
+        "https://a.example/section0/2.html",
+        "https://a.example/section1/1.html",
+        "https://a.example/section1/3.html",
+    ]
+    assert articles[1].title.startswith("Researchers report progress")
+    assert articles[1].summary == articles[1].content[:40]
+    assert articles[1].category == "science"
+    assert articles[1].summary_version is not None
+    assert json.loads(checkpoint.read_text())["records"] == 4
+
+    # A rerun continues after the checkpoint: only the new page is read
+    (site / "updates").mkdir()
+    (site / "updates" / "5.html").write_bytes(render_article(5))
+    progress = importer(summarize=summarize).run(
+        [site], "https://a.example", checkpoint
+    )
+
+    assert progress["records"] == 5
+    assert progress["imported"] == 4
+    assert len(summarized) == 4
+    assert db.query(TestArticle).count() == 4
+
+
+def test_import_skips_stored_urls_and_leaves_summaries_to_the_job(db, tmp_path):
+    site = write_site(tmp_path / "site", [1, 2])
+    importer().run([site], "https://a.example")
+
+    progress = importer(workers=2).run([site], "https://a.example")
+
+    assert progress["imported"] == 0
+    assert progress["duplicates"] == 2
+    articles = db.query(TestArticle).all()
+    assert len(articles) == 2
+    assert {a.summary for a in articles} == {""}
+    assert {a.summary_version for a in articles} == {None}
+    assert {a.category for a in articles} == {settings.DEFAULT_CATEGORY.lower()}
+
+
+def test_checkpoint_of_other_inputs_is_refused(db, tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    importer().run([write_site(tmp_path / "a", [1])], None, checkpoint)
+
+    with pytest.raises(ValueError):
+        importer().run([write_site(tmp_path / "b", [2])], None, checkpoint)
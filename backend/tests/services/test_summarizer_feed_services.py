@@ -0,0 +1,279 @@
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.exceptions.summarizer_exceptions import FeedNotFoundException
+from backend.app.models.summarizer_models import TestFeed
+from backend.app.schemas.summarizer_schemas import FeedCreate
+from backend.app.services import summarizer_feed_services
+from backend.app.services.summarizer_feed_services import (
+    FeedService,
+    IngestQueue,
+    iter_feed_items,
+)
+from backend.app.services.summarizer_scrape_scheduler import ScrapeScheduler
+
+FIXTURES = Path(__file__).parent / "fixtures" / "feeds"
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class FeedServer:
+    """Local HTTP server serving a feed document with ETag support."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"v1"'
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                if self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.send_header("ETag", server.etag)
+                self.send_header("Content-Length", str(len(server.body)))
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/feed.xml"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def publish(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(scope="function")
+def test_db():
+    TestFeed.__table__.create(bind=engine, checkfirst=True)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.query(TestFeed).delete()
+        db.commit()
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def fast_scheduler(monkeypatch):
+    scheduler = ScrapeScheduler(min_host_delay=0.0, robots_ttl=0.0, timeout=5.0)
+    monkeypatch.setattr(summarizer_feed_services, "scrape_scheduler", scheduler)
+    return scheduler
+
+
+@pytest.fixture
+def rss_server():
+    server = FeedServer((FIXTURES / "rss.xml").read_bytes())
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def enqueued():
+    return []
+
+
+@pytest.fixture
+def feed_service(test_db, enqueued):
+    def enqueue(url):
+        enqueued.append(url)
+        return True
+
+    return FeedService(test_db, model=TestFeed, enqueue=enqueue)
+
+
+def test_iter_feed_items_rss():
+    with open(FIXTURES / "rss.xml", "rb") as f:
+        items = list(iter_feed_items(f))
+
+    assert [item.guid for item in items] == [
+        "example-3",
+        "example-2",
+        "https://news.example.com/stories/1",
+    ]
+    assert items[0].link == "https://news.example.com/stories/3"
+    assert items[0].title == "Third story"
+
+
+def test_iter_feed_items_atom_prefers_alternate_link():
+    with open(FIXTURES / "atom.xml", "rb") as f:
+        items = list(iter_feed_items(f))
+
+    assert [item.link for item in items] == [
+        "https://tech.example.com/posts/chip-launch",
+        "https://tech.example.com/posts/browser-update",
+    ]
+    assert items[0].guid == "urn:example:tech:2"
+
+
+def test_iter_feed_items_stops_at_last_seen_guid():
+    with open(FIXTURES / "rss.xml", "rb") as f:
+        items = list(iter_feed_items(f, stop_guid="example-2"))
+
+    assert [item.guid for item in items] == ["example-3"]
+
+
+def test_iter_feed_items_does_not_read_past_last_seen_guid():
+    entries = "".join(
+        f"<item><guid>g{i}</guid><link>https://example.com/{i}</link></item>"
+        for i in range(20000)
+    )
+    body = f"<rss><channel>{entries}</channel></rss>".encode()
+
+    class CountingStream(io.BytesIO):
+        consumed = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            CountingStream.consumed += len(chunk)
+            return chunk
+
+    stream = CountingStream(body)
+    items = list(iter_feed_items(stream, stop_guid="g5"))
+
+    assert len(items) == 5
+    assert CountingStream.consumed < len(body) // 10
+
+
+def test_poll_feed_enqueues_new_items_oldest_first(feed_service, rss_server, enqueued):
+    feed = feed_service.create_feed(FeedCreate(url=rss_server.url))
+
+    items = feed_service.poll_feed(feed.id)
+
+    assert len(items) == 3
+    assert enqueued == [
+        "https://news.example.com/stories/1",
+        "https://news.example.com/stories/2",
+        "https://news.example.com/stories/3",
+    ]
+    assert feed.last_guid == "example-3"
+    assert feed.etag == '"v1"'
+    assert feed.last_polled_at is not None
+
+
+def test_poll_feed_uses_conditional_get(feed_service, rss_server, enqueued):
+    feed = feed_service.create_feed(FeedCreate(url=rss_server.url))
+    feed_service.poll_feed(feed.id)
+    enqueued.clear()
+
+    items = feed_service.poll_feed(feed.id)
+
+    assert items == []
+    assert enqueued == []
+    assert rss_server.requests[-1]["If-None-Match"] == '"v1"'
+
+
+def test_poll_feed_only_enqueues_items_after_last_guid(
+    feed_service, rss_server, enqueued
+):
+    feed = feed_service.create_feed(FeedCreate(url=rss_server.url))
+    feed_service.poll_feed(feed.id)
+    enqueued.clear()
+
+    updated = (
+        (FIXTURES / "rss.xml")
+        .read_text()
+        .replace(
+            "<item>",
+            "<item><title>Fourth story</title>"
+            "<link>https://news.example.com/stories/4</link>"
+            "<guid>example-4</guid></item><item>",
+            1,
+        )
+    )
+    rss_server.publish(updated.encode(), '"v2"')
+
+    items = feed_service.poll_feed(feed.id)
+
+    assert [item.guid for item in items] == ["example-4"]
+    assert enqueued == ["https://news.example.com/stories/4"]
+    assert feed.last_guid == "example-4"
+
+
+def test_poll_feed_takes_a_backlog_oldest_first_over_several_polls(
+    feed_service, rss_server, enqueued, monkeypatch
+):
+    monkeypatch.setattr(settings, "FEED_MAX_ITEMS_PER_POLL", 2)
+    feed = feed_service.create_feed(FeedCreate(url=rss_server.url))
+
+    items = feed_service.poll_feed(feed.id)
+
+    assert [item.link for item in items] == [
+        "https://news.example.com/stories/2",
+        "https://news.example.com/stories/1",
+    ]
+    assert feed.last_guid == "example-2"
+    # Not stored, so the next poll is not answered with a 304
+    assert feed.etag is None
+
+    items = feed_service.poll_feed(feed.id)
+
+    assert [item.guid for item in items] == ["example-3"]
+    assert enqueued == [
+        "https://news.example.com/stories/1",
+        "https://news.example.com/stories/2",
+        "https://news.example.com/stories/3",
+    ]
+    assert feed.last_guid == "example-3"
+    assert feed.etag == '"v1"'
+
+
+def test_poll_feed_leaves_items_rejected_by_a_full_queue_for_the_next_poll(
+    test_db, rss_server
+):
+    # No workers, so items stay queued until the test takes them
+    ingest = IngestQueue(workers=0, maxsize=1)
+    feed_service = FeedService(test_db, model=TestFeed, enqueue=ingest.submit)
+    feed = feed_service.create_feed(FeedCreate(url=rss_server.url))
+    taken = []
+
+    for _ in range(3):
+        assert feed.etag is None
+        items = feed_service.poll_feed(feed.id)
+        assert len(items) == 1
+        taken.append(ingest._queue.get_nowait())
+
+    assert taken == [
+        "https://news.example.com/stories/1",
+        "https://news.example.com/stories/2",
+        "https://news.example.com/stories/3",
+    ]
+    assert feed.last_guid == "example-3"
+    # Stored only once nothing was left behind
+    assert feed.etag == '"v1"'
+    assert feed_service.poll_feed(feed.id) == []
+
+
+def test_create_feed_duplicate_url(feed_service, rss_server):
+    first = feed_service.create_feed(FeedCreate(url=rss_server.url))
+    second = feed_service.create_feed(FeedCreate(url=rss_server.url))
+
+    assert first.id == second.id
+    assert len(feed_service.get_feeds()) == 1
+
+
+def test_delete_feed_not_found(feed_service):
+    with pytest.raises(FeedNotFoundException):
+        feed_service.delete_feed(999999)
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.app.services.summarizer_llm_batcher import LLMBatcher
+
+
+class FakeLLM:
+    """Records single and batched calls; results echo the article content."""
+
+    def __init__(self, fail_batches: bool = False):
+        self.fail_batches = fail_batches
+        self.single_calls = []
+        self.batch_calls = []
+        self._lock = threading.Lock()
+
+    def summarize_one(self, content: str) -> dict:
+        with self._lock:
+            self.single_calls.append(content)
+        return {"summary": f"single: {content}", "category": "General"}
+
+    def summarize_batch(self, contents):
+        with self._lock:
+            self.batch_calls.append(list(contents))
+        if self.fail_batches:
+            raise ValueError("Expected 4 results, got 3")
+        return [
+            {"summary": f"batched: {content}", "category": "General"}
+            for content in contents
+        ]
+
+
+def make_batcher(llm: FakeLLM, **kwargs) -> LLMBatcher:
+    options = {"batch_size": 4, "max_wait": 5.0, "max_words": 50}
+    options.update(kwargs)
+    return LLMBatcher(
+        summarize_one=llm.summarize_one,
+        summarize_batch=llm.summarize_batch,
+        **options,
+    )
+
+
+def summarize_concurrently(batcher: LLMBatcher, contents):
+    with ThreadPoolExecutor(max_workers=len(contents)) as executor:
+        return list(executor.map(batcher.summarize, contents))
+
+
+def test_concurrent_short_articles_share_one_call():
+    llm = FakeLLM()
+    contents = [f"brief {i}" for i in range(4)]
+
+    results = summarize_concurrently(make_batcher(llm), contents)
+
+    assert len(llm.batch_calls) == 1
+    assert sorted(llm.batch_calls[0]) == contents
+    assert llm.single_calls == []
+    # Each caller receives the result for its own article
+    assert [r["summary"] for r in results] == [f"batched: {c}" for c in contents]
+
+
+def test_batches_are_capped_at_batch_size():
+    llm = FakeLLM()
+    contents = [f"brief {i}" for i in range(8)]
+
+    results = summarize_concurrently(make_batcher(llm), contents)
+
+    assert [len(batch) for batch in llm.batch_calls] == [4, 4]
+    assert [r["summary"] for r in results] == [f"batched: {c}" for c in contents]
+
+
+def test_partial_batch_is_sent_when_the_window_ends():
+    llm = FakeLLM()
+    contents = ["brief 0", "brief 1"]
+
+    results = summarize_concurrently(make_batcher(llm, max_wait=0.2), contents)
+
+    assert [sorted(batch) for batch in llm.batch_calls] == [contents]
+    assert [r["summary"] for r in results] == [f"batched: {c}" for c in contents]
+
+
+def test_lone_article_uses_a_single_call():
+    llm = FakeLLM()
+
+    result = make_batcher(llm, max_wait=0.01).summarize("brief")
+
+    assert result["summary"] == "single: brief"
+    assert llm.batch_calls == []
+
+
+def test_long_articles_are_not_batched():
+    llm = FakeLLM()
+    long_article = " ".join(["word"] * 51)
+
+    results = summarize_concurrently(make_batcher(llm), [long_article] * 2)
+
+    assert llm.batch_calls == []
+    assert len(llm.single_calls) == 2
+    assert all(r["summary"].startswith("single: ") for r in results)
+
+
+@pytest.mark.parametrize("batch_size", [0, 1])
+def test_batch_size_one_disables_batching(batch_size):
+    llm = FakeLLM()
+
+    summarize_concurrently(make_batcher(llm, batch_size=batch_size), ["a", "b"])
+
+    assert llm.batch_calls == []
+    assert sorted(llm.single_calls) == ["a", "b"]
+
+
+def test_failed_batch_falls_back_to_single_calls():
+    llm = FakeLLM(fail_batches=True)
+    contents = [f"brief {i}" for i in range(4)]
+
+    results = summarize_concurrently(make_batcher(llm), contents)
+
+    assert len(llm.batch_calls) == 1
+    assert sorted(llm.single_calls) == contents
+    assert [r["summary"] for r in results] == [f"single: {c}" for c in contents]
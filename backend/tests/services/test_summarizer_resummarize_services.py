@@ -0,0 +1,183 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.exceptions.summarizer_exceptions import (
+    ResummarizeJobActiveException,
+)
+from backend.app.models.summarizer_models import TestArticle, TestResummarizeJob
+from backend.app.services.summarizer_resummarize_services import (
+    COMPLETED,
+    PAUSED,
+    Resummarizer,
+)
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+OLD_VERSION = "gpt-old:aaaa"
+NEW_VERSION = "gpt-new:bbbb"
+
+
+class FakeSummarizer:
+    """Records calls and concurrency; fails for content containing 'broken'."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, content: str) -> dict:
+        with self._lock:
+            self.calls.append(content)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if "broken" in content:
+                raise ValueError("LLM returned invalid JSON")
+            return {"summary": f"new summary of {content}", "category": "Technology"}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def db():
+    TestResummarizeJob.__table__.create(bind=engine, checkfirst=True)
+    session = TestingSessionLocal()
+    session.query(TestArticle).delete()
+    session.query(TestResummarizeJob).delete()
+    session.commit()
+    yield session
+    session.query(TestArticle).delete()
+    session.query(TestResummarizeJob).delete()
+    session.commit()
+    session.close()
+
+
+def add_articles(db, count: int, version=OLD_VERSION, prefix="content"):
+    articles = [
+        TestArticle(
+            url=f"https://example.com/{prefix}/{i}",
+            title=f"Article {i}",
+            content=f"{prefix} {i}",
+            summary="old summary",
+            category="general",
+            summary_version=version,
+        )
+        for i in range(count)
+    ]
+    db.add_all(articles)
+    db.commit()
+    return articles
+
+
+def make_resummarizer(summarize, **kwargs):
+    return Resummarizer(
+        session_factory=TestingSessionLocal,
+        article_model=TestArticle,
+        job_model=TestResummarizeJob,
+        summarize=summarize,
+        version=lambda: NEW_VERSION,
+        **kwargs,
+    )
+
+
+def test_resummarizes_outdated_articles_from_stored_content(db):
+    add_articles(db, 7)
+    add_articles(db, 2, version=None, prefix="legacy")
+    add_articles(db, 3, version=NEW_VERSION, prefix="current")
+    summarize = FakeSummarizer()
+    job = make_resummarizer(summarize, batch_size=4, concurrency=2)
+
+    job_id = job.start()
+    assert job.wait(10)
+
+    db.expire_all()
+    record = db.get(TestResummarizeJob, job_id)
+    assert record.status == COMPLETED
+    assert (record.total, record.processed, record.failed) == (9, 9, 0)
+    # Up-to-date articles are skipped; the rest are summarized from content
+    assert len(summarize.calls) == 9
+    assert not any(call.startswith("current") for call in summarize.calls)
+    articles = db.query(TestArticle).all()
+    assert {a.summary_version for a in articles} == {NEW_VERSION}
+    assert all(
+        a.summary == f"new summary of {a.content}" and a.category == "technology"
+        for a in articles
+        if not a.content.startswith("current")
+    )
+
+
+def test_concurrency_limit(db):
+    add_articles(db, 12)
+    summarize = FakeSummarizer(delay=0.02)
+    job = make_resummarizer(summarize, batch_size=12, concurrency=3)
+
+    job.start()
+    assert job.wait(10)
+
+    assert summarize.peak == 3
+
+
+def test_resumes_from_checkpoint(db):
+    add_articles(db, 10)
+    summarize = FakeSummarizer(delay=0.05)
+    job = make_resummarizer(summarize, batch_size=2, concurrency=1)
+
+    job_id = job.start()
+    while len(summarize.calls) < 3:
+        time.sleep(0.01)
+    job.stop()
+
+    db.expire_all()
+    paused = db.get(TestResummarizeJob, job_id)
+    assert paused.status == PAUSED
+    assert 0 < paused.processed < 10
+    assert paused.last_article_id > 0
+
+    # A fresh instance, as after a restart, continues the same job
+    restarted = make_resummarizer(summarize, batch_size=2, concurrency=1)
+    assert restarted.start() == job_id
+    assert restarted.wait(10)
+
+    db.expire_all()
+    record = db.get(TestResummarizeJob, job_id)
+    assert record.status == COMPLETED
+    assert record.processed == 10
+    assert sorted(summarize.calls) == sorted(f"content {i}" for i in range(10))
+
+
+def test_failed_articles_keep_their_summary(db):
+    add_articles(db, 3)
+    add_articles(db, 1, prefix="broken")
+    job = make_resummarizer(FakeSummarizer(), batch_size=10, concurrency=2)
+
+    job_id = job.start()
+    assert job.wait(10)
+
+    db.expire_all()
+    record = db.get(TestResummarizeJob, job_id)
+    assert (record.processed, record.failed) == (3, 1)
+    broken = db.query(TestArticle).filter(TestArticle.content == "broken 0").one()
+    assert (broken.summary, broken.summary_version) == ("old summary", OLD_VERSION)
+
+
+def test_only_one_job_runs_at_a_time(db):
+    add_articles(db, 4)
+    first = make_resummarizer(FakeSummarizer(delay=0.1), batch_size=1)
+    other_worker = make_resummarizer(FakeSummarizer())
+
+    first.start()
+    with pytest.raises(ResummarizeJobActiveException):
+        first.start()
+    with pytest.raises(ResummarizeJobActiveException):
+        other_worker.start()
+    first.stop()
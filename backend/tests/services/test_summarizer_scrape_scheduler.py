@@ -0,0 +1,247 @@
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.app.exceptions.summarizer_exceptions import ScrapeThrottledException
+from backend.app.services.summarizer_scrape_scheduler import ScrapeScheduler
+
+
+class FakeHost:
+    """Local HTTP server standing in for one publisher host."""
+
+    def __init__(self, robots="", status=200, latency=0.05):
+        self.robots = robots
+        self.status = status
+        self.latency = latency
+        self.hits = []
+        self.robots_hits = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        host = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/robots.txt":
+                    with host.lock:
+                        host.robots_hits += 1
+                    self._reply(200 if host.robots else 404, host.robots)
+                    return
+                with host.lock:
+                    host.active += 1
+                    host.max_active = max(host.max_active, host.active)
+                    host.hits.append(time.monotonic())
+                time.sleep(host.latency)
+                with host.lock:
+                    host.active -= 1
+                self._reply(host.status, "<html><title>Fake</title></html>")
+
+            def _reply(self, status, body):
+                payload = body.encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "2")
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_hosts():
+    hosts = []
+
+    def _make(**kwargs):
+        host = FakeHost(**kwargs)
+        hosts.append(host)
+        return host
+
+    yield _make
+    for host in hosts:
+        host.close()
+
+
+def make_scheduler(**kwargs):
+    options = dict(
+        max_connections=8,
+        per_host_concurrency=2,
+        min_host_delay=0.0,
+        queue_timeout=5.0,
+        block_cooldown=1.0,
+        robots_ttl=60.0,
+        timeout=5.0,
+    )
+    options.update(kwargs)
+    return ScrapeScheduler(**options)
+
+
+def fetch_all(scheduler, urls):
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        return list(pool.map(scheduler.fetch, urls))
+
+
+def test_per_host_concurrency_cap(fake_hosts):
+    first, second = fake_hosts(), fake_hosts()
+    scheduler = make_scheduler(per_host_concurrency=2)
+
+    urls = [first.url(f"/a/{i}") for i in range(6)]
+    urls += [second.url(f"/b/{i}") for i in range(6)]
+    fetch_all(scheduler, urls)
+
+    assert first.max_active == 2
+    assert second.max_active == 2
+
+
+def test_global_connection_budget(fake_hosts):
+    hosts = [fake_hosts() for _ in range(4)]
+    scheduler = make_scheduler(max_connections=3, per_host_concurrency=2)
+    urls = [host.url(f"/{i}") for host in hosts for i in range(3)]
+
+    # Track overlap across every host at once
+    peak = {"active": 0, "max": 0}
+    lock = threading.Lock()
+    original = scheduler._download
+
+    def counting_download(url):
+        if url.endswith("/robots.txt"):
+            return original(url)
+        with lock:
+            peak["active"] += 1
+            peak["max"] = max(peak["max"], peak["active"])
+        try:
+            return original(url)
+        finally:
+            with lock:
+                peak["active"] -= 1
+
+    scheduler._download = counting_download
+    fetch_all(scheduler, urls)
+
+    assert peak["max"] == 3
+    assert sum(len(host.hits) for host in hosts) == len(urls)
+    assert max(host.max_active for host in hosts) <= 2
+
+
+def test_min_host_delay_spaces_requests(fake_hosts):
+    host = fake_hosts(latency=0.0)
+    scheduler = make_scheduler(min_host_delay=0.2, per_host_concurrency=4)
+
+    fetch_all(scheduler, [host.url(f"/{i}") for i in range(3)])
+
+    gaps = [b - a for a, b in zip(host.hits, host.hits[1:])]
+    assert all(gap >= 0.18 for gap in gaps)
+
+
+def test_robots_crawl_delay_is_honoured_and_cached(fake_hosts):
+    host = fake_hosts(robots="User-agent: *\nCrawl-delay: 1\n", latency=0.0)
+    scheduler = make_scheduler(min_host_delay=0.0)
+
+    fetch_all(scheduler, [host.url(f"/{i}") for i in range(2)])
+
+    assert host.robots_hits == 1
+    assert host.hits[1] - host.hits[0] >= 0.95
+
+
+def test_blocked_host_gets_fewer_requests(fake_hosts):
+    blocked, healthy = fake_hosts(status=429), fake_hosts()
+    scheduler = make_scheduler(per_host_concurrency=1, block_cooldown=5.0)
+
+    with pytest.raises(ScrapeThrottledException) as excinfo:
+        scheduler.fetch(blocked.url("/first"))
+    assert excinfo.value.retry_after >= 5.0
+
+    # Further scrapes fail fast without touching the blocked host
+    for i in range(5):
+        with pytest.raises(ScrapeThrottledException):
+            scheduler.fetch(blocked.url(f"/again/{i}"))
+    assert len(blocked.hits) == 1
+
+    # Other hosts are unaffected
+    fetch_all(scheduler, [healthy.url(f"/{i}") for i in range(3)])
+    assert len(healthy.hits) == 3
+
+    stats = scheduler.stats()["hosts"]
+    blocked_key = f"127.0.0.1:{blocked.server.server_port}"
+    assert stats[blocked_key]["limit"] == 1
+    assert stats[blocked_key]["blocked_for"] > 0
+
+
+def test_queue_timeout_raises_throttled(fake_hosts):
+    host = fake_hosts(latency=0.5)
+    scheduler = make_scheduler(per_host_concurrency=1, queue_timeout=0.1)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(scheduler.fetch, host.url(f"/{i}")) for i in range(2)]
+        outcomes = []
+        for future in futures:
+            try:
+                future.result()
+                outcomes.append("ok")
+            except ScrapeThrottledException:
+                outcomes.append("throttled")
+
+    assert sorted(outcomes) == ["ok", "throttled"]
+
+
+def test_robots_requests_count_against_the_budget(fake_hosts):
+    first, second = fake_hosts(), fake_hosts()
+    scheduler = make_scheduler(max_connections=1, queue_timeout=0.1)
+
+    with scheduler.slot(first.url("/page")):
+        with pytest.raises(ScrapeThrottledException):
+            scheduler.fetch(second.url("/page"))
+
+    assert first.robots_hits == 1
+    assert second.robots_hits == 0
+
+
+def test_blocked_host_gets_no_robots_request(fake_hosts):
+    host = fake_hosts(status=429)
+    scheduler = make_scheduler(robots_ttl=0.05, block_cooldown=5.0)
+    with pytest.raises(ScrapeThrottledException):
+        scheduler.fetch(host.url("/first"))
+
+    time.sleep(0.1)
+    with pytest.raises(ScrapeThrottledException):
+        scheduler.fetch(host.url("/again"))
+
+    assert host.robots_hits == 1
+    assert len(host.hits) == 1
+
+
+def test_only_completed_requests_restore_concurrency():
+    scheduler = make_scheduler(robots_ttl=0.0)
+    url = "http://example.invalid/page"
+    scheduler._host_state("example.invalid").limit = 1
+
+    def limit():
+        return scheduler.stats()["hosts"]["example.invalid"]["limit"]
+
+    for _ in range(5):
+        with pytest.raises(urllib.error.URLError):
+            with scheduler.slot(url):
+                raise urllib.error.URLError("connection reset")
+    assert limit() == 1
+
+    for _ in range(5):
+        with scheduler.slot(url):
+            pass
+    assert limit() == 2
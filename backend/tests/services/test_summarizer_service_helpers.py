@@ -0,0 +1,124 @@
+import json
+import os
+
+import pytest
+
+from backend.app.core.summarizer_config import settings
+from backend.app.services import summarizer_service_helpers
+from backend.app.services.summarizer_scrape_scheduler import ScrapeScheduler
+from backend.app.services.summarizer_service_helpers import (
+    generate_summary_classify_article,
+    generate_summary_classify_batch,
+    generate_story_summary,
+    parse_pool,
+    scrape_article,
+)
+from backend.benchmarks import fake_azure_openai
+from backend.benchmarks.fake_azure_openai import FakeAzureOpenAI
+from backend.benchmarks.fake_news_site import FakeNewsSite
+
+
+@pytest.fixture
+def news_site(monkeypatch):
+    scheduler = ScrapeScheduler(min_host_delay=0.0, robots_ttl=0.0, timeout=5.0)
+    monkeypatch.setattr(summarizer_service_helpers, "scrape_scheduler", scheduler)
+    site = FakeNewsSite().start()
+    yield site
+    site.stop()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    server = FakeAzureOpenAI(retry_after=0.01, seed=0).start()
+    monkeypatch.setattr(settings, "AZURE_OPENAI_ENDPOINT", server.endpoint)
+    monkeypatch.setattr(settings, "AZURE_OPENAI_API_KEY", "test-key")
+    yield server
+    server.stop()
+
+
+def test_scrape_article_extracts_title_and_text(news_site):
+    article = scrape_article(news_site.article_url(7))
+
+    assert article["title"].endswith("(7)")
+    assert len(article["text"].split()) > 100
+
+
+def test_scrape_article_missing_page(news_site):
+    with pytest.raises(Exception, match="Failed to fetch article"):
+        scrape_article(f"{news_site.base_url}/missing.html")
+
+
+def test_pages_are_parsed_in_lower_priority_processes():
+    pool = parse_pool()
+
+    assert pool.submit(os.getpid).result() != os.getpid()
+    assert pool.submit(os.nice, 0).result() == min(
+        19, os.nice(0) + settings.INGEST_NICENESS
+    )
+
+
+def test_generate_summary_classify_article(news_site, fake_llm):
+    text = scrape_article(news_site.article_url(2))["text"]
+
+    result = generate_summary_classify_article(text)
+
+    assert result["summary"].split()[:10] == text.split()[:10]
+    assert result["category"] in {
+        "Sports",
+        "Business",
+        "Technology",
+        "Entertainment",
+        "Health",
+        "General",
+    }
+    assert fake_llm.requests == 1
+
+
+def test_generate_summary_retries_rate_limited_calls(fake_llm):
+    fake_llm.error_rate = 0.5
+
+    for _ in range(5):
+        result = generate_summary_classify_article("The team won the final.")
+        assert result["category"] == "Sports"
+
+    assert fake_llm.throttled > 0
+    assert fake_llm.requests == 5 + fake_llm.throttled
+
+
+def test_generate_summary_classify_batch(fake_llm):
+    contents = [
+        "The team won the championship final.",
+        "The bank raised interest rates again.",
+        "Researchers built a cheaper grid battery.",
+    ]
+
+    results = generate_summary_classify_batch(contents)
+
+    assert [r["summary"] for r in results] == contents
+    assert [r["category"] for r in results] == ["Sports", "Business", "Technology"]
+    assert fake_llm.requests == 1
+
+
+def test_generate_summary_classify_batch_rejects_mismatched_reply(
+    fake_llm, monkeypatch
+):
+    # The model drops the second article
+    reply = json.dumps([{"id": 1, "summary": "First.", "category": "General"}])
+    monkeypatch.setattr(fake_azure_openai, "fake_summary", lambda *args: reply)
+
+    with pytest.raises(ValueError, match="Expected 2 results, got 1"):
+        generate_summary_classify_batch(["first article", "second article"])
+
+
+def test_generate_story_summary(fake_llm):
+    summaries = [
+        "The team won the championship final.",
+        "Fans celebrated the team's title in the streets.",
+    ]
+
+    story = generate_story_summary(summaries)
+
+    assert story["title"] == "The team won the championship final."
+    assert story["summary"].startswith(summaries[0])
+    assert story["category"] == "Sports"
+    assert fake_llm.requests == 1
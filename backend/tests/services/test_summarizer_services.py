@@ -1,12 +1,26 @@
+import json
+import threading
+from datetime import timedelta
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from unittest.mock import patch, MagicMock
-from backend.app.services.summarizer_services import SummarizerService
+from backend.app.services.summarizer_article_cache import (
+    ArticleCache,
+    ArticleFragments,
+)
+from backend.app.services.summarizer_services import (
+    SummarizerService,
+    lock_article_changes,
+    mark_articles_updated,
+)
 from backend.app.db.summarizer_db import Base
-from backend.app.models.summarizer_models import TestArticle
+from backend.app.models.summarizer_models import TestArticle, TestArticleTombstone
 from backend.app.schemas.summarizer_schemas import ArticleCreate, ArticleSummaryResponse
-from backend.app.exceptions.summarizer_exceptions import ArticleNotFoundException
+from backend.app.exceptions.summarizer_exceptions import (
+    ArticleNotFoundException,
+    ArticlesNotFoundForCategoryException,
+)
 from backend.app.core.summarizer_config import settings
 
 DATABASE_URL = settings.TEST_DATABASE_URL  # Updated access pattern
@@ -28,12 +42,16 @@ def test_db():
 
 @pytest.fixture(scope="function")
 def summarizer_service(test_db):
-    return SummarizerService(test_db, model=TestArticle)
+    return SummarizerService(
+        test_db, model=TestArticle, tombstone_model=TestArticleTombstone
+    )
 
 
 @pytest.fixture(autouse=True)
 def cleanup_database(test_db):
+    TestArticleTombstone.__table__.create(bind=engine, checkfirst=True)
     yield
+    test_db.query(TestArticleTombstone).delete()
     test_db.query(TestArticle).delete()
     test_db.commit()
 
@@ -53,7 +71,7 @@ def mock_scrape_article():
 @pytest.fixture
 def mock_generate_summary():
     with patch(
-        "backend.app.services.summarizer_services.generate_summary_classify_article"
+        "backend.app.services.summarizer_services.llm_batcher.summarize"
     ) as mock:  # Changed path
         mock.return_value = {
             "summary": "This is a test summary",
@@ -107,6 +125,20 @@ def test_create_article_success(
     assert new_article.content == "This is a test article content."
 
 
+def test_create_article_holds_no_connection_while_summarizing(
+    summarizer_service, mock_scrape_article, mock_generate_summary, test_db
+):
+    in_transaction = []
+    mock_scrape_article.side_effect = lambda url: (
+        in_transaction.append(test_db.in_transaction())
+        or {"title": "Test Article", "text": "This is a test article content."}
+    )
+
+    summarizer_service.create_article(ArticleCreate(url="https://example.com/a"))
+
+    assert in_transaction == [False]
+
+
 def test_create_article_duplicate_url(
     summarizer_service, mock_scrape_article, mock_generate_summary, test_db
 ):
@@ -169,6 +201,26 @@ def test_get_articles_success(
     assert response[0].category == "technology"
 
 
+def test_get_articles_within_ingestion_window(
+    summarizer_service, mock_scrape_article, mock_generate_summary, test_db
+):
+    test_db.query(TestArticle).delete()
+    test_db.commit()
+    article = summarizer_service.create_article(
+        ArticleCreate(url="https://example.com/test-article")
+    )
+    created = test_db.get(TestArticle, article.id).created_at
+
+    assert len(summarizer_service.get_articles(created_after=created)) == 1
+    assert summarizer_service.get_articles(created_before=created) == {
+        "message": "Articles not found"
+    }
+    with pytest.raises(ArticlesNotFoundForCategoryException):
+        summarizer_service.get_article_fragments(
+            "technology", created_after=created + timedelta(seconds=1)
+        )
+
+
 def test_delete_article_success(
     summarizer_service, mock_scrape_article, mock_generate_summary, test_db
 ):
@@ -177,3 +229,159 @@ def test_delete_article_success(
 
     summarizer_service.delete_article(article.id)
     assert test_db.query(TestArticle).filter_by(id=article.id).first() is None
+
+
+def test_get_article_detail_is_cached_until_deleted(
+    mock_scrape_article, mock_generate_summary, test_db
+):
+    cache = ArticleCache(max_size=10, ttl=60)
+    service = SummarizerService(test_db, model=TestArticle, cache=cache)
+    article = service.create_article(
+        ArticleCreate(url="https://example.com/test-article")
+    )
+
+    entry = service.get_article_detail(article.id)
+    assert entry.article.content == "This is a test article content."
+    assert service.get_article_detail(article.id) is entry
+
+    service.delete_article(article.id)
+    assert len(cache) == 0
+    with pytest.raises(ArticleNotFoundException):
+        service.get_article_detail(article.id)
+
+
+def test_get_article_fragments(mock_scrape_article, mock_generate_summary, test_db):
+    service = SummarizerService(
+        test_db, model=TestArticle, fragments=ArticleFragments(max_size=10)
+    )
+    article = service.create_article(
+        ArticleCreate(url="https://example.com/test-article")
+    )
+
+    fragments = service.get_article_fragments("Technology")
+
+    assert [json.loads(fragment) for fragment in fragments] == [
+        {
+            "id": article.id,
+            "title": "Test Article",
+            "url": "https://example.com/test-article",
+            "summary": "This is a test summary",
+            "category": "technology",
+        }
+    ]
+    assert service.get_article_fragments() == fragments
+    with pytest.raises(ArticlesNotFoundForCategoryException):
+        service.get_article_fragments("sports")
+
+
+def insert_article(db, name):
+    lock_article_changes(db)
+    article = TestArticle(
+        url=f"https://example.com/{name}",
+        title=name,
+        content=name,
+        summary=name,
+        category="general",
+    )
+    db.add(article)
+    db.commit()
+    return article.id
+
+
+def sync(service, replica, cursor, limit=2):
+    """Apply changes after cursor to replica until caught up."""
+    while True:
+        page = service.get_article_changes(cursor, limit)
+        for change in page.changes:
+            if change.op == "delete":
+                replica.pop(change.id, None)
+            else:
+                replica[change.id] = change.article.summary
+        cursor = page.cursor
+        if not page.has_more:
+            return cursor
+
+
+def test_article_changes_keep_a_copy_current(summarizer_service, test_db):
+    ids = [insert_article(test_db, f"article-{i}") for i in range(5)]
+    replica = {}
+    cursor = sync(summarizer_service, replica, 0)
+    assert replica == {article_id: f"article-{i}" for i, article_id in enumerate(ids)}
+
+    added = insert_article(test_db, "added")
+    lock_article_changes(test_db)
+    test_db.query(TestArticle).filter(TestArticle.id == ids[1]).update(
+        {"summary": "updated"}
+    )
+    mark_articles_updated(test_db, TestArticle, [ids[1]])
+    test_db.commit()
+    summarizer_service.delete_article(ids[0])
+
+    page = summarizer_service.get_article_changes(cursor, 10)
+    assert [(c.op, c.id) for c in page.changes] == [
+        ("insert", added),
+        ("update", ids[1]),
+        ("delete", ids[0]),
+    ]
+    assert page.changes[2].article is None
+    cursor = sync(summarizer_service, replica, cursor)
+    assert replica == {
+        ids[1]: "updated",
+        ids[2]: "article-2",
+        ids[3]: "article-3",
+        ids[4]: "article-4",
+        added: "added",
+    }
+    assert summarizer_service.get_article_changes(cursor).changes == []
+
+
+def test_article_change_cursor_is_stable_under_concurrent_inserts(
+    summarizer_service, test_db
+):
+    cursor = sync(summarizer_service, {}, 0)
+    flushed = threading.Event()
+    release = threading.Event()
+    ids = {}
+
+    def slow_writer():
+        db = TestingSessionLocal()
+        lock_article_changes(db)
+        article = TestArticle(
+            url="https://example.com/slow",
+            title="slow",
+            content="slow",
+            summary="slow",
+            category="general",
+        )
+        db.add(article)
+        db.flush()  # change_seq drawn, not yet committed
+        flushed.set()
+        release.wait(5)
+        db.commit()
+        ids["slow"] = article.id
+        db.close()
+
+    def fast_writer():
+        db = TestingSessionLocal()
+        ids["fast"] = insert_article(db, "fast")
+        db.close()
+
+    slow = threading.Thread(target=slow_writer)
+    slow.start()
+    flushed.wait(5)
+    fast = threading.Thread(target=fast_writer)
+    fast.start()
+
+    # Neither change is visible yet: the fast writer waits for the change lock
+    # instead of committing a later change_seq first
+    fast.join(0.3)
+    assert fast.is_alive()
+    page = summarizer_service.get_article_changes(cursor)
+    assert page.changes == [] and page.cursor == cursor
+
+    release.set()
+    slow.join()
+    fast.join()
+    replica = {}
+    sync(summarizer_service, replica, cursor, limit=1)
+    assert set(replica) == {ids["slow"], ids["fast"]}
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.exceptions.summarizer_exceptions import ArticleNotFoundException
+from backend.app.models.summarizer_models import TestArticle
+from backend.app.services.summarizer_embeddings import (
+    AzureOpenAIEmbedder,
+    HashingEmbedder,
+)
+from backend.app.services.summarizer_similar_services import SimilarArticles
+from backend.benchmarks.fake_azure_openai import FakeAzureOpenAI
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+STORIES = {
+    "rates": "The central bank raised interest rates to fight inflation.",
+    "rates again": "Inflation pushed the central bank to raise interest rates again.",
+    "final": "The home team won the championship final in extra time.",
+    "battery": "Researchers built a cheaper battery for the power grid.",
+}
+
+
+@pytest.fixture
+def db():
+    session = TestingSessionLocal()
+    session.query(TestArticle).delete()
+    session.commit()
+    yield session
+    session.query(TestArticle).delete()
+    session.commit()
+    session.close()
+
+
+def make_similar(**kwargs):
+    return SimilarArticles(
+        session_factory=TestingSessionLocal,
+        article_model=TestArticle,
+        embedder=HashingEmbedder(64),
+        sync_interval=0.0,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def similar():
+    return make_similar()
+
+
+def add_article(db, similar, title, embed=True):
+    columns = similar.embedding_columns(title, STORIES[title]) if embed else {}
+    article = TestArticle(
+        url=f"https://example.com/{title.replace(' ', '-')}",
+        title=title,
+        content=STORIES[title],
+        summary=STORIES[title],
+        category="general",
+        **columns,
+    )
+    db.add(article)
+    db.commit()
+    if columns:
+        similar.article_added(article.id, columns["embedding"])
+    return article.id
+
+
+def titles(results):
+    return [article.title for article, _ in results]
+
+
+def test_hashing_embedder_puts_related_texts_close():
+    vectors = HashingEmbedder(256).embed(list(STORIES.values()))
+
+    assert vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    similarity = vectors @ vectors.T
+    assert similarity[0, 1] > 0.3
+    assert similarity[0, 1] > max(similarity[0, 2], similarity[0, 3])
+
+
+def test_similar_articles(db, similar):
+    ids = {title: add_article(db, similar, title) for title in STORIES}
+
+    results = similar.similar(db, ids["rates"], limit=2)
+
+    assert titles(results)[0] == "rates again"
+    assert len(results) == 2
+    assert results[0][1] > results[1][1]
+    with pytest.raises(ArticleNotFoundException):
+        similar.similar(db, max(ids.values()) + 1)
+
+
+def test_index_catches_up_with_other_workers(db, similar):
+    ids = {"rates": add_article(db, similar, "rates")}
+    similar.similar(db, ids["rates"])
+
+    # Added through another worker's index
+    other = make_similar()
+    ids["rates again"] = add_article(db, other, "rates again")
+    ids["final"] = add_article(db, other, "final")
+
+    assert titles(similar.similar(db, ids["rates"])) == ["rates again", "final"]
+
+    db.query(TestArticle).filter(TestArticle.id == ids["rates again"]).delete()
+    db.commit()
+    assert titles(similar.similar(db, ids["rates"])) == ["final"]
+
+
+def test_articles_without_vectors_are_embedded(db, similar):
+    rates = add_article(db, similar, "rates", embed=False)
+    add_article(db, similar, "final", embed=False)
+    add_article(db, similar, "rates again")
+
+    # The queried article is embedded on demand
+    assert titles(similar.similar(db, rates)) == ["rates again"]
+    assert similar.backfill(db, batch_size=1) == 1
+    assert titles(similar.similar(db, rates)) == ["rates again", "final"]
+    assert (
+        db.query(TestArticle).filter(TestArticle.embedding_version.is_(None)).count()
+        == 0
+    )
+
+
+def test_index_loads_vectors_stored_for_older_articles(db, tmp_path):
+    first = make_similar(index_dir=str(tmp_path))
+    older = add_article(db, first, "rates again", embed=False)
+    rates = add_article(db, first, "rates")
+    add_article(db, first, "final")
+    assert titles(first.similar(db, rates)) == ["final"]
+    first.stop()
+
+    # Another worker embeds the older article after this one has synced
+    second = make_similar(index_dir=str(tmp_path))
+    assert titles(second.similar(db, rates)) == ["final"]
+    assert make_similar().backfill(db) == 1
+
+    assert titles(first.similar(db, rates))[0] == "rates again"
+    assert titles(second.similar(db, rates))[0] == "rates again"
+    assert older in second._index
+
+
+def test_workers_start_from_snapshot(db, tmp_path):
+    first = make_similar(index_dir=str(tmp_path), snapshot_every=2)
+    ids = {title: add_article(db, first, title) for title in STORIES}
+    first.similar(db, ids["rates"])
+    first.stop()
+
+    second = make_similar(index_dir=str(tmp_path))
+    index = second._open()
+    assert len(index) == len(STORIES)
+    assert titles(second.similar(db, ids["rates"], limit=1)) == ["rates again"]
+
+    # Snapshots of another embedder are ignored
+    other = make_similar(index_dir=str(tmp_path))
+    other.embedder.version = "hashing-v2:64"
+    assert len(other._open()) == 0
+
+
+def test_azure_embedder(monkeypatch):
+    server = FakeAzureOpenAI().start()
+    monkeypatch.setattr(settings, "AZURE_OPENAI_ENDPOINT", server.endpoint)
+    monkeypatch.setattr(settings, "AZURE_OPENAI_API_KEY", "test-key")
+    try:
+        vectors = AzureOpenAIEmbedder(32).embed(list(STORIES.values()))
+    finally:
+        server.stop()
+
+    assert vectors.shape == (4, 32)
+    assert server.requests == 1
+    similarity = vectors @ vectors.T
+    assert similarity[0, 1] > max(similarity[0, 2], similarity[0, 3])
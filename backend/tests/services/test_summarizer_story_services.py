@@ -0,0 +1,207 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.exceptions.summarizer_exceptions import StoryNotFoundException
+from backend.app.models.summarizer_models import TestArticle, TestStory
+from backend.app.services.summarizer_embeddings import HashingEmbedder
+from backend.app.services.summarizer_similar_services import SimilarArticles
+from backend.app.services.summarizer_story_services import (
+    StoryClusterer,
+    StoryService,
+)
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+RATES = [
+    "The central bank raised interest rates to fight inflation.",
+    "Inflation pushed the central bank to raise interest rates again.",
+    "Central bank raises interest rates as inflation stays high.",
+    "Interest rates go up again at the central bank over inflation.",
+]
+FINAL = "The home team won the championship final in extra time."
+
+
+def clear(db):
+    db.query(TestArticle).delete()
+    db.query(TestStory).delete()
+    db.commit()
+
+
+@pytest.fixture
+def db():
+    TestStory.__table__.create(bind=engine, checkfirst=True)
+    session = TestingSessionLocal()
+    clear(session)
+    yield session
+    clear(session)
+    session.close()
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def clusterer(calls):
+    def summarize(summaries):
+        calls.append(summaries)
+        return {
+            "title": f"Story of {len(summaries)}",
+            "summary": " / ".join(summaries),
+            "category": "Business",
+        }
+
+    clusterer = StoryClusterer(
+        session_factory=TestingSessionLocal,
+        article_model=TestArticle,
+        story_model=TestStory,
+        similar=SimilarArticles(
+            article_model=TestArticle, embedder=HashingEmbedder(256)
+        ),
+        summarize=summarize,
+    )
+    yield clusterer
+    clusterer.stop()
+
+
+def add_article(db, text, category="business"):
+    article = TestArticle(
+        url=f"https://example.com/{abs(hash(text))}",
+        title=text[:30],
+        content=text,
+        summary=text,
+        category=category,
+    )
+    db.add(article)
+    db.commit()
+    return article.id
+
+
+def cluster(clusterer, db, *texts, category="business"):
+    ids = [add_article(db, text, category) for text in texts]
+    for story_id in clusterer.cluster_articles(db, ids):
+        clusterer.summarize_story(db, story_id)
+    return ids
+
+
+def test_coverage_of_one_event_forms_one_story(db, clusterer, calls):
+    cluster(clusterer, db, RATES[0], FINAL, category="general")
+    cluster(clusterer, db, RATES[1])
+
+    stories = StoryService(db, clusterer).get_stories()
+
+    assert [s.article_count for s in stories] == [2, 1]
+    assert stories[0].title == "Story of 2"
+    assert stories[0].summary == f"{RATES[0]} / {RATES[1]}"
+    assert stories[0].category == "business"
+    # A single-article story shows the article's own summary, without a call
+    assert stories[1].summary == FINAL
+    assert len(calls) == 1
+
+
+def test_story_summary_is_regenerated_as_the_story_grows(db, clusterer, calls):
+    for text in RATES:
+        cluster(clusterer, db, text)
+
+    # Summaries at 2 and 3 articles; the 4th is less than 50% growth
+    assert [len(summaries) for summaries in calls] == [2, 3]
+    story = db.query(TestStory).one()
+    assert story.article_count == 4
+    assert story.summarized_count == 3
+
+
+def test_closed_stories_are_not_joined(db, clusterer):
+    cluster(clusterer, db, RATES[0])
+    db.query(TestStory).update(
+        {"updated_at": datetime.now(timezone.utc) - timedelta(days=3)}
+    )
+    db.commit()
+
+    cluster(clusterer, db, RATES[1])
+
+    assert db.query(TestStory).count() == 2
+
+
+def test_story_detail_and_filters(db, clusterer):
+    ids = cluster(clusterer, db, RATES[0], RATES[1])
+    cluster(clusterer, db, FINAL, category="sports")
+    service = StoryService(db, clusterer)
+
+    sports = service.get_stories(category="Sports")
+    assert [s.summary for s in sports] == [FINAL]
+    assert len(service.get_stories(offset=1, limit=5)) == 1
+
+    rates = service.get_stories(category="business")[0]
+    detail = service.get_story(rates.id)
+    assert [a.id for a in detail.articles] == ids
+    with pytest.raises(StoryNotFoundException):
+        service.get_story(rates.id + 100)
+
+
+def test_deleted_articles_leave_their_story(db, clusterer):
+    first, second = cluster(clusterer, db, RATES[0], RATES[1])
+    story_id = db.get(TestArticle, first).story_id
+
+    for article_id in (first, second):
+        clusterer.article_deleted(db, story_id)
+        db.query(TestArticle).filter(TestArticle.id == article_id).delete()
+        db.commit()
+        db.expire_all()
+
+    assert db.get(TestStory, story_id) is None
+
+
+def test_worker_clusters_new_articles(db, clusterer, calls):
+    for text in RATES[:2]:
+        clusterer.article_added(add_article(db, text))
+
+    deadline = time.time() + 5
+    while time.time() < deadline and not calls:
+        time.sleep(0.05)
+    clusterer.stop()
+
+    db.expire_all()
+    story = db.query(TestStory).one()
+    assert story.article_count == 2
+    assert story.summarized_count == 2
+    assert {a.story_id for a in db.query(TestArticle)} == {story.id}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline and not condition():
+        time.sleep(0.05)
+
+
+def test_worker_clusters_articles_left_without_a_story(db, clusterer):
+    # Queued before a restart, or bulk-imported without being queued
+    first = add_article(db, RATES[0])
+    old = add_article(db, RATES[1])
+    db.query(TestArticle).filter(TestArticle.id == old).update(
+        {"created_at": datetime.now(timezone.utc) - timedelta(days=30)}
+    )
+    db.commit()
+
+    def story_of(article_id):
+        db.expire_all()
+        return db.get(TestArticle, article_id).story_id
+
+    clusterer.rescan_interval = 0.1
+    clusterer.start()
+    wait_for(lambda: story_of(first) is not None)
+    later = add_article(db, RATES[2])
+    wait_for(lambda: story_of(later) is not None)
+    clusterer.stop()
+
+    story = db.query(TestStory).one()
+    assert story.article_count == 2
+    assert story_of(first) == story_of(later) == story.id
+    # Older than the story window
+    assert story_of(old) is None
@@ -0,0 +1,238 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.summarizer_config import settings
+from backend.app.exceptions.summarizer_exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+)
+from backend.app.models.summarizer_models import (
+    TestArticle,
+    TestUserFeed,
+    TestUserProfile,
+)
+from backend.app.schemas.summarizer_schemas import (
+    UserProfileCreate,
+    UserProfileUpdate,
+)
+from backend.app.services.summarizer_user_services import (
+    FEED_RANK_LOCK_KEY,
+    FeedRanker,
+    UserService,
+    normalize_categories,
+    normalize_terms,
+)
+
+engine = create_engine(settings.TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def clear(db):
+    db.query(TestUserFeed).delete()
+    db.query(TestUserProfile).delete()
+    db.query(TestArticle).delete()
+    db.commit()
+
+
+@pytest.fixture
+def db():
+    TestUserProfile.__table__.create(bind=engine, checkfirst=True)
+    TestUserFeed.__table__.create(bind=engine, checkfirst=True)
+    session = TestingSessionLocal()
+    clear(session)
+    yield session
+    clear(session)
+    session.close()
+
+
+@pytest.fixture
+def ranker():
+    ranker = FeedRanker(
+        session_factory=TestingSessionLocal,
+        article_model=TestArticle,
+        profile_model=TestUserProfile,
+        feed_model=TestUserFeed,
+        max_items=5,
+    )
+    yield ranker
+    ranker.stop()
+
+
+@pytest.fixture
+def service(db, ranker):
+    return UserService(db, ranker=ranker)
+
+
+def add_article(db, title, category="general", summary="Nothing to see."):
+    article = TestArticle(
+        url=f"https://example.com/{title.replace(' ', '-')}",
+        title=title,
+        content="content",
+        summary=summary,
+        category=category,
+    )
+    db.add(article)
+    db.commit()
+    return article.id
+
+
+def feed_titles(service, user_id, offset=0, limit=20):
+    return [a.title for a in service.get_feed(user_id, offset, limit)]
+
+
+def test_normalize_terms():
+    assert normalize_terms(["Sports", " electric  Cars", "sports"]) == [
+        "sports",
+        "electric",
+        "cars",
+    ]
+
+
+def test_normalize_categories_keeps_them_whole():
+    assert normalize_categories(["Real Estate", " real  estate ", "Sports", ""]) == [
+        "real estate",
+        "sports",
+    ]
+
+
+def test_multi_word_categories_match(db, service, ranker):
+    add_article(db, "Prices cool", category="real estate")
+    user = service.create_user(
+        UserProfileCreate(name="ann", categories=["Real Estate"])
+    )
+    article_id = add_article(db, "Rents climb", category="Real Estate")
+
+    assert ranker.rank_articles(db, [article_id]) == 1
+
+    assert user.categories == ["real estate"]
+    assert feed_titles(service, user.id) == ["Rents climb", "Prices cool"]
+
+
+def test_new_profile_feed_is_built_from_recent_articles(db, service):
+    add_article(db, "Cup final", category="sports")
+    add_article(db, "Rates rise", category="business")
+    add_article(db, "Battery prices", category="technology", summary="Cheaper cells")
+
+    user = service.create_user(
+        UserProfileCreate(name="ann", categories=["Sports"], keywords=["Battery"])
+    )
+
+    assert user.categories == ["sports"]
+    assert user.keywords == ["battery"]
+    assert set(feed_titles(service, user.id)) == {"Cup final", "Battery prices"}
+
+
+def test_new_articles_are_ranked_into_matching_feeds(db, service, ranker):
+    sports = service.create_user(UserProfileCreate(name="ann", categories=["sports"]))
+    tech = service.create_user(
+        UserProfileCreate(name="bob", categories=["technology"], keywords=["final"])
+    )
+    nobody = service.create_user(UserProfileCreate(name="cy", keywords=["opera"]))
+    ids = [
+        add_article(db, "Semi final", category="sports"),
+        add_article(db, "Chip launch", category="technology"),
+        add_article(db, "Cup final", category="sports"),
+        add_article(db, "Final chip design", category="technology"),
+    ]
+
+    assert ranker.rank_articles(db, ids) == 2
+
+    # Newest first among equally relevant articles
+    assert feed_titles(service, sports.id) == ["Cup final", "Semi final"]
+    # Category plus keyword beats category alone, which beats keyword alone
+    assert feed_titles(service, tech.id) == [
+        "Final chip design",
+        "Chip launch",
+        "Cup final",
+        "Semi final",
+    ]
+    assert feed_titles(service, nobody.id) == []
+
+
+def test_feed_pages_and_cap(db, service, ranker):
+    user = service.create_user(UserProfileCreate(name="ann", categories=["sports"]))
+    ids = [add_article(db, f"Match {i}", category="sports") for i in range(7)]
+    for article_id in ids:
+        ranker.rank_articles(db, [article_id])
+
+    # Only max_items (5) are kept, best first
+    assert feed_titles(service, user.id) == [f"Match {i}" for i in range(6, 1, -1)]
+    assert feed_titles(service, user.id, offset=1, limit=2) == ["Match 5", "Match 4"]
+    assert feed_titles(service, user.id, offset=5) == []
+
+
+def test_deleted_articles_are_skipped(db, service, ranker):
+    user = service.create_user(UserProfileCreate(name="ann", categories=["sports"]))
+    ids = [add_article(db, f"Match {i}", category="sports") for i in range(3)]
+    ranker.rank_articles(db, ids)
+
+    db.query(TestArticle).filter(TestArticle.id == ids[1]).delete()
+    db.commit()
+
+    assert feed_titles(service, user.id) == ["Match 2", "Match 0"]
+
+
+def test_update_rebuilds_feed(db, service):
+    add_article(db, "Cup final", category="sports")
+    add_article(db, "Rates rise", category="business")
+    user = service.create_user(UserProfileCreate(name="ann", categories=["sports"]))
+
+    service.update_user(user.id, UserProfileUpdate(categories=["business"]))
+
+    assert feed_titles(service, user.id) == ["Rates rise"]
+    assert service.get_user(user.id).keywords == []
+
+
+def test_rebuild_waits_for_feed_merges(db, service, ranker):
+    user = service.create_user(UserProfileCreate(name="ann", categories=["sports"]))
+    merging = TestingSessionLocal()
+    merging.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": FEED_RANK_LOCK_KEY}
+    )
+    rebuilding = TestingSessionLocal()
+    rebuild = threading.Thread(
+        target=UserService(rebuilding, ranker).update_user,
+        args=(user.id, UserProfileUpdate(keywords=["final"])),
+    )
+    rebuild.start()
+
+    rebuild.join(0.3)
+    assert rebuild.is_alive()
+
+    merging.commit()
+    rebuild.join(10)
+    assert not rebuild.is_alive()
+    merging.close()
+    rebuilding.close()
+
+
+def test_worker_ranks_queued_articles(db, service, ranker):
+    user = service.create_user(UserProfileCreate(name="ann", keywords=["final"]))
+    ids = [add_article(db, f"Final {i}") for i in range(3)]
+
+    for article_id in ids:
+        ranker.article_added(article_id)
+    deadline = time.monotonic() + 10
+    while len(feed_titles(service, user.id)) < 3 and time.monotonic() < deadline:
+        db.expire_all()
+        time.sleep(0.02)
+
+    assert feed_titles(service, user.id) == ["Final 2", "Final 1", "Final 0"]
+
+
+def test_user_errors(db, service):
+    user = service.create_user(UserProfileCreate(name="ann"))
+
+    with pytest.raises(UserAlreadyExistsException):
+        service.create_user(UserProfileCreate(name="ann"))
+    with pytest.raises(UserNotFoundException):
+        service.get_feed(user.id + 1)
+
+    service.delete_user(user.id)
+    with pytest.raises(UserNotFoundException):
+        service.get_user(user.id)
+    assert db.query(TestUserFeed).count() == 0
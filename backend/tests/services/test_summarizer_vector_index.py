@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+import pytest
+
+from backend.app.services.summarizer_vector_index import CURRENT, VectorIndex
+
+DIM = 16
+
+
+def clustered(count, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, DIM))
+    labels = rng.integers(0, clusters, count)
+    return centers[labels] + 0.3 * rng.normal(size=(count, DIM))
+
+
+def test_exact_search_orders_by_cosine_similarity():
+    index = VectorIndex(DIM)
+    vectors = np.eye(DIM)[:3]
+    vectors[1] += 0.5 * vectors[0]
+    index.add([10, 11, 12], vectors)
+
+    hits = index.search(np.eye(DIM)[0], 3)
+
+    assert [item_id for item_id, _ in hits] == [10, 11, 12]
+    assert hits[0][1] == pytest.approx(1.0)
+    assert [i for i, _ in index.search(np.eye(DIM)[0], 3, exclude=10)] == [11, 12]
+
+
+def test_remove_and_replace():
+    index = VectorIndex(DIM)
+    index.add([1, 2], np.eye(DIM)[:2])
+
+    index.add([1], np.eye(DIM)[2])
+    assert index.remove(2)
+    assert not index.remove(2)
+
+    assert len(index) == 1
+    assert index.search(np.eye(DIM)[2], 5) == [(1, pytest.approx(1.0))]
+    assert index.search(np.eye(DIM)[0], 5)[0][1] == pytest.approx(0.0)
+
+
+def test_trained_index_finds_nearest_neighbors():
+    vectors = clustered(3000)
+    index = VectorIndex(DIM, probes=4, min_train=1000)
+    for start in range(0, len(vectors), 500):
+        index.add(range(start, start + 500), vectors[start : start + 500])
+    assert index.trained
+
+    queries = clustered(50, seed=1)
+    recall = np.mean(
+        [
+            len(
+                {i for i, _ in index.search(q, 10)}
+                & {i for i, _ in index.search(q, 10, exact=True)}
+            )
+            / 10
+            for q in queries
+        ]
+    )
+
+    assert recall >= 0.9
+
+
+def test_snapshot_round_trip(tmp_path):
+    vectors = clustered(1500)
+    index = VectorIndex(DIM, min_train=1000)
+    index.add(range(1, 1501), vectors)
+    index.remove(5)
+    index.save(str(tmp_path), {"version": "test"})
+
+    loaded = VectorIndex(DIM, min_train=1000)
+    meta = loaded.load(str(tmp_path))
+
+    assert meta["version"] == "test"
+    assert len(loaded) == 1499 and loaded.trained and loaded.max_id == 1500
+    assert isinstance(loaded._base, np.memmap)
+    assert loaded.search(vectors[0], 5) == index.search(vectors[0], 5)
+
+    # Vectors added after loading are searchable next to the mapped ones
+    loaded.add([2000], vectors[0])
+    assert {i for i, _ in loaded.search(vectors[0], 2)} == {1, 2000}
+    loaded.save(str(tmp_path))
+    loaded.save(str(tmp_path))
+
+    generations = [n for n in os.listdir(tmp_path) if n != CURRENT]
+    assert len(generations) == 2
+    assert 2000 in loaded
+
+
+def test_load_without_snapshot(tmp_path):
+    assert VectorIndex(DIM).load(str(tmp_path)) is None
+    VectorIndex(8).save(str(tmp_path))
+    with pytest.raises(ValueError, match="8 dimensions"):
+        VectorIndex(DIM).load(str(tmp_path))
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time budget for backend.app.main; override on slow machines
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1500))
+
+# Heavy modules only needed once an article is scraped or summarized
+LAZY_MODULES = {"newspaper", "numpy", "openai"}
+
+
+def import_app(cwd: Path):
+    """Import the app in a fresh interpreter with the database unreachable."""
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join([str(REPO_ROOT), str(REPO_ROOT / "backend")]),
+        DATABASE_URL="postgresql://summarizer@127.0.0.1:1/unreachable",
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.app.main"],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map module name to cumulative import time in microseconds."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.fixture(scope="module")
+def import_runs(tmp_path_factory):
+    cwd = tmp_path_factory.mktemp("cwd")
+    runs = [import_app(cwd) for _ in range(3)]
+    for run in runs:
+        assert run.returncode == 0, run.stderr
+    return cwd, runs
+
+
+def test_import_has_no_side_effects(import_runs):
+    cwd, runs = import_runs
+
+    # No prints, no log directory or file, and no database connection needed
+    assert all(run.stdout == "" for run in runs)
+    assert list(cwd.iterdir()) == []
+
+
+def test_heavy_modules_are_imported_lazily(import_runs):
+    _, runs = import_runs
+    modules = parse_importtime(runs[0].stderr)
+
+    assert "backend.app.main" in modules
+    assert not LAZY_MODULES & {name.split(".")[0] for name in modules}
+
+
+def test_import_time_budget(import_runs):
+    _, runs = import_runs
+    best_ms = min(parse_importtime(run.stderr)["backend.app.main"] for run in runs)
+    best_ms /= 1000
+
+    assert best_ms < IMPORT_TIME_BUDGET_MS, (
+        f"importing backend.app.main took {best_ms:.0f} ms, "
+        f"budget is {IMPORT_TIME_BUDGET_MS:.0f} ms"
+    )
@@ -42,6 +42,27 @@ export const getArticles = async () => {
   }
 };
 
+// Changes after `since` (0 for everything): { changes, cursor, has_more }.
+// Apply `changes` in order and pass `cursor` next time to stay current.
+export const getArticleChanges = async (since = 0, limit = 500) => {
+  try {
+    const response = await api.get('/articles/changes', { params: { since, limit } });
+    return response.data;
+  } catch (error) {
+    throw new Error(handleApiError(error));
+  }
+};
+
+export const getArticle = async (id, { includeContent = false } = {}) => {
+  try {
+    const params = includeContent ? { include: 'content' } : {};
+    const response = await api.get(`/articles/${id}`, { params });
+    return response.data;
+  } catch (error) {
+    throw new Error(handleApiError(error));
+  }
+};
+
 export const getArticlesByCategory = async (category) => {
   try {
     const response = await api.get(`/articles/category/${category.toLowerCase()}`);
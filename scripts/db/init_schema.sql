@@ -24,14 +24,101 @@ END $$;
 -- Create the summary schema if it does not exist
 CREATE SCHEMA IF NOT EXISTS summary;
 
+-- Orders article inserts, updates and deletes for delta sync
+CREATE SEQUENCE IF NOT EXISTS summary.article_change_seq;
+
 -- Create the articles table in the summary schema if it does not exist
+-- Partitioned by ingestion month; monthly partitions are created ahead of time
+-- and dropped after the retention period by backend/app/db/summarizer_partitions.py
 CREATE TABLE IF NOT EXISTS summary.articles (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     title VARCHAR(255),
     url VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     summary TEXT NOT NULL,
-    category VARCHAR(255) NOT NULL
+    category VARCHAR(255) NOT NULL,
+    summary_version VARCHAR(255),
+    embedding BYTEA,
+    embedding_version VARCHAR(255),
+    story_id INTEGER,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    change_seq BIGINT NOT NULL DEFAULT nextval('summary.article_change_seq'),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+-- Catches rows of months whose partition is not created yet
+CREATE TABLE IF NOT EXISTS summary.articles_default PARTITION OF summary.articles DEFAULT;
+CREATE INDEX IF NOT EXISTS ix_summary_articles_category_created_at ON summary.articles (category, created_at);
+CREATE INDEX IF NOT EXISTS ix_summary_articles_change_seq ON summary.articles (change_seq);
+
+-- Deleted articles, kept so delta sync can report deletions
+CREATE TABLE IF NOT EXISTS summary.article_tombstones (
+    article_id INTEGER PRIMARY KEY,
+    change_seq BIGINT NOT NULL DEFAULT nextval('summary.article_change_seq'),
+    deleted_at TIMESTAMPTZ DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_summary_article_tombstones_change_seq ON summary.article_tombstones (change_seq);
+
+-- Create the stories table in the summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS summary.stories (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255),
+    summary TEXT NOT NULL,
+    category VARCHAR(255) NOT NULL,
+    article_count INTEGER NOT NULL DEFAULT 1,
+    summarized_count INTEGER NOT NULL DEFAULT 1,
+    summary_version VARCHAR(255),
+    centroid BYTEA NOT NULL,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_summary_stories_updated_at ON summary.stories (updated_at);
+CREATE INDEX IF NOT EXISTS ix_summary_stories_category ON summary.stories (category);
+CREATE INDEX IF NOT EXISTS ix_summary_articles_story_id ON summary.articles (story_id);
+
+-- Create the feeds table in the summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS summary.feeds (
+    id SERIAL PRIMARY KEY,
+    url VARCHAR(2048) NOT NULL UNIQUE,
+    title VARCHAR(255),
+    etag VARCHAR(255),
+    last_modified VARCHAR(255),
+    last_guid VARCHAR(2048),
+    last_polled_at TIMESTAMPTZ
+);
+
+-- Create the resummarize_jobs table in the summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS summary.resummarize_jobs (
+    id SERIAL PRIMARY KEY,
+    target_version VARCHAR(255) NOT NULL,
+    status VARCHAR(32) NOT NULL,
+    last_article_id INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- Create the user_profiles table in the summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS summary.user_profiles (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL UNIQUE,
+    categories VARCHAR(255)[] NOT NULL DEFAULT '{}',
+    keywords VARCHAR(255)[] NOT NULL DEFAULT '{}',
+    created_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_summary_user_profiles_categories ON summary.user_profiles USING gin (categories);
+CREATE INDEX IF NOT EXISTS ix_summary_user_profiles_keywords ON summary.user_profiles USING gin (keywords);
+
+-- Create the user_feeds table in the summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS summary.user_feeds (
+    user_id INTEGER PRIMARY KEY REFERENCES summary.user_profiles (id) ON DELETE CASCADE,
+    article_ids INTEGER[] NOT NULL DEFAULT '{}',
+    scores DOUBLE PRECISION[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ
 );
 
 -- Connect to the test_summaries database
@@ -40,12 +127,99 @@ CREATE TABLE IF NOT EXISTS summary.articles (
 -- Create the test_summary schema if it does not exist
 CREATE SCHEMA IF NOT EXISTS test_summary;
 
+-- Orders article inserts, updates and deletes for delta sync
+CREATE SEQUENCE IF NOT EXISTS test_summary.test_article_change_seq;
+
 -- Create the test_articles table in the test_summary schema if it does not exist
+-- Partitioned by ingestion month; monthly partitions are created ahead of time
+-- and dropped after the retention period by backend/app/db/summarizer_partitions.py
 CREATE TABLE IF NOT EXISTS test_summary.test_articles (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     title VARCHAR(255),
     url VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     summary TEXT NOT NULL,
-    category VARCHAR(255) NOT NULL
-);
\ No newline at end of file
+    category VARCHAR(255) NOT NULL,
+    summary_version VARCHAR(255),
+    embedding BYTEA,
+    embedding_version VARCHAR(255),
+    story_id INTEGER,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ DEFAULT now(),
+    change_seq BIGINT NOT NULL DEFAULT nextval('test_summary.test_article_change_seq'),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+-- Catches rows of months whose partition is not created yet
+CREATE TABLE IF NOT EXISTS test_summary.test_articles_default PARTITION OF test_summary.test_articles DEFAULT;
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_articles_category_created_at ON test_summary.test_articles (category, created_at);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_articles_change_seq ON test_summary.test_articles (change_seq);
+
+-- Deleted articles, kept so delta sync can report deletions
+CREATE TABLE IF NOT EXISTS test_summary.test_article_tombstones (
+    article_id INTEGER PRIMARY KEY,
+    change_seq BIGINT NOT NULL DEFAULT nextval('test_summary.test_article_change_seq'),
+    deleted_at TIMESTAMPTZ DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_article_tombstones_change_seq ON test_summary.test_article_tombstones (change_seq);
+
+-- Create the test_stories table in the test_summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS test_summary.test_stories (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(255),
+    summary TEXT NOT NULL,
+    category VARCHAR(255) NOT NULL,
+    article_count INTEGER NOT NULL DEFAULT 1,
+    summarized_count INTEGER NOT NULL DEFAULT 1,
+    summary_version VARCHAR(255),
+    centroid BYTEA NOT NULL,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_stories_updated_at ON test_summary.test_stories (updated_at);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_stories_category ON test_summary.test_stories (category);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_articles_story_id ON test_summary.test_articles (story_id);
+
+-- Create the test_feeds table in the test_summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS test_summary.test_feeds (
+    id SERIAL PRIMARY KEY,
+    url VARCHAR(2048) NOT NULL UNIQUE,
+    title VARCHAR(255),
+    etag VARCHAR(255),
+    last_modified VARCHAR(255),
+    last_guid VARCHAR(2048),
+    last_polled_at TIMESTAMPTZ
+);
+
+-- Create the test_resummarize_jobs table in the test_summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS test_summary.test_resummarize_jobs (
+    id SERIAL PRIMARY KEY,
+    target_version VARCHAR(255) NOT NULL,
+    status VARCHAR(32) NOT NULL,
+    last_article_id INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- Create the test_user_profiles table in the test_summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS test_summary.test_user_profiles (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL UNIQUE,
+    categories VARCHAR(255)[] NOT NULL DEFAULT '{}',
+    keywords VARCHAR(255)[] NOT NULL DEFAULT '{}',
+    created_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_user_profiles_categories ON test_summary.test_user_profiles USING gin (categories);
+CREATE INDEX IF NOT EXISTS ix_test_summary_test_user_profiles_keywords ON test_summary.test_user_profiles USING gin (keywords);
+
+-- Create the test_user_feeds table in the test_summary schema if it does not exist
+CREATE TABLE IF NOT EXISTS test_summary.test_user_feeds (
+    user_id INTEGER PRIMARY KEY REFERENCES test_summary.test_user_profiles (id) ON DELETE CASCADE,
+    article_ids INTEGER[] NOT NULL DEFAULT '{}',
+    scores DOUBLE PRECISION[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ
+);